@@ -0,0 +1,137 @@
+import sys
+import time
+import random
+import asyncio
+import argparse
+import statistics
+
+import synapse.common as s_common
+
+import synapse.lib.cell as s_cell
+
+'''
+Benchmark cold cache permission checks for a user with many roles and auth gates.
+
+The rules are generated from a fixed seed so runs are comparable. The compiled
+rule tries are compared against a linear scan of the same rules which matches
+the permission check algorithm used prior to compiling the rules.
+'''
+
+parts = ('node', 'add', 'del', 'prop', 'set', 'tag', 'edge', 'layer', 'view', 'read', 'write',
+         'storm', 'lib', 'queue', 'cron', 'trigger', 'pkg', 'inet', 'file', 'ps', 'risk', 'ou')
+
+def _perm(rand):
+    return tuple(rand.choice(parts) for _ in range(rand.randint(1, 4)))
+
+def _rules(rand, count):
+    return [(rand.random() < 0.8, _perm(rand)) for _ in range(count)]
+
+def _linearMatch(rules, perm):
+    for allow, path in rules:
+        if perm[:len(path)] == path:
+            return allow
+
+def linearAllowed(user, perm, gateiden=None):
+
+    if user.info.get('locked'):
+        return False
+
+    if user.info.get('admin'):
+        return True
+
+    if gateiden is not None:
+        info = user.authgates.get(gateiden)
+        if info is not None:
+            if info.get('admin'):
+                return True
+            if (allow := _linearMatch(info.get('rules', ()), perm)) is not None:
+                return allow
+
+    if (allow := _linearMatch(user.info.get('rules', ()), perm)) is not None:
+        return allow
+
+    if gateiden is not None:
+        for role in user.getRoles():
+            info = role.authgates.get(gateiden)
+            if info is None:
+                continue
+            if (allow := _linearMatch(info.get('rules', ()), perm)) is not None:
+                return allow
+
+    for role in user.getRoles():
+        if (allow := _linearMatch(role.info.get('rules', ()), perm)) is not None:
+            return allow
+
+def timeit(func, rounds):
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        retn = func()
+        times.append(time.perf_counter() - start)
+    return retn, times
+
+async def main(argv):
+
+    pars = argparse.ArgumentParser(description='Benchmark cold cache permission checks.')
+    pars.add_argument('--gates', type=int, default=2000, help='The number of auth gates.')
+    pars.add_argument('--roles', type=int, default=25, help='The number of roles granted to the user.')
+    pars.add_argument('--rules', type=int, default=50, help='The number of rules per role.')
+    pars.add_argument('--gate-rules', type=int, default=5, help='The number of rules per role per auth gate.')
+    pars.add_argument('--checks', type=int, default=20000, help='The number of permission checks per round.')
+    pars.add_argument('--seed', type=int, default=0, help='The seed used to generate the rules.')
+    pars.add_argument('--rounds', type=int, default=3, help='The number of times to run each benchmark.')
+
+    opts = pars.parse_args(argv)
+
+    rand = random.Random(opts.seed)
+
+    with s_common.getTempDir() as dirn:
+
+        async with await s_cell.Cell.anit(dirn) as cell:
+
+            gates = [s_common.guid((opts.seed, 'gate', i)) for i in range(opts.gates)]
+            for gateiden in gates:
+                await cell.auth.addAuthGate(gateiden, 'layer')
+
+            user = await cell.auth.addUser('bench')
+            await user.setRules(_rules(rand, opts.rules))
+
+            for i in range(opts.roles):
+
+                role = await cell.auth.addRole(f'role{i}')
+                await role.setRules(_rules(rand, opts.rules))
+
+                for gateiden in rand.sample(gates, k=len(gates) // 4):
+                    await role.setRules(_rules(rand, opts.gate_rules), gateiden=gateiden)
+
+                await user.grant(role.iden)
+
+            checks = [(_perm(rand) + _perm(rand), rand.choice(gates)) for _ in range(opts.checks)]
+
+            print(f'{opts.gates} gates, {opts.roles} roles, {opts.rules} rules per role, {len(checks)} checks')
+
+            def compiled():
+                retn = []
+                for perm, gateiden in checks:
+                    user.clearAuthCache()
+                    retn.append(user.allowed(perm, gateiden=gateiden))
+                return retn
+
+            def linear():
+                return [linearAllowed(user, perm, gateiden=gateiden) for perm, gateiden in checks]
+
+            results = {}
+            for name, func in (('compiled', compiled), ('linear', linear)):
+                retn, times = timeit(func, opts.rounds)
+                results[name] = retn
+                rate = len(checks) / statistics.median(times)
+                print(f'{name:>10}: {statistics.median(times):.3f}s (min {min(times):.3f}s) {rate:.0f} checks/s')
+
+            if results['compiled'] != results['linear']:
+                print('ERROR: the compiled results do not match')
+                return 1
+
+    return 0
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(asyncio.run(main(sys.argv[1:])))
@@ -0,0 +1,155 @@
+import sys
+import time
+import random
+import string
+import argparse
+import statistics
+
+import synapse.lib.scrape as s_scrape
+
+'''
+Benchmark the scrape APIs against a generated corpus.
+
+The corpus is built from a fixed seed so runs are comparable. It mixes prose
+with the values recognized by the scrape rules (including defanged, unicode,
+and near miss variants) in roughly the density found in threat reports.
+'''
+
+words = (
+    'the', 'actor', 'deployed', 'a', 'loader', 'which', 'contacted', 'its', 'infrastructure', 'over',
+    'port', 'and', 'then', 'downloaded', 'second', 'stage', 'payload', 'from', 'server', 'observed',
+    'in', 'campaign', 'targeting', 'several', 'organizations', 'during', 'Q3.', 'Analysts', 'noted',
+    'that', 'the', 'malware', 'used', 'an', 'encrypted', 'configuration', 'e.g.', 'i.e.', 'etc.',
+    'see', 'Figure', '3:', 'note:', 'version', '2.3.1', 'was', 'released', '-', '(see', 'below)',
+    'report', 'indicators', 'listed', 'at', 'end', 'of', 'this', 'document.', 'AAAA', 'Mr.', 'U.S.',
+)
+
+tlds = ('com', 'net', 'org', 'io', 'ru', 'cn', 'info', 'biz', 'co.uk', 'onion', 'xyz', 'top')
+
+def _randstr(rand, chars, size):
+    return ''.join(rand.choice(chars) for _ in range(size))
+
+def _fqdn(rand):
+    labels = [_randstr(rand, string.ascii_lowercase + string.digits, rand.randint(3, 12)) for _ in range(rand.randint(1, 3))]
+    return '.'.join(labels) + '.' + rand.choice(tlds)
+
+def _ipv4(rand):
+    return '.'.join(str(rand.randint(0, 255)) for _ in range(4))
+
+def _ipv6(rand):
+    return ':'.join('%x' % rand.randint(0, 0xffff) for _ in range(8))
+
+def _indicator(rand):
+
+    kind = rand.randint(0, 21)
+
+    if kind == 0:
+        return _fqdn(rand)
+    if kind == 1:
+        return _fqdn(rand).replace('.', '[.]')
+    if kind == 2:
+        return f'https://{_fqdn(rand)}/{_randstr(rand, string.ascii_lowercase, 8)}.php?id={rand.randint(0, 9999)}'
+    if kind == 3:
+        return f'hxxp://{_fqdn(rand)}/gate'
+    if kind == 4:
+        return _ipv4(rand)
+    if kind == 5:
+        return f'{_ipv4(rand)}:{rand.randint(1, 65535)}'
+    if kind == 6:
+        return _ipv6(rand)
+    if kind == 7:
+        return f'[{_ipv6(rand)}]:{rand.randint(1, 65535)}'
+    if kind == 8:
+        return _randstr(rand, string.hexdigits, 32)
+    if kind == 9:
+        return _randstr(rand, string.hexdigits, 40)
+    if kind == 10:
+        return _randstr(rand, string.hexdigits, 64)
+    if kind == 11:
+        return f'{_randstr(rand, string.ascii_lowercase, 6)}@{_fqdn(rand)}'
+    if kind == 12:
+        return f'CVE-{rand.randint(1999, 2024)}-{rand.randint(1, 99999):04d}'
+    if kind == 13:
+        return f'CWE-{rand.randint(1, 1500)}'
+    if kind == 14:
+        return 'cpe:2.3:a:vendor:product:%d.%d:*:*:*:*:*:*:*' % (rand.randint(0, 9), rand.randint(0, 9))
+    if kind == 15:
+        return f'/usr/lib/{_randstr(rand, string.ascii_lowercase, 6)}.so'
+    if kind == 16:
+        return f'C:\\Windows\\Temp\\{_randstr(rand, string.ascii_lowercase, 6)}.exe'
+    if kind == 17:
+        return f'\\\\{_fqdn(rand)}\\share\\{_randstr(rand, string.ascii_lowercase, 5)}'
+    if kind == 18:
+        return '0x' + _randstr(rand, '0123456789abcdef', 40)
+    if kind == 19:
+        return '1' + _randstr(rand, '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz', 33)
+    if kind == 20:
+        return f'{_randstr(rand, string.ascii_lowercase, 5)}。{rand.choice(tlds)}'
+    return _randstr(rand, string.ascii_letters + string.digits, rand.randint(20, 50))
+
+def genCorpus(size, seed=0, density=0.05):
+    '''
+    Generate a corpus of approximately size characters.
+    '''
+    rand = random.Random(seed)
+
+    toks = []
+    clen = 0
+    while clen < size:
+
+        if rand.random() < density:
+            tok = _indicator(rand)
+        else:
+            tok = rand.choice(words)
+
+        if rand.random() < 0.05:
+            tok += '\n'
+        elif rand.random() < 0.02:
+            tok = f'"{tok}",'
+
+        toks.append(tok)
+        clen += len(tok) + 1
+
+    return ' '.join(toks)
+
+def timeit(func, rounds):
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        retn = func()
+        times.append(time.perf_counter() - start)
+    return retn, times
+
+def main(argv):
+
+    pars = argparse.ArgumentParser(description='Benchmark the scrape APIs against a generated corpus.')
+    pars.add_argument('--size', type=int, default=2_000_000, help='The approximate size of the corpus in characters.')
+    pars.add_argument('--seed', type=int, default=0, help='The seed used to generate the corpus.')
+    pars.add_argument('--density', type=float, default=0.05, help='The fraction of tokens which are indicators.')
+    pars.add_argument('--rounds', type=int, default=3, help='The number of times to run each benchmark.')
+
+    opts = pars.parse_args(argv)
+
+    text = genCorpus(opts.size, seed=opts.seed, density=opts.density)
+    print(f'Corpus size: {len(text)} characters')
+
+    def prefilter():
+        return list(s_scrape.contextScrape(text))
+
+    def noprefilter():
+        return list(s_scrape._contextScrape(text, prefilter=False))
+
+    results = {}
+    for name, func in (('prefilter', prefilter), ('no prefilter', noprefilter)):
+        retn, times = timeit(func, opts.rounds)
+        results[name] = retn
+        print(f'{name:>16}: {statistics.median(times):.3f}s (min {min(times):.3f}s) {len(retn)} matches')
+
+    if results['prefilter'] != results['no prefilter']:
+        print('ERROR: the prefiltered results do not match')
+        return 1
+
+    return 0
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main(sys.argv[1:]))
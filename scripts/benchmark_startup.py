@@ -0,0 +1,84 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+'''
+Benchmark the startup time of the Cortex server and the Synapse CLI tools.
+
+Each measurement runs in a fresh python interpreter so the module import
+costs are included. The Storm parser cache may be disabled to compare
+against building the parser at import time.
+'''
+
+imports = (
+    'synapse.lib.parser',
+    'synapse.cortex',
+    'synapse.servers.cortex',
+    'synapse.tools.storm',
+    'synapse.tools.cmdr',
+)
+
+bootcode = '''
+import sys
+import asyncio
+import synapse.cortex as s_cortex
+
+async def main(dirn):
+    async with await s_cortex.Cortex.anit(dirn, conf={'health:sysctl:checks': False}) as core:
+        await core.nodes('[ inet:fqdn=vertex.link ]')
+
+asyncio.run(main(sys.argv[1]))
+'''
+
+def timeit(argv, rounds, env):
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        subprocess.run(argv, env=env, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return times
+
+def report(name, times):
+    print(f'{name:>30}: {statistics.median(times):.3f}s (min {min(times):.3f}s)')
+
+def main(argv):
+
+    pars = argparse.ArgumentParser(description='Benchmark the startup time of Synapse services and tools.')
+    pars.add_argument('--rounds', type=int, default=5, help='The number of times to run each benchmark.')
+    pars.add_argument('--no-parser-cache', default=False, action='store_true',
+                      help='Disable the Storm parser cache.')
+    pars.add_argument('--no-boot', default=False, action='store_true',
+                      help='Skip booting a Cortex.')
+
+    opts = pars.parse_args(argv)
+
+    env = dict(os.environ)
+    if opts.no_parser_cache:
+        env['SYN_PARSER_CACHE'] = '0'
+
+    # populate the parser cache before measuring
+    subprocess.run((sys.executable, '-c', 'import synapse.lib.parser'), env=env, check=True)
+
+    report('python', timeit((sys.executable, '-c', 'pass'), opts.rounds, env))
+
+    for name in imports:
+        report(f'import {name}', timeit((sys.executable, '-c', f'import {name}'), opts.rounds, env))
+
+    for name in ('synapse.servers.cortex', 'synapse.tools.storm'):
+        report(f'{name} --help', timeit((sys.executable, '-m', name, '--help'), opts.rounds, env))
+
+    if opts.no_boot:
+        return 0
+
+    with tempfile.TemporaryDirectory() as dirn:
+        report('cortex boot (inaugural)', timeit((sys.executable, '-c', bootcode, dirn), 1, env))
+        report('cortex boot', timeit((sys.executable, '-c', bootcode, dirn), opts.rounds, env))
+
+    return 0
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main(sys.argv[1:]))
@@ -1,4 +1,7 @@
+import re
 import csv
+import lzma
+import zlib
 import struct
 import asyncio
 import hashlib
@@ -34,6 +37,18 @@ CHUNK_SIZE = 16 * s_const.mebibyte
 MAX_SPOOL_SIZE = CHUNK_SIZE * 32  # 512 mebibytes
 MAX_HTTP_UPLOAD_SIZE = 4 * s_const.tebibyte
 
+# content defined chunking parameters ( average chunk size is ~CDC_MIN_SIZE + 256 KiB )
+CDC_MIN_SIZE = 64 * s_const.kibibyte
+CDC_MAX_SIZE = s_const.mebibyte
+CDC_WINDOW = 8
+CDC_TABLES = tuple(hashlib.shake_256(b'synapse:axon:cdc:%d' % i).digest(256) for i in range(CDC_WINDOW))
+# a cut follows three adjacent windows whose hashes have 18 leading zero bits in total
+CDC_MARK = re.compile(b'\x00.{%d}\x00.{%d}[\x00-\x3f]' % (CDC_WINDOW - 1, CDC_WINDOW - 1), re.DOTALL)
+CDC_MARK_SIZE = 3 * CDC_WINDOW
+
+# compressed blocks larger than this are decompressed in the executor
+BLOB_DECODE_EXECUTOR_SIZE = 64 * s_const.kibibyte
+
 class AxonHandlerMixin:
     def getAxon(self):
         '''
@@ -786,6 +801,12 @@ class Axon(s_cell.Cell):
     cellapi = AxonApi
     byterange = False
 
+    # name: (compress, decompress) functions which may be used for blob storage
+    blobcodecs = {
+        'zlib': (zlib.compress, zlib.decompress),
+        'lzma': (lzma.compress, lzma.decompress),
+    }
+
     confdefs = {
         'max:bytes': {
             'description': 'The maximum number of bytes that can be stored in the Axon.',
@@ -807,6 +828,15 @@ class Axon(s_cell.Cell):
             'description': 'An optional directory of CAs which are added to the TLS CA chain for wget and wput APIs.',
             'type': 'string',
         },
+        'blob:cdc': {
+            'default': False,
+            'description': 'Store new files as content defined chunks so that chunks shared between files are only stored once.',
+            'type': 'boolean',
+        },
+        'blob:codec': {
+            'description': 'An optional compression codec (zlib or lzma) which is applied to each newly stored block of file bytes.',
+            'type': 'string',
+        },
     }
 
     async def initServiceStorage(self):  # type: ignore
@@ -826,6 +856,7 @@ class Axon(s_cell.Cell):
         if self.inaugural:
             self.axonmetrics.set('size:bytes', 0)
             self.axonmetrics.set('file:count', 0)
+            self.axonmetrics.set('size:stored', 0)
 
         await self._bumpCellVers('axon:metrics', (
             (1, self._migrateAxonMetrics),
@@ -834,6 +865,11 @@ class Axon(s_cell.Cell):
         self.maxbytes = self.conf.get('max:bytes')
         self.maxcount = self.conf.get('max:count')
 
+        self.blobcodec = self.conf.get('blob:codec')
+        if self.blobcodec is not None and self.blobcodec not in self.blobcodecs:
+            mesg = f'Invalid blob:codec value: {self.blobcodec}. Must be one of: {", ".join(self.blobcodecs)}'
+            raise s_exc.BadConfValu(mesg=mesg)
+
         # modularize blob storage
         await self._initBlobStor()
 
@@ -914,15 +950,28 @@ class Axon(s_cell.Cell):
         self.blobs = self.blobslab.initdb('blobs')
         self.offsets = self.blobslab.initdb('offsets')
         self.metadata = self.blobslab.initdb('metadata')
+
+        # content defined chunk storage
+        self.chunks = self.blobslab.initdb('chunks')
+        self.chunkrefs = self.blobslab.initdb('chunkrefs')
+        self.blobchunks = self.blobslab.initdb('blobchunks')
+
+        # compression codec names for blob blocks and chunks
+        self.blobcodecdb = self.blobslab.initdb('blobcodecs')
+        self.chunkcodecdb = self.blobslab.initdb('chunkcodecs')
+
         self.onfini(self.blobslab.fini)
 
         if self.inaugural:
-            self._setStorVers(1)
+            self._setStorVers(2)
 
         storvers = self._getStorVers()
         if storvers < 1:
             storvers = await self._setStorVers01()
 
+        if storvers < 2:
+            storvers = await self._setStorVers02()
+
     async def _setStorVers01(self):
 
         logger.warning('Updating Axon storage version (adding offset index). This may take a while.')
@@ -947,6 +996,11 @@ class Axon(s_cell.Cell):
 
         return self._setStorVers(1)
 
+    async def _setStorVers02(self):
+        # all previously stored bytes were saved uncompressed
+        self.axonmetrics.set('size:stored', self.axonmetrics.get('size:bytes'))
+        return self._setStorVers(2)
+
     def _getStorVers(self):
         byts = self.blobslab.get(b'version', db=self.metadata)
         if not byts:
@@ -1096,9 +1150,60 @@ class Axon(s_cell.Cell):
 
     async def _get(self, sha256):
 
-        for _, byts in self.blobslab.scanByPref(sha256, db=self.blobs):
+        async for _, byts in self._iterBlobByts(sha256, b''):
             yield byts
 
+    async def _iterBlobByts(self, sha256, indxbyts):
+        '''
+        Yield (indxkey, byts) tuples for the stored blocks of a file starting at the given index.
+        '''
+        if self.blobslab.prefexists(sha256, db=self.blobchunks):
+            for bkey, chunksha in self.blobslab.scanByPref(sha256, startkey=indxbyts, db=self.blobchunks):
+                byts = self.blobslab.get(chunksha, db=self.chunks)
+                yield bkey, await self._decBlobByts(self.blobslab.get(chunksha, db=self.chunkcodecdb), byts)
+            return
+
+        for bkey, byts in self.blobslab.scanByPref(sha256, startkey=indxbyts, db=self.blobs):
+            yield bkey, await self._decBlobByts(self.blobslab.get(bkey, db=self.blobcodecdb), byts)
+
+    async def _encBlobByts(self, byts):
+        '''
+        Compress bytes using the configured codec.
+
+        Returns:
+            (bytes, str): The bytes to store and the name of the codec or None.
+        '''
+        if self.blobcodec is None:
+            return byts, None
+
+        encfunc = self.blobcodecs[self.blobcodec][0]
+        encbyts = await s_coro.executor(encfunc, byts)
+
+        # incompressible bytes are stored as is
+        if len(encbyts) >= len(byts):
+            return byts, None
+
+        return encbyts, self.blobcodec
+
+    async def _decBlobByts(self, codec, byts):
+        '''
+        Decompress stored bytes using the codec they were stored with.
+        '''
+        if codec is None:
+            return byts
+
+        name = codec.decode()
+        codecfuncs = self.blobcodecs.get(name)
+        if codecfuncs is None:  # pragma: no cover
+            mesg = f'Axon blob storage uses an unknown codec: {name}'
+            raise s_exc.FeatureNotSupported(mesg=mesg)
+
+        # small blocks are not worth the executor overhead
+        if len(byts) <= BLOB_DECODE_EXECUTOR_SIZE:
+            return codecfuncs[1](byts)
+
+        return await s_coro.executor(codecfuncs[1], byts)
+
     async def put(self, byts):
         '''
         Store bytes in the Axon.
@@ -1277,12 +1382,20 @@ class Axon(s_cell.Cell):
 
     async def _saveFileGenr(self, sha256, genr, size):
 
+        if self.conf.get('blob:cdc'):
+            return await self._saveFileChunks(sha256, genr)
+
         size = 0
 
         for i, byts in enumerate(genr):
 
             size += len(byts)
-            await self._axonBytsSave(sha256, i, size, byts)
+
+            byts, codec = await self._encBlobByts(byts)
+            if codec is None:
+                await self._axonBytsSave(sha256, i, size, byts)
+            else:
+                await self._axonBytsSave(sha256, i, size, byts, codec=codec)
 
             await asyncio.sleep(0)
 
@@ -1290,15 +1403,122 @@ class Axon(s_cell.Cell):
 
     # a nexusified way to save local bytes
     @s_nexus.Pusher.onPushAuto('axon:bytes:add')
-    async def _axonBytsSave(self, sha256, indx, offs, byts):
+    async def _axonBytsSave(self, sha256, indx, offs, byts, codec=None):
+        ikey = indx.to_bytes(8, 'big')
+        okey = offs.to_bytes(8, 'big')
+
+        if codec is not None:
+            self.blobslab.put(sha256 + ikey, codec.encode(), db=self.blobcodecdb)
+
+        prev = self.blobslab.replace(sha256 + ikey, byts, db=self.blobs)
+        if prev is not None:
+            self.axonmetrics.inc('size:stored', valu=-len(prev))
+
+        self.axonmetrics.inc('size:stored', valu=len(byts))
+        self.blobslab.put(sha256 + okey, ikey, db=self.offsets)
+
+    async def _saveFileChunks(self, sha256, genr):
+
+        size = 0
+        indx = 0
+
+        todo = []
+        todosize = 0
+
+        carry = b''
+
+        async def save(byts, final=False):
+
+            nonlocal size, indx
+
+            offs = 0
+            for cut in await s_coro.semafork(_getCdcCuts, byts):
+                size += cut - offs
+                await self._saveFileChunk(sha256, indx, size, byts[offs:cut])
+                indx += 1
+                offs = cut
+
+            if final and offs < len(byts):
+                size += len(byts) - offs
+                await self._saveFileChunk(sha256, indx, size, byts[offs:])
+                return b''
+
+            return byts[offs:]
+
+        for byts in genr:
+
+            todo.append(byts)
+            todosize += len(byts)
+
+            # hash at least CDC_MAX_SIZE new bytes at once so small blocks do not
+            # repeatedly hash the bytes carried over from the previous block
+            if todosize < CDC_MAX_SIZE:
+                continue
+
+            todo.insert(0, carry)
+            carry = await save(b''.join(todo))
+
+            todo.clear()
+            todosize = 0
+
+            await asyncio.sleep(0)
+
+        todo.insert(0, carry)
+        await save(b''.join(todo), final=True)
+
+        return size
+
+    async def _saveFileChunk(self, sha256, indx, offs, byts):
+
+        chunksha = hashlib.sha256(byts).digest()
+
+        codec = None
+        if not self.blobslab.has(chunksha, db=self.chunks):
+            byts, codec = await self._encBlobByts(byts)
+
+        await self._axonChunkSave(sha256, indx, offs, chunksha, byts, codec=codec)
+
+    @s_nexus.Pusher.onPushAuto('axon:chunk:add')
+    async def _axonChunkSave(self, sha256, indx, offs, chunksha, byts, codec=None):
         ikey = indx.to_bytes(8, 'big')
         okey = offs.to_bytes(8, 'big')
 
-        self.blobslab.put(sha256 + ikey, byts, db=self.blobs)
+        # the bytes are always sent so that mirrors may store chunks they lack
+        if not self.blobslab.has(chunksha, db=self.chunks):
+
+            if codec is not None:
+                self.blobslab.put(chunksha, codec.encode(), db=self.chunkcodecdb)
+
+            self.blobslab.put(chunksha, byts, db=self.chunks)
+            self.axonmetrics.inc('size:stored', valu=len(byts))
+
+        # do not count a reference twice if the edit is replayed
+        if self.blobslab.replace(sha256 + ikey, chunksha, db=self.blobchunks) is None:
+            self._incChunkRefs(chunksha, 1)
+
         self.blobslab.put(sha256 + okey, ikey, db=self.offsets)
 
+    def _incChunkRefs(self, chunksha, valu):
+
+        refs = valu
+        byts = self.blobslab.get(chunksha, db=self.chunkrefs)
+        if byts is not None:
+            refs += int.from_bytes(byts, 'big')
+
+        if refs > 0:
+            self.blobslab.put(chunksha, refs.to_bytes(8, 'big'), db=self.chunkrefs)
+            return
+
+        self.blobslab.delete(chunksha, db=self.chunkrefs)
+        self.blobslab.delete(chunksha, db=self.chunkcodecdb)
+
+        byts = self.blobslab.pop(chunksha, db=self.chunks)
+        if byts is not None:
+            self.axonmetrics.inc('size:stored', valu=-len(byts))
+
     def _offsToIndx(self, sha256, offs):
-        lkey = sha256 + offs.to_bytes(8, 'big')
+        # find the first block which ends *after* the requested offset
+        lkey = sha256 + (offs + 1).to_bytes(8, 'big')
         for offskey, indxbyts in self.blobslab.scanByRange(lkey, db=self.offsets):
             return int.from_bytes(offskey[32:], 'big'), indxbyts
 
@@ -1308,13 +1528,10 @@ class Axon(s_cell.Cell):
 
         boff, indxbyts = self._offsToIndx(sha256, offs)
 
-        for bkey, byts in self.blobslab.scanByRange(sha256 + indxbyts, db=self.blobs):
+        async for bkey, byts in self._iterBlobByts(sha256, indxbyts):
 
             await asyncio.sleep(0)
 
-            if bkey[:32] != sha256:
-                return
-
             if first:
                 first = False
                 delt = boff - offs
@@ -1389,14 +1606,32 @@ class Axon(s_cell.Cell):
 
     async def _delBlobByts(self, sha256):
 
+        if self.blobslab.prefexists(sha256, db=self.blobchunks):
+
+            for lkey in self.blobslab.scanKeysByPref(sha256, db=self.offsets):
+                self.blobslab.delete(lkey, db=self.offsets)
+                await asyncio.sleep(0)
+
+            for lkey, chunksha in self.blobslab.scanByPref(sha256, db=self.blobchunks):
+                self.blobslab.delete(lkey, db=self.blobchunks)
+                self._incChunkRefs(chunksha, -1)
+                await asyncio.sleep(0)
+
+            return
+
         # remove the offset indexes...
         for lkey in self.blobslab.scanKeysByPref(sha256, db=self.blobs):
             self.blobslab.delete(lkey, db=self.offsets)
             await asyncio.sleep(0)
 
         # remove the actual blobs...
-        for lkey in self.blobslab.scanKeysByPref(sha256, db=self.blobs):
+        for lkey, byts in self.blobslab.scanByPref(sha256, db=self.blobs):
             self.blobslab.delete(lkey, db=self.blobs)
+            self.axonmetrics.inc('size:stored', valu=-len(byts))
+            await asyncio.sleep(0)
+
+        for lkey in self.blobslab.scanKeysByPref(sha256, db=self.blobcodecdb):
+            self.blobslab.delete(lkey, db=self.blobcodecdb)
             await asyncio.sleep(0)
 
     async def wants(self, sha256s):
@@ -1866,6 +2101,54 @@ class Axon(s_cell.Cell):
                     'err': err,
                 }
 
+def _getCdcHashes(byts):
+    '''
+    Return a tabulation hash byte for the window of CDC_WINDOW bytes at each offset in byts.
+    '''
+    # the big integer operations hash every window at once rather than one byte at a time
+    hval = 0
+    for i, tabl in enumerate(CDC_TABLES):
+        hval ^= int.from_bytes(byts[i:].translate(tabl), 'little')
+
+    return hval.to_bytes(len(byts), 'little')
+
+def _getCdcCuts(byts):
+    '''
+    Return the end offsets of the complete content defined chunks in byts.
+
+    The bytes after the last offset are the start of a chunk which may be
+    continued by subsequent bytes.
+    '''
+    cuts = []
+    size = len(byts)
+
+    if size <= CDC_MIN_SIZE:
+        return cuts
+
+    hashes = _getCdcHashes(byts)
+
+    offs = 0
+    while size - offs > CDC_MIN_SIZE:
+
+        maxoffs = offs + CDC_MAX_SIZE
+        if maxoffs > size:
+            maxoffs = size
+
+        # only match windows which end within the chunk size bounds
+        mark = CDC_MARK.search(hashes, offs + CDC_MIN_SIZE - CDC_MARK_SIZE, maxoffs - CDC_WINDOW + 1)
+        if mark is not None:
+            cut = mark.start() + CDC_MARK_SIZE
+
+        else:
+            if maxoffs - offs < CDC_MAX_SIZE:
+                break
+            cut = maxoffs
+
+        cuts.append(cut)
+        offs = cut
+
+    return cuts
+
 def _spawn_readlines(sock, errors='ignore'): # pragma: no cover
     try:
         with sock.makefile('r', errors=errors) as fd:
@@ -1,6 +1,7 @@
 import os
 import copy
 import regex
+import hashlib
 import asyncio
 import logging
 import textwrap
@@ -118,6 +119,12 @@ SYNC_LAYR_DEL = 4   # A layer was deleted
 
 MAX_NEXUS_DELTA = 3_600
 
+# the number of seconds between polling the nexus lag of each storm pool member
+STORM_POOL_LAG_PERIOD = 10
+
+# the number of merged buids to fill in from each layer at a time
+MERGE_SODE_WINDOW = 100
+
 reqValidTagModel = s_config.getJsValidator({
     'type': 'object',
     'properties': {
@@ -565,6 +572,10 @@ class CoreApi(s_cell.CellApi):
     async def getStormDmon(self, iden):
         return await self.cell.getStormDmon(iden)
 
+    @s_cell.adminapi()
+    async def getStormPoolStats(self):
+        return self.cell.getStormPoolStats()
+
     @s_cell.adminapi()
     async def bumpStormDmon(self, iden):
         return await self.cell.bumpStormDmon(iden)
@@ -841,6 +852,21 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
             'description': 'Enable Storm scrape interfaces when using $lib.scrape APIs.',
             'type': 'boolean',
         },
+        'storm:query:cache:size': {
+            'default': 10000,
+            'description': 'The maximum number of parsed Storm queries to keep in the persistent query cache. '
+                           'Set to 0 to disable the persistent query cache.',
+            'type': 'integer',
+            'minimum': 0,
+            'hidecmdl': True,
+        },
+        'storm:spawn:procs': {
+            'default': 0,
+            'description': 'The number of worker processes used to execute read-only Storm queries. '
+                           'Queries run with the readonly option are offloaded to a worker when set.',
+            'type': 'integer',
+            'minimum': 0,
+        },
         'http:proxy': {
             'description': 'An aiohttp-socks compatible proxy URL to use storm HTTP API.',
             'type': 'string',
@@ -874,74 +900,19 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
 
         self.viewmeta = self.slab.initdb('view:meta')
 
-        self.views = {}
-        self.layers = {}
-        self.viewsbylayer = collections.defaultdict(list)
-
-        self.modules = {}
-        self.feedfuncs = {}
-        self.stormcmds = {}
-
-        self.maxnodes = self.conf.get('max:nodes')
-        self.nodecount = 0
-
-        self.migration = False
-        self._migration_lock = asyncio.Lock()
-
-        self.stormmods = {}     # name: mdef
-        self.stormpkgs = {}     # name: pkgdef
-        self.stormvars = None   # type: s_lmdbslab.SafeKeyVal
-
-        self.svcsbyiden = {}
-        self.svcsbyname = {}
-        self.svcsbysvcname = {}  # remote name, not local name
-
-        self._propSetHooks = {}
-        self._runtLiftFuncs = {}
-        self._runtPropSetFuncs = {}
-        self._runtPropDelFuncs = {}
-
-        self.tagvalid = s_cache.FixedCache(self._isTagValid, size=1000)
-        self.tagprune = s_cache.FixedCache(self._getTagPrune, size=1000)
-
-        self.querycache = s_cache.FixedCache(self._getStormQuery, size=10000)
-
-        self.stormpool = None
-        self.stormpoolurl = None
-        self.stormpoolopts = None
-
-        self.libroot = (None, {}, {})
-        self.stormlibs = []
-
-        self.bldgbuids = {}  # buid -> (Node, Event)  Nodes under construction
-
-        self.axon = None  # type: s_axon.AxonApi
-        self.axready = asyncio.Event()
-        self.axoninfo = {}
-
-        self.view = None  # The default/main view
-
-        self._cortex_permdefs = []
-        self._initCorePerms()
-
-        # Reset the storm:log:level from the config value to an int for internal use.
-        self.conf['storm:log:level'] = s_common.normLogLevel(self.conf.get('storm:log:level'))
-        self.stormlog = self.conf.get('storm:log')
-        self.stormloglvl = self.conf.get('storm:log:level')
+        self._initCoreAttrs()
 
         # generic fini handler for the Cortex
         self.onfini(self._onCoreFini)
 
         self.cortexdata = self.slab.getSafeKeyVal('cortex')
 
+        await self._initStormQueryCache()
+
         await self._initCoreInfo()
         self._initStormLibs()
         self._initFeedFuncs()
 
-        self.modsbyiface = {}
-        self.stormiface_search = self.conf.get('storm:interface:search')
-        self.stormiface_scrape = self.conf.get('storm:interface:scrape')
-
         self._initCortexHttpApi()
         self._exthttpapis = {}  # iden -> adef; relies on cpython ordered dictionary behavior.
         self._exthttpapiorder = b'exthttpapiorder'
@@ -1026,6 +997,74 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
 
         self._initVaults()
 
+    def _initCoreAttrs(self):
+        '''
+        Initialize the in-memory Cortex attributes which are also used by spawned Cortex processes.
+        '''
+        self.views = {}
+        self.layers = {}
+        self.viewsbylayer = collections.defaultdict(list)
+
+        self.modules = {}
+        self.feedfuncs = {}
+        self.stormcmds = {}
+
+        self.maxnodes = self.conf.get('max:nodes')
+        self.nodecount = 0
+
+        self.migration = False
+        self._migration_lock = asyncio.Lock()
+
+        self.stormmods = {}     # name: mdef
+        self.stormpkgs = {}     # name: pkgdef
+        self.stormvars = None   # type: s_lmdbslab.SafeKeyVal
+
+        self.svcsbyiden = {}
+        self.svcsbyname = {}
+        self.svcsbysvcname = {}  # remote name, not local name
+
+        self._propSetHooks = {}
+        self._runtLiftFuncs = {}
+        self._runtPropSetFuncs = {}
+        self._runtPropDelFuncs = {}
+
+        self.tagvalid = s_cache.FixedCache(self._isTagValid, size=1000)
+        self.tagprune = s_cache.FixedCache(self._getTagPrune, size=1000)
+
+        self.querycache = s_cache.FixedCache(self._getStormQuery, size=10000)
+
+        self.stormpool = None
+        self.stormpoolurl = None
+        self.stormpoolopts = None
+        self.stormpoollocal = 0  # queries run locally because no pool member was usable
+
+        self.spawnpool = None
+
+        self.libroot = (None, {}, {})
+        self.stormlibs = []
+
+        self.bldgbuids = {}  # buid -> (Node, Event)  Nodes under construction
+
+        self.axon = None  # type: s_axon.AxonApi
+        self.axready = asyncio.Event()
+        self.axoninfo = {}
+
+        self.view = None  # The default/main view
+
+        self._cortex_permdefs = []
+        self._initCorePerms()
+
+        # Reset the storm:log:level from the config value to an int for internal use.
+        self.conf['storm:log:level'] = s_common.normLogLevel(self.conf.get('storm:log:level'))
+        self.stormlog = self.conf.get('storm:log')
+        self.stormloglvl = self.conf.get('storm:log:level')
+
+        self.modsbyiface = {}
+        self.stormiface_search = self.conf.get('storm:interface:search')
+        self.stormiface_scrape = self.conf.get('storm:interface:scrape')
+
+        self.queryslab = None
+
     async def _storCortexHiveMigration(self):
 
         logger.warning('migrating Cortex data out of hive')
@@ -1549,6 +1588,15 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         await self._initStormDmons()
         await self._initStormSvcs()
 
+        self.schedCoro(self._warmStormQueryCache())
+
+        procs = self.conf.get('storm:spawn:procs')
+        if procs > 0:
+            # avoid import cycle
+            import synapse.lib.spawn as s_spawn
+            self.spawnpool = await s_spawn.SpawnPool.anit(self, procs)
+            self.onfini(self.spawnpool)
+
         # share ourself via the cell dmon as "cortex"
         # for potential default remote use
         self.dmon.share('cortex', self)
@@ -1606,6 +1654,8 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
                 logger.debug(f'Stormpool client connected to {_url}')
 
             self.stormpool = await s_telepath.open(url, onlink=onlink)
+            self.stormpool.setPoolPolicy(opts.get('balance', 'roundrobin'))
+            self.stormpool.schedCoro(self._runStormPoolLag(self.stormpool))
 
             # make this one a fini weakref vs the fini() handler
             self.onfini(self.stormpool)
@@ -1613,12 +1663,37 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         except Exception as e:  # pragma: no cover
             logger.exception(f'Error starting stormpool, it will not be available: {e}')
 
+    async def _runStormPoolLag(self, pool):
+        '''
+        Periodically record the nexus lag of every storm pool member for the balancing policy.
+        '''
+        while not await pool.waitfini(timeout=STORM_POOL_LAG_PERIOD):
+
+            curoffs = await self.getNexsIndx() - 1
+            timeout = self.stormpoolopts.get('timeout:connection')
+
+            for proxy in list(pool.proxies):
+
+                try:
+                    miroffs = await s_common.wait_for(proxy.getNexsIndx(), timeout) - 1
+                    pool.setPoolLag(proxy, curoffs - miroffs)
+
+                except Exception as e:
+                    proxyname = proxy._ahainfo.get('name')
+                    mesg = f'Unable to retrieve the Nexus offset for pool mirror [{proxyname}]: {e}'
+                    logger.warning(mesg, extra=await self.getLogExtra(mirror=proxyname))
+
     async def finiStormPool(self):
 
         if self.stormpool is not None:
             await self.stormpool.fini()
             self.stormpool = None
 
+    async def getCellInfo(self):
+        info = await s_cell.Cell.getCellInfo(self)
+        info['stormpool'] = self.getStormPoolStats()
+        return info
+
     async def getStormPool(self):
         byts = self.slab.get(b'storm:pool', db='cell:conf')
         if byts is None:
@@ -2196,6 +2271,85 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
 
         self.multiqueue = await slab.getMultiQueue('cortex:queue', nexsroot=self.nexsroot)
 
+    async def _initStormQueryCache(self):
+
+        path = os.path.join(self.dirn, 'slabs', 'querycache.lmdb')
+
+        self.queryslab = await s_lmdbslab.Slab.anit(path)
+        self.onfini(self.queryslab.fini)
+
+        self.querycachesize = self.conf.get('storm:query:cache:size')
+
+        self.querymeta = self.queryslab.getSafeKeyVal('meta')
+        if self.querymeta.get('astvers') != s_parser.astvers:
+            self.queryslab.dropdb('asts')
+            self.querymeta.set('astvers', s_parser.astvers)
+
+        self.queryasts = self.queryslab.initdb('asts')
+
+    def _getStormQueryKey(self, text, mode):
+        return hashlib.sha256(text.encode(errors='surrogatepass')).digest() + mode.encode()
+
+    async def _getStormQueryAst(self, text, mode):
+        '''
+        Return the packed AST for a query from the persistent cache or parse it.
+        '''
+        if self.queryslab is None or not self.querycachesize:
+            return await s_parser.querycache.aget((text, mode))
+
+        lkey = self._getStormQueryKey(text, mode)
+
+        byts = self.queryslab.get(lkey, db=self.queryasts)
+        if byts is not None:
+            return byts
+
+        byts = await s_parser.querycache.aget((text, mode))
+
+        if self.queryslab.stat(db=self.queryasts)['entries'] >= self.querycachesize:
+            logger.debug('Clearing the persistent storm query cache.')
+            self.queryslab.dropdb('asts')
+            self.queryasts = self.queryslab.initdb('asts')
+
+        self.queryslab.put(lkey, byts, db=self.queryasts)
+        return byts
+
+    async def _warmStormQueryCache(self):
+        '''
+        Parse the queries used by packages, commands, cron jobs, and triggers.
+        '''
+        texts = []
+
+        for pkgdef in list(self.stormpkgs.values()):
+
+            if (onload := pkgdef.get('onload')) is not None:
+                texts.append(onload)
+
+            texts.extend(mdef.get('storm') for mdef in pkgdef.get('modules', ()))
+            texts.extend(cdef.get('storm') for cdef in pkgdef.get('commands', ()))
+
+        texts.extend(cdef.get('storm') for cdef in list(self.cmddefs.values()))
+        texts.extend(appt.query for appt in list(self.agenda.appts.values()))
+
+        for view in list(self.views.values()):
+            texts.extend(trig.tdef.get('storm') for _, trig in view.triggers.list())
+
+        for text in texts:
+
+            if not isinstance(text, str):
+                continue
+
+            try:
+                await self.getStormQuery(text)
+
+            except asyncio.CancelledError:  # pragma: no cover
+                raise
+
+            except s_exc.FatalErr:  # pragma: no cover
+                raise
+
+            except Exception as e:
+                logger.warning(f'Failed to parse storm query during cache warmup: {e}')
+
     async def _initStormGraphs(self):
         path = os.path.join(self.dirn, 'slabs', 'graphs.lmdb')
 
@@ -2255,7 +2409,70 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         #       the cluster case to minimize round trips
         return [await layr.getStorNode(buid) for layr in layers]
 
-    async def _genSodeList(self, buid, sodes, layers, filtercmpr=None):
+    async def _genSodeLists(self, todo, layers, filtercmpr=None, lazy=False):
+        '''
+        Fill in the missing storage nodes for a window of (buid, sodes) tuples
+        using one batched fetch per layer and yield the sode lists.
+
+        The top layer may be edited while the sode lists are being consumed,
+        so its missing storage nodes are read as each sode list is yielded.
+
+        If lazy is True, only the storage nodes required by the filtercmpr are
+        fetched and the remaining missing storage nodes are returned as a shared
+        s_layer.LazySodes which reads them in batches when they are accessed.
+        '''
+        # the index of the lowest layer which must be fetched for each (buid, sodes) tuple
+        need = [0] * len(todo)
+        if lazy:
+            for indx, (_, sodes) in enumerate(todo):
+
+                # rows without the node value are joined immediately
+                if not any(sode.get('valu') is not None for sode in sodes.values()):
+                    continue
+
+                if filtercmpr is None:
+                    need[indx] = len(layers)
+                    continue
+
+                # only the layers above the top layer which produced a row are used by the filter
+                need[indx] = max(i for (i, layr) in enumerate(layers) if layr.iden in sodes) + 1
+
+        lazysodes = s_layer.LazySodes(layers)
+
+        top = layers[-1]
+        topindx = len(layers) - 1
+
+        fetched = {}
+        for indx, layr in enumerate(layers):
+            fetched[layr.iden] = {}
+
+            buids = []
+            for (buid, sodes), mini in zip(todo, need):
+                if layr.iden in sodes:
+                    continue
+
+                if indx >= mini:
+                    if indx < topindx:
+                        buids.append(buid)
+                    continue
+
+                lazysodes.add(layr.iden, buid)
+                fetched[layr.iden][buid] = lazysodes
+
+            if buids:
+                fetched[layr.iden].update(zip(buids, await layr.getStorNodesBatch(buids)))
+
+        topsodes = fetched[top.iden]
+        for buid, sodes in todo:
+
+            if top.iden not in sodes and buid not in topsodes:
+                topsodes[buid] = (await top.getStorNodesBatch((buid,)))[0]
+
+            sodelist = self._joinSodeList(buid, sodes, fetched, layers, filtercmpr)
+            if sodelist is not None:
+                yield sodelist
+
+    def _joinSodeList(self, buid, sodes, fetched, layers, filtercmpr=None):
         sodelist = []
 
         if filtercmpr is not None:
@@ -2263,7 +2480,7 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
             for layr in layers[-1::-1]:
                 sode = sodes.get(layr.iden)
                 if sode is None:
-                    sode = await layr.getStorNode(buid)
+                    sode = fetched[layr.iden][buid]
                     if filt and filtercmpr(sode):
                         return
                 else:
@@ -2275,30 +2492,44 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         for layr in layers:
             sode = sodes.get(layr.iden)
             if sode is None:
-                sode = await layr.getStorNode(buid)
+                sode = fetched[layr.iden][buid]
             sodelist.append((layr.iden, sode))
 
         return (buid, sodelist)
 
-    async def _mergeSodes(self, layers, genrs, cmprkey, filtercmpr=None, reverse=False):
+    async def _mergeSodes(self, layers, genrs, cmprkey, filtercmpr=None, reverse=False, lazy=False):
+        '''
+        Merge the lift generators for multiple layers and yield (buid, sodes) tuples.
+
+        If lazy is True, storage nodes which were not produced by a lift generator and
+        are not required to filter the results are yielded as None to be retrieved by
+        the Snap only if the node properties, tags, or data are accessed.
+        '''
         lastbuid = None
         sodes = {}
+        todo = []
         async for layr, (_, buid), sode in s_common.merggenr2(genrs, cmprkey, reverse=reverse):
             if not buid == lastbuid or layr in sodes:
                 if lastbuid is not None:
-                    sodelist = await self._genSodeList(lastbuid, sodes, layers, filtercmpr)
-                    if sodelist is not None:
-                        yield sodelist
-                    sodes.clear()
+                    todo.append((lastbuid, sodes))
+                    sodes = {}
+
+                    if len(todo) >= MERGE_SODE_WINDOW:
+                        async for sodelist in self._genSodeLists(todo, layers, filtercmpr, lazy=lazy):
+                            yield sodelist
+                        todo.clear()
+
                 lastbuid = buid
             sodes[layr] = sode
 
         if lastbuid is not None:
-            sodelist = await self._genSodeList(lastbuid, sodes, layers, filtercmpr)
-            if sodelist is not None:
+            todo.append((lastbuid, sodes))
+
+        if todo:
+            async for sodelist in self._genSodeLists(todo, layers, filtercmpr, lazy=lazy):
                 yield sodelist
 
-    async def _liftByDataName(self, name, layers):
+    async def _liftByDataName(self, name, layers, lazy=False):
         if len(layers) == 1:
             layr = layers[0].iden
             async for _, buid, sode in layers[0].liftByDataName(name):
@@ -2309,10 +2540,10 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         for layr in layers:
             genrs.append(wrap_liftgenr(layr.iden, layr.liftByDataName(name)))
 
-        async for sodes in self._mergeSodes(layers, genrs, cmprkey_buid):
+        async for sodes in self._mergeSodes(layers, genrs, cmprkey_buid, lazy=lazy):
             yield sodes
 
-    async def _liftByProp(self, form, prop, layers, reverse=False):
+    async def _liftByProp(self, form, prop, layers, reverse=False, lazy=False):
         if len(layers) == 1:
             layr = layers[0].iden
             async for _, buid, sode in layers[0].liftByProp(form, prop, reverse=reverse):
@@ -2329,10 +2560,83 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
 
             return props.get(prop) is not None
 
-        async for sodes in self._mergeSodes(layers, genrs, cmprkey_indx, filtercmpr, reverse=reverse):
+        async for sodes in self._mergeSodes(layers, genrs, cmprkey_indx, filtercmpr, reverse=reverse, lazy=lazy):
             yield sodes
 
-    async def _liftByPropValu(self, form, prop, cmprvals, layers, reverse=False):
+    async def _countByProp(self, form, prop, layers):
+        '''
+        Count the nodes with the given form/prop using only the buids in the property indexes.
+        '''
+        if len(layers) == 1:
+            if prop is None:
+                return layers[0].formcounts.get(form)
+            return await layers[0].getPropCount(form, prop)
+
+        genrs = [layr.iterPropBuids(form, prop) for layr in layers]
+
+        if prop is not None:
+            return await self._countNodeBuids(layers, [(buid async for _, buid in genr) for genr in genrs])
+
+        # primary property rows only exist for nodes and are the same in each layer
+        count = 0
+        lastitem = None
+        async for item in s_common.merggenr2(genrs):
+            if item != lastitem:
+                lastitem = item
+                count += 1
+
+        return count
+
+    async def _countByTag(self, tag, form, layers):
+        '''
+        Count the nodes with the given tag using only the buids in the tag indexes.
+        '''
+        if len(layers) == 1:
+            return await layers[0].getTagCount(tag, formname=form)
+
+        genrs = [layr.iterTagBuids(tag, formname=form) for layr in layers]
+
+        if form is None:
+            return await self._countNodeBuids(layers, genrs)
+
+        # the tag index for a single form is sorted by buid
+        count = 0
+        lastbuid = None
+        async for buid in s_common.merggenr2(genrs):
+            if buid != lastbuid:
+                lastbuid = buid
+                if self._hasNodeBuid(buid, layers):
+                    count += 1
+
+        return count
+
+    async def _countNodeBuids(self, layers, genrs):
+
+        count = 0
+
+        async with await s_spooled.Set.anit(dirn=self.dirn, cell=self) as seen:
+
+            for genr in genrs:
+                async for buid in genr:
+
+                    if buid in seen:
+                        continue
+
+                    await seen.add(buid)
+
+                    if self._hasNodeBuid(buid, layers):
+                        count += 1
+
+        return count
+
+    def _hasNodeBuid(self, buid, layers):
+        # skip storage nodes which only contain edits to a node deleted from a lower layer
+        for layr in layers:
+            if layr.hasNodeBuid(buid):
+                return True
+        return False
+
+    async def _liftByPropValu(self, form, prop, cmprvals, layers, reverse=False, lazy=False):
         if len(layers) == 1:
             layr = layers[0].iden
             async for _, buid, sode in layers[0].liftByPropValu(form, prop, cmprvals, reverse=reverse):
@@ -2350,10 +2654,10 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
             for layr in layers:
                 genrs.append(wrap_liftgenr(layr.iden, layr.liftByPropValu(form, prop, (cval,), reverse=reverse)))
 
-            async for sodes in self._mergeSodes(layers, genrs, cmprkey_indx, filtercmpr, reverse=reverse):
+            async for sodes in self._mergeSodes(layers, genrs, cmprkey_indx, filtercmpr, reverse=reverse, lazy=lazy):
                 yield sodes
 
-    async def _liftByPropArray(self, form, prop, cmprvals, layers, reverse=False):
+    async def _liftByPropArray(self, form, prop, cmprvals, layers, reverse=False, lazy=False):
         if len(layers) == 1:
             layr = layers[0].iden
             async for _, buid, sode in layers[0].liftByPropArray(form, prop, cmprvals, reverse=reverse):
@@ -2374,10 +2678,10 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
             for layr in layers:
                 genrs.append(wrap_liftgenr(layr.iden, layr.liftByPropArray(form, prop, (cval,), reverse=reverse)))
 
-            async for sodes in self._mergeSodes(layers, genrs, cmprkey_indx, filtercmpr, reverse=reverse):
+            async for sodes in self._mergeSodes(layers, genrs, cmprkey_indx, filtercmpr, reverse=reverse, lazy=lazy):
                 yield sodes
 
-    async def _liftByFormValu(self, form, cmprvals, layers, reverse=False):
+    async def _liftByFormValu(self, form, cmprvals, layers, reverse=False, lazy=False):
         if len(layers) == 1:
             layr = layers[0].iden
             async for _, buid, sode in layers[0].liftByFormValu(form, cmprvals, reverse=reverse):
@@ -2389,10 +2693,10 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
             for layr in layers:
                 genrs.append(wrap_liftgenr(layr.iden, layr.liftByFormValu(form, (cval,), reverse=reverse)))
 
-            async for sodes in self._mergeSodes(layers, genrs, cmprkey_indx, reverse=reverse):
+            async for sodes in self._mergeSodes(layers, genrs, cmprkey_indx, reverse=reverse, lazy=lazy):
                 yield sodes
 
-    async def _liftByTag(self, tag, form, layers, reverse=False):
+    async def _liftByTag(self, tag, form, layers, reverse=False, lazy=False):
         if len(layers) == 1:
             layr = layers[0].iden
             async for _, buid, sode in layers[0].liftByTag(tag, form, reverse=reverse):
@@ -2412,10 +2716,10 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         for layr in layers:
             genrs.append(wrap_liftgenr(layr.iden, layr.liftByTag(tag, form, reverse=reverse)))
 
-        async for sodes in self._mergeSodes(layers, genrs, cmprkey_buid, filtercmpr, reverse=reverse):
+        async for sodes in self._mergeSodes(layers, genrs, cmprkey_buid, filtercmpr, reverse=reverse, lazy=lazy):
             yield sodes
 
-    async def _liftByTagValu(self, tag, cmpr, valu, form, layers, reverse=False):
+    async def _liftByTagValu(self, tag, cmpr, valu, form, layers, reverse=False, lazy=False):
         if len(layers) == 1:
             layr = layers[0].iden
             async for _, buid, sode in layers[0].liftByTagValu(tag, cmpr, valu, form, reverse=reverse):
@@ -2432,10 +2736,10 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         for layr in layers:
             genrs.append(wrap_liftgenr(layr.iden, layr.liftByTagValu(tag, cmpr, valu, form, reverse=reverse)))
 
-        async for sodes in self._mergeSodes(layers, genrs, cmprkey_buid, filtercmpr, reverse=reverse):
+        async for sodes in self._mergeSodes(layers, genrs, cmprkey_buid, filtercmpr, reverse=reverse, lazy=lazy):
             yield sodes
 
-    async def _liftByTagProp(self, form, tag, prop, layers, reverse=False):
+    async def _liftByTagProp(self, form, tag, prop, layers, reverse=False, lazy=False):
         if len(layers) == 1:
             layr = layers[0].iden
             async for _, buid, sode in layers[0].liftByTagProp(form, tag, prop, reverse=reverse):
@@ -2455,10 +2759,10 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
 
             return props.get(prop) is not None
 
-        async for sodes in self._mergeSodes(layers, genrs, cmprkey_indx, filtercmpr, reverse=reverse):
+        async for sodes in self._mergeSodes(layers, genrs, cmprkey_indx, filtercmpr, reverse=reverse, lazy=lazy):
             yield sodes
 
-    async def _liftByTagPropValu(self, form, tag, prop, cmprvals, layers, reverse=False):
+    async def _liftByTagPropValu(self, form, tag, prop, cmprvals, layers, reverse=False, lazy=False):
         if len(layers) == 1:
             layr = layers[0].iden
             async for _, buid, sode in layers[0].liftByTagPropValu(form, tag, prop, cmprvals, reverse=reverse):
@@ -2479,7 +2783,7 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
             for layr in layers:
                 genrs.append(wrap_liftgenr(layr.iden, layr.liftByTagPropValu(form, tag, prop, (cval,), reverse=reverse)))
 
-            async for sodes in self._mergeSodes(layers, genrs, cmprkey_indx, filtercmpr, reverse=reverse):
+            async for sodes in self._mergeSodes(layers, genrs, cmprkey_indx, filtercmpr, reverse=reverse, lazy=lazy):
                 yield sodes
 
     def _setStormCmd(self, cdef):
@@ -2541,9 +2845,15 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
 
         name = cdef.get('name')
         self.stormcmds[name] = ctor
+        self._bumpSpawnPool()
 
     def _popStormCmd(self, name):
         self.stormcmds.pop(name, None)
+        self._bumpSpawnPool()
+
+    def _bumpSpawnPool(self):
+        if self.spawnpool is not None:
+            self.spawnpool.bump()
 
     async def delStormCmd(self, name):
         '''
@@ -2896,6 +3206,7 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
 
         # now actually load...
         self.stormpkgs[name] = pkgdef
+        self._bumpSpawnPool()
 
         pkgvers = pkgdef.get('version')
 
@@ -2959,6 +3270,7 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
             self.pkggraphs.pop(gdef['iden'], None)
 
         self.stormpkgs.pop(pkgname, None)
+        self._bumpSpawnPool()
 
     def getStormSvc(self, name):
 
@@ -4688,6 +5000,38 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
     async def getModelDefs(self):
         return self.model.getModelDefs()
 
+    async def getSpawnInfo(self):
+        '''
+        Get the information used to initialize a spawned Storm worker process.
+        '''
+        mdefs = self.model.getModelDefs()
+
+        # extended types are not present in the model definitions
+        types = mdefs[0][1].setdefault('types', [])
+        types = mdefs[0][1]['types'] = list(types)
+        for typename, basetype, typeopts, typeinfo in self.exttypes.values():
+            types.append((typename, (basetype, typeopts), typeinfo))
+
+        for formname, basetype, typeopts, typeinfo in self.extforms.values():
+            types.append((formname, (basetype, typeopts), typeinfo))
+
+        return {
+            'iden': self.iden,
+            'dirn': self.dirn,
+            'conf': {
+                'storm:log': self.conf.get('storm:log'),
+                'storm:log:level': self.conf.get('storm:log:level'),
+                'storm:interface:search': self.conf.get('storm:interface:search'),
+                'storm:interface:scrape': self.conf.get('storm:interface:scrape'),
+            },
+            'model': mdefs,
+            'storm': {
+                'cmds': list(self.cmddefs.values()),
+                'pkgs': list(self.stormpkgs.values()),
+            },
+            'logconf': await self._getSpawnLogConf(),
+        }
+
     async def getFormCounts(self):
         '''
         Return total form counts for all existing layers
@@ -5844,7 +6188,8 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
                 mirropts['_loginfo']['pool:from'] = self.ahasvcname
 
                 try:
-                    return await proxy.count(text, opts=mirropts)
+                    with self.stormpool.track(proxy):
+                        return await proxy.count(text, opts=mirropts)
 
                 except s_exc.TimeOut:
                     mesg = 'Timeout waiting for query mirror, running locally instead.'
@@ -5856,11 +6201,10 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
 
         view = self._viewFromOpts(opts)
 
-        i = 0
-        async for _ in view.eval(text, opts=opts):
-            i += 1
+        if self._useSpawnPool(opts):
+            return await self.spawnpool.count(view, text, opts)
 
-        return i
+        return await view.count(text, opts=opts)
 
     async def _getMirrorOpts(self, opts):
         assert 'nexsoffs' in opts
@@ -5877,13 +6221,16 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         size = self.stormpool.size()
         if size == 0:
             logger.warning('Storm query mirror pool is empty, running query locally.')
+            self.stormpoollocal += 1
             return None
 
+        tried = set()
         for _ in range(size):
 
             try:
                 timeout = self.stormpoolopts.get('timeout:connection')
-                proxy = await self.stormpool.proxy(timeout=timeout)
+                proxy = await self.stormpool.proxy(timeout=timeout, exclude=tried)
+                tried.add(proxy)
                 proxyname = proxy._ahainfo.get('name')
                 if proxyname is not None and proxyname == self.ahasvcname:
                     # we are part of the pool and were selected. Convert to local use.
@@ -5897,7 +6244,11 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
 
                 curoffs = opts.setdefault('nexsoffs', await self.getNexsIndx() - 1)
                 miroffs = await s_common.wait_for(proxy.getNexsIndx(), timeout) - 1
-                if (delta := curoffs - miroffs) <= MAX_NEXUS_DELTA:
+
+                delta = curoffs - miroffs
+                self.stormpool.setPoolLag(proxy, delta)
+
+                if delta <= MAX_NEXUS_DELTA:
                     return proxy
 
                 mesg = f'Pool mirror [{proxyname}] is too far out of sync. Skipping.'
@@ -5912,8 +6263,20 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
                 logger.warning(mesg, extra=await self.getLogExtra(mirror=proxyname))
 
         logger.warning('Pool members exhausted. Running query locally.', extra=await self.getLogExtra())
+        self.stormpoollocal += 1
         return None
 
+    def getStormPoolStats(self):
+        '''
+        Return the Storm pool balancing policy and per-member query stats or None if no pool is configured.
+        '''
+        if self.stormpool is None:
+            return None
+
+        stats = self.stormpool.getPoolStats()
+        stats['local'] = self.stormpoollocal
+        return stats
+
     async def storm(self, text, opts=None):
 
         opts = self._initStormOpts(opts)
@@ -5932,8 +6295,9 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
                 mirropts['_loginfo']['pool:from'] = self.ahasvcname
 
                 try:
-                    async for mesg in proxy.storm(text, opts=mirropts):
-                        yield mesg
+                    with self.stormpool.track(proxy):
+                        async for mesg in proxy.storm(text, opts=mirropts):
+                            yield mesg
                     return
 
                 except s_exc.TimeOut:
@@ -5945,9 +6309,18 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
                 raise s_exc.TimeOut(mesg=f'Timeout waiting for nexus offset {nexsoffs} in storm().')
 
         view = self._viewFromOpts(opts)
+
+        if self._useSpawnPool(opts):
+            async for mesg in self.spawnpool.storm(view, text, opts):
+                yield mesg
+            return
+
         async for mesg in view.storm(text, opts=opts):
             yield mesg
 
+    def _useSpawnPool(self, opts):
+        return self.spawnpool is not None and opts.get('readonly') and opts.get('spawn', True)
+
     async def callStorm(self, text, opts=None):
 
         opts = self._initStormOpts(opts)
@@ -5966,7 +6339,8 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
                 mirropts['_loginfo']['pool:from'] = self.ahasvcname
 
                 try:
-                    return await proxy.callStorm(text, opts=mirropts)
+                    with self.stormpool.track(proxy):
+                        return await proxy.callStorm(text, opts=mirropts)
                 except s_exc.TimeOut:
                     mesg = 'Timeout waiting for query mirror, running locally instead.'
                     logger.warning(mesg, extra=extra)
@@ -5995,8 +6369,9 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
                 mirropts['_loginfo']['pool:from'] = self.ahasvcname
 
                 try:
-                    async for mesg in proxy.exportStorm(text, opts=mirropts):
-                        yield mesg
+                    with self.stormpool.track(proxy):
+                        async for mesg in proxy.exportStorm(text, opts=mirropts):
+                            yield mesg
                     return
 
                 except s_exc.TimeOut:
@@ -6112,7 +6487,7 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
 
     async def _getStormEval(self, text):
         try:
-            astvalu = copy.deepcopy(await s_parser.evalcache.aget(text))
+            astvalu = s_parser.unpackAst(text, await s_parser.evalcache.aget(text))
         except s_exc.FatalErr:
             logger.exception(f'Fatal error while parsing [{text}]', extra={'synapse': {'text': text}})
             await self.fini()
@@ -6122,7 +6497,7 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
 
     async def _getStormQuery(self, args):
         try:
-            query = copy.deepcopy(await s_parser.querycache.aget(args))
+            query = s_parser.unpackAst(args[0], await self._getStormQueryAst(*args))
         except s_exc.FatalErr:
             logger.exception(f'Fatal error while parsing [{args}]', extra={'synapse': {'text': args[0]}})
             await self.fini()
@@ -1,4 +1,6 @@
 import os
+import lzma
+import zlib
 import shutil
 import asyncio
 import logging
@@ -8,18 +10,49 @@ import synapse.common as s_common
 
 import synapse.lib.base as s_base
 import synapse.lib.cell as s_cell
+import synapse.lib.coro as s_coro
+import synapse.lib.const as s_const
 import synapse.lib.schemas as s_schemas
+import synapse.lib.msgpack as s_msgpack
 import synapse.lib.lmdbslab as s_lmdbslab
 import synapse.lib.slabseqn as s_slabseqn
 import synapse.lib.slaboffs as s_slaboffs
+import synapse.lib.multislabseqn as s_multislabseqn
 
 logger = logging.getLogger(__name__)
 
+codecs = {
+    'zlib': (zlib.compress, zlib.decompress),
+    'lzma': (lzma.compress, lzma.decompress),
+}
+
+def decodeBlock(codec, byts):
+    '''
+    Decode a block of rows from CryoTank.blocks().
+
+    Args:
+        codec (str): The name of the codec used to compress the block or None.
+        byts (bytes): The block bytes.
+
+    Returns:
+        list: A list of msgpack encoded item bytes.
+    '''
+    if codec is not None:
+
+        codecfuncs = codecs.get(codec)
+        if codecfuncs is None:
+            mesg = f'CryoTank block uses an unknown codec: {codec}'
+            raise s_exc.FeatureNotSupported(mesg=mesg)
+
+        byts = codecfuncs[1](byts)
+
+    return s_msgpack.un(byts)
+
 class TankApi(s_cell.CellApi):
 
-    async def slice(self, offs, size=None, wait=False, timeout=None):
+    async def slice(self, offs, size=None, wait=False, timeout=None, tick=None):
         self.user.confirm(('cryo', 'tank', 'read'), gateiden=self.cell.iden())
-        async for item in self.cell.slice(offs, size=size, wait=wait, timeout=timeout):
+        async for item in self.cell.slice(offs, size=size, wait=wait, timeout=timeout, tick=tick):
             yield item
 
     async def puts(self, items):
@@ -31,13 +64,38 @@ class TankApi(s_cell.CellApi):
         async for item in self.cell.metrics(offs, size=size):
             yield item
 
+    async def blocks(self, offs, size=None):
+        self.user.confirm(('cryo', 'tank', 'read'), gateiden=self.cell.iden())
+        async for item in self.cell.blocks(offs, size=size):
+            yield item
+
     async def iden(self):
         return self.cell.iden()
 
 class CryoTank(s_base.Base):
     '''
     A CryoTank implements a stream of structured data.
+
+    Items are stored in a sequence of segment slabs which are rotated once
+    the current segment reaches a size or age limit. Whole segments may then
+    be removed to enforce a retention period.
+
+    Tank configuration options:
+
+        rotate:size (int): Rotate the segment once it reaches this many bytes (default 1GiB).
+        rotate:age (int): Rotate the segment once its first item is this many milliseconds old.
+        retain:age (int): Remove segments whose items are all older than this many milliseconds.
+        codec (str): Compress each block of stored items using zlib or lzma.
+
+    Any other options are passed to the Slab constructor.
+
+    Segments are checked for rotation by age and for retention when items are
+    added and every cullperiod seconds.
     '''
+    tankconfkeys = ('rotate:size', 'rotate:age', 'retain:age', 'codec')
+    blocksize = 1000
+    cullperiod = 60
+
     async def __anit__(self, dirn, iden, conf=None):
 
         await s_base.Base.__anit__(self)
@@ -50,14 +108,90 @@ class CryoTank(s_base.Base):
 
         self._iden = iden
 
+        self.rotatesize = conf.get('rotate:size', s_const.gibibyte)
+        self.rotateage = conf.get('rotate:age')
+        self.retainage = conf.get('retain:age')
+
+        self.codec = conf.get('codec')
+        if self.codec is not None and self.codec not in codecs:
+            mesg = f'Invalid codec value: {self.codec}. Must be one of: {", ".join(codecs)}'
+            raise s_exc.BadConfValu(mesg=mesg)
+
+        slabconf = {k: v for (k, v) in conf.items() if k not in self.tankconfkeys}
+
         path = s_common.gendir(self.dirn, 'tank.lmdb')
 
-        self.slab = await s_lmdbslab.Slab.anit(path, map_async=True, **conf)
+        self.slab = await s_lmdbslab.Slab.anit(path, map_async=True, **slabconf)
+        self.onfini(self.slab.fini)
 
-        self._items = s_slabseqn.SlabSeqn(self.slab, 'items')
         self._metrics = s_slabseqn.SlabSeqn(self.slab, 'metrics')
 
-        self.onfini(self.slab.fini)
+        # a sparse index of (tick, offs) rows for the first item of each put
+        self.times = self.slab.initdb('times')
+
+        path = s_common.gendir(self.dirn, 'segments')
+        slabopts = dict(slabconf)
+        slabopts.setdefault('map_async', True)
+
+        self._items = await s_multislabseqn.MultiSlabSeqn.anit(path, slabopts=slabopts)
+        self.onfini(self._items.fini)
+
+        if self.slab.dbexists('items'):
+            await self._migrateItems()
+
+        self.lasttick = 0
+        self.tailtick = None
+
+        for lkey, _ in self.slab.scanByFullBack(db=self.times):
+            tick, offs = s_common.int64un(lkey[:8]), s_common.int64un(lkey[8:])
+            if not self.lasttick:
+                self.lasttick = tick
+            if offs < self._items.getRangeStart(self._items.index()):
+                break
+            self.tailtick = tick
+
+        self._last = await self._initLast()
+
+        await self._cullSegments()
+
+        if self.rotateage is not None or self.retainage is not None:
+            self.schedCoro(self._runCullLoop())
+
+    async def _runCullLoop(self):
+
+        while not self.isfini:
+
+            if await self.waitfini(timeout=self.cullperiod):
+                return
+
+            try:
+                await self._checkRotate(s_common.now())
+                await self._cullSegments()
+
+            except asyncio.CancelledError:  # pragma: no cover
+                raise
+
+            except Exception:  # pragma: no cover
+                logger.exception(f'Error culling segments for tank {self._iden}')
+
+    async def _migrateItems(self):
+
+        logger.warning(f'Migrating tank {self._iden} items to segments')
+
+        items = s_slabseqn.SlabSeqn(self.slab, 'items')
+
+        for chunk in s_common.chunks(items.iter(0), self.blocksize):
+            self._items.setIndex(chunk[0][0])
+            await self._saveItems([item for (_, item) in chunk])
+            await asyncio.sleep(0)
+
+        for _, info in self._metrics.iter(0):
+            lkey = s_common.int64en(info['time']) + s_common.int64en(info['orig'])
+            self.slab.put(lkey, b'', db=self.times)
+
+        self.slab.dropdb('items')
+
+        logger.warning('...migration complete')
 
     def iden(self):
         return self._iden
@@ -66,7 +200,21 @@ class CryoTank(s_base.Base):
         '''
         Return an (offset, item) tuple for the last element in the tank ( or None ).
         '''
-        return self._items.last()
+        return self._last
+
+    async def _initLast(self):
+
+        last = await self._items.last()
+        if last is None or self.codec is None:
+            return last
+
+        indx, valu = last
+        if isinstance(valu, int):
+            indx -= valu
+            valu = await self._items.get(indx)
+
+        rows = await s_coro.executor(decodeBlock, valu[0], valu[2])
+        return indx + valu[1] - 1, s_msgpack.un(rows[-1])
 
     async def puts(self, items):
         '''
@@ -80,15 +228,157 @@ class CryoTank(s_base.Base):
         '''
         size = 0
 
-        for chunk in s_common.chunks(items, 1000):
-            metrics = await self._items.save(chunk)
+        for chunk in s_common.chunks(items, self.blocksize):
+
+            metrics = await self._saveItems(chunk)
+
+            offs = metrics['orig']
+            tick = metrics['time']
+
+            if tick > self.lasttick:
+                self.slab.put(s_common.int64en(tick) + s_common.int64en(offs), b'', db=self.times)
+                self.lasttick = tick
+
+            if self.tailtick is None:
+                self.tailtick = tick
+
+            self._last = (offs + len(chunk) - 1, s_msgpack.deepcopy(chunk[-1]))
+
             self._metrics.add(metrics)
+
             await self.fire('cryotank:puts', numrecords=len(chunk))
             size += len(chunk)
+
+            await self._checkRotate(tick)
             await asyncio.sleep(0)
 
         return size
 
+    async def _saveItems(self, items):
+
+        if self.codec is None:
+            return await self._items.saveInfo(items)
+
+        # the first row stores the block and the others store their distance from it
+        rows = [await self._encBlock(items)]
+        rows.extend(range(1, len(items)))
+
+        return await self._items.saveInfo(rows)
+
+    async def _encBlock(self, items):
+
+        byts = s_msgpack.en([s_msgpack.en(item) for item in items])
+
+        encbyts = await s_coro.executor(codecs[self.codec][0], byts)
+
+        # incompressible blocks are stored as is
+        if len(encbyts) >= len(byts):
+            return (None, len(items), byts)
+
+        return (self.codec, len(items), encbyts)
+
+    async def _iterBlocks(self, offs):
+        '''
+        Yield (offs, codec, count, byts) tuples for the stored blocks from a given offset.
+        '''
+        offs = max(offs, self._items.firstindx)
+
+        async for indx, valu in self._items.iter(offs):
+
+            if isinstance(valu, int):
+
+                # only the first row may start within a block
+                if indx != offs:
+                    continue
+
+                head = await self._items.get(indx - valu)
+                yield indx - valu, head[0], head[1], head[2]
+                continue
+
+            yield indx, valu[0], valu[1], valu[2]
+
+    async def _iterRows(self, offs):
+
+        if self.codec is None:
+            async for item in self._items.rows(offs):
+                yield item
+            return
+
+        async for indx, codec, count, byts in self._iterBlocks(offs):
+
+            rows = await s_coro.executor(decodeBlock, codec, byts)
+
+            for i in range(max(offs - indx, 0), count):
+                yield indx + i, rows[i]
+
+            await asyncio.sleep(0)
+
+    def _getTailSize(self):
+        slab = self._items.tailslab
+        return (slab.lenv.info()['last_pgno'] + 1) * slab.lenv.stat()['psize']
+
+    async def _checkRotate(self, tick):
+
+        # an empty tail segment is never rotated
+        if self.tailtick is None:
+            return
+
+        dorotate = self.rotatesize is not None and self._getTailSize() >= self.rotatesize
+        if not dorotate and self.rotateage is not None:
+            dorotate = tick - self.tailtick >= self.rotateage
+
+        if not dorotate:
+            return
+
+        await self._items.rotate()
+        self.tailtick = None
+
+        await self._cullSegments()
+
+    async def _cullSegments(self):
+        '''
+        Remove the segments which only contain items older than the retention period.
+        '''
+        if self.retainage is None:
+            return
+
+        offs = self.getOffsByTime(s_common.now() - self.retainage)
+
+        startindx = self._items.getRangeStart(offs)
+        if startindx is None or startindx <= self._items.firstindx:
+            return
+
+        try:
+            if not await self._items.cull(startindx - 1):
+                return
+
+        except s_exc.SlabInUse:
+            logger.warning(f'Unable to remove segments from tank {self._iden} while they are being read.')
+            return
+
+        firstindx = self._items.firstindx
+        if self._last is not None and self._last[0] < firstindx:
+            self._last = None
+
+        for lkey, _ in self.slab.scanByFull(db=self.times):
+            if s_common.int64un(lkey[8:]) >= firstindx:
+                break
+            self.slab.delete(lkey, db=self.times)
+
+    def getOffsByTime(self, tick):
+        '''
+        Return the offset of the first item which was added at or after the given time.
+
+        Args:
+            tick (int): A timestamp in epoch milliseconds.
+
+        Returns:
+            int: The offset of the item or the next offset if no items were added since tick.
+        '''
+        for lkey, _ in self.slab.scanByRange(s_common.int64en(tick), db=self.times):
+            return max(s_common.int64un(lkey[8:]), self._items.firstindx)
+        return self._items.index()
+
     async def metrics(self, offs, size=None):
         '''
         Yield metrics rows starting at offset.
@@ -107,7 +397,7 @@ class CryoTank(s_base.Base):
 
             yield indx, item
 
-    async def slice(self, offs, size=None, wait=False, timeout=None):
+    async def slice(self, offs, size=None, wait=False, timeout=None, tick=None):
         '''
         Yield a number of items from the CryoTank starting at a given offset.
 
@@ -116,21 +406,34 @@ class CryoTank(s_base.Base):
             size (int): The max number of items to yield.
             wait (bool): Once caught up, yield new results in realtime
             timeout (int): Max time to wait for a new item.
+            tick (int): Start at the first item added at or after this time.
 
         Yields:
             ((index, object)): Index and item values.
         '''
+        if tick is not None:
+            offs = max(offs, self.getOffsByTime(tick))
 
         i = 0
-        async for indx, item in self._items.aiter(offs, wait=wait, timeout=timeout):
+        while True:
 
-            if size is not None and i >= size:
-                return
+            async for indx, byts in self._iterRows(offs):
 
-            yield indx, item
+                if size is not None and i >= size:
+                    return
 
-            i += 1
-            await asyncio.sleep(0)
+                yield indx, s_msgpack.un(byts)
+
+                offs = indx + 1
+
+                i += 1
+                await asyncio.sleep(0)
+
+            if not wait:
+                return
+
+            if not await self._items.waitForOffset(offs, timeout=timeout):
+                return
 
     async def rows(self, offs, size=None):
         '''
@@ -143,26 +446,88 @@ class CryoTank(s_base.Base):
         Yields:
             ((indx, bytes)): Index and msgpacked bytes.
         '''
-        for i, (indx, byts) in enumerate(self._items.rows(offs)):
+        i = 0
+        async for indx, byts in self._iterRows(offs):
 
             if size is not None and i >= size:
                 return
 
             yield indx, byts
+            i += 1
+
+    async def blocks(self, offs, size=None):
+        '''
+        Yield blocks of raw items from the CryoTank starting at a given offset.
+
+        Blocks which are stored compressed are returned without being decoded.
+        Use decodeBlock() to retrieve the list of msgpacked item bytes.
+
+        Args:
+            offs (int): The index of the desired datum (starts at 0)
+            size (int): The max number of items to yield.
+
+        Yields:
+            ((indx, count, codec, bytes)): Index, item count, codec name, and block bytes.
+        '''
+        if self.codec is not None:
+
+            async for indx, codec, count, byts in self._iterBlocks(offs):
+
+                if size is not None and size <= 0:
+                    return
+
+                skip = max(offs - indx, 0)
+                if skip or (size is not None and count - skip > size):
+
+                    rows = (await s_coro.executor(decodeBlock, codec, byts))[skip:]
+                    if size is not None:
+                        rows = rows[:size]
+
+                    indx, codec, count, byts = indx + skip, None, len(rows), s_msgpack.en(rows)
+
+                yield indx, count, codec, byts
+
+                if size is not None:
+                    size -= count
+
+            return
+
+        rows = []
+        async for indx, byts in self.rows(offs, size=size):
+
+            if not rows:
+                offs = indx
+
+            rows.append(byts)
+
+            if len(rows) >= self.blocksize:
+                yield offs, len(rows), None, s_msgpack.en(rows)
+                rows.clear()
+
+        if rows:
+            yield offs, len(rows), None, s_msgpack.en(rows)
 
     async def info(self):
         '''
         Returns information about the CryoTank instance.
 
+        Notes:
+            Items are stored in multiple segment slabs, so ``stat`` only contains
+            the number of ``entries`` in the tank rather than the LMDB statistics
+            of a single database.
+
         Returns:
             dict: A dict containing items and metrics indexes.
         '''
-        stat = self._items.stat()
+        indx = self._items.index()
+        firstindx = self._items.firstindx
         return {
             'iden': self._iden,
-            'indx': self._items.index(),
+            'indx': indx,
+            'first': firstindx,
             'metrics': self._metrics.index(),
-            'stat': stat,
+            'segments': len(self._items._ranges),
+            'stat': {'entries': indx - firstindx},
         }
 
 class CryoApi(s_cell.CellApi):
@@ -175,10 +540,10 @@ class CryoApi(s_cell.CellApi):
         tank = await self.cell.init(name, conf=conf, user=self.user)
         return tank.iden()
 
-    async def slice(self, name, offs, size=None, wait=False, timeout=None):
+    async def slice(self, name, offs, size=None, wait=False, timeout=None, tick=None):
         tank = await self.cell.init(name, user=self.user)
         self.user.confirm(('cryo', 'tank', 'read'), gateiden=tank.iden())
-        async for item in tank.slice(offs, size=size, wait=wait, timeout=timeout):
+        async for item in tank.slice(offs, size=size, wait=wait, timeout=timeout, tick=tick):
             yield item
 
     async def list(self):
@@ -206,6 +571,12 @@ class CryoApi(s_cell.CellApi):
         async for item in tank.metrics(offs, size=size):
             yield item
 
+    async def blocks(self, name, offs, size=None):
+        tank = await self.cell.init(name, user=self.user)
+        self.user.confirm(('cryo', 'tank', 'read'), gateiden=tank.iden())
+        async for item in tank.blocks(offs, size=size):
+            yield item
+
     @s_cell.adminapi(log=True)
     async def delete(self, name):
         return await self.cell.delete(name)
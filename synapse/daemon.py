@@ -1,4 +1,5 @@
 import types
+import struct
 import asyncio
 import logging
 
@@ -11,11 +12,18 @@ import synapse.telepath as s_telepath
 import synapse.lib.base as s_base
 import synapse.lib.coro as s_coro
 import synapse.lib.link as s_link
+import synapse.lib.const as s_const
 import synapse.lib.scope as s_scope
 import synapse.lib.share as s_share
+import synapse.lib.msgpack as s_msgpack
 import synapse.lib.certdir as s_certdir
 import synapse.lib.reflect as s_reflect
 
+# bounds for coalescing generator items into t2:yields messages
+T2_YIELDS_COUNT = 1000
+T2_YIELDS_BYTES = 4 * s_const.mebibyte
+T2_YIELDS_WAIT = 0.01
+
 class Sess(s_base.Base):
 
     async def __anit__(self):
@@ -118,10 +126,205 @@ dmonwrap = (
     (types.GeneratorType, Genr),
 )
 
-async def t2call(link, meth, args, kwargs):
+class YieldWindow:
+    '''
+    Track the credits granted by a telepath client for t2:yields items.
+
+    Notes:
+        The client grants an initial window of credits in t2:init and returns
+        credits using t2:credit messages as it consumes items.  The daemon
+        consumes one credit per item and will not read items from a generator
+        while there are no credits available.
+    '''
+    def __init__(self, credits):
+        self.credits = credits
+        self.event = asyncio.Event()
+
+        # limit batches to half the window so the next batch may be read while one is sent
+        self.count = max(1, min(T2_YIELDS_COUNT, credits // 2))
+
+        if credits > 0:
+            self.event.set()
+
+    def give(self, count):
+        self.credits += count
+        if self.credits > 0:
+            self.event.set()
+
+    def take(self):
+        self.credits -= 1
+        if self.credits <= 0:
+            self.event.clear()
+
+    async def wait(self):
+        await self.event.wait()
+
+# the msgpack encoded ('t2:yields', {'byts': ...}) message up to the bin header of byts
+t2yieldshead = s_msgpack.en(('t2:yields', {'byts': b''}))[:-2]
+
+def _t2yields(items):
+    '''
+    Return the frames of a t2:yields message for a list of msgpack encoded items.
+
+    The items are sent after the message header rather than being joined and
+    encoded into a new bytes object.
+    '''
+    size = sum(len(byts) for byts in items)
+    return [t2yieldshead + struct.pack('>BI', 0xc6, size)] + items
+
+async def _iterYields(genr, window):
+    '''
+    Yield batches of msgpack encoded items from a generator.
+    '''
+    size = 0
+    items = []
+
+    try:
+
+        await window.wait()
+
+        for item in genr:
+
+            byts = s_msgpack.en(item)
+
+            items.append(byts)
+            size += len(byts)
+
+            window.take()
+
+            if size >= T2_YIELDS_BYTES or len(items) >= window.count or window.credits <= 0:
+                yield items
+                items = []
+                size = 0
+
+            await window.wait()
+
+    except Exception:
+        # send any items which were yielded before the exception
+        if items:
+            yield items
+        raise
+
+    if items:
+        yield items
+
+async def _genrYields(genr, window):
+    '''
+    Yield batches of msgpack encoded items from an async generator.
+
+    Notes:
+        The generator is consumed by a separate task so that items which are
+        already available are not held back by a generator which is waiting
+        on new items.  A batch is yielded once it reaches the window batch size
+        or T2_YIELDS_BYTES bytes, once the client window is exhausted, once the
+        generator makes no progress during a pass of the event loop, or
+        T2_YIELDS_WAIT seconds after it became non-empty.  Items are only read
+        from the generator while the client window has credits available.
+    '''
+    size = 0
+    done = False
+    items = []
+
+    room = asyncio.Event()
+    full = asyncio.Event()
+    ready = asyncio.Event()
+
+    room.set()
+
+    async def fill():
+
+        nonlocal size, done, items
+
+        try:
+
+            await window.wait()
+
+            async for item in genr:
+
+                byts = s_msgpack.en(item)
+
+                items.append(byts)
+                size += len(byts)
+
+                window.take()
+
+                ready.set()
+
+                if size >= T2_YIELDS_BYTES or len(items) >= window.count:
+                    full.set()
+                    room.clear()
+                    await room.wait()
+
+                elif window.credits <= 0:
+                    full.set()
+
+                await window.wait()
+
+        finally:
+            done = True
+            full.set()
+            ready.set()
+
+    loop = asyncio.get_running_loop()
+
+    async def filling():
+        # wait for more items while the generator is producing them
+        maxtime = loop.time() + T2_YIELDS_WAIT
+        while not full.is_set() and loop.time() < maxtime:
+            count = len(items)
+            await asyncio.sleep(0)
+            if len(items) == count:
+                return
+
+    task = loop.create_task(fill())
+    s_scope.clone(task)
+
+    try:
+
+        first = True
+
+        while True:
+
+            await ready.wait()
+
+            # the first item is sent immediately to minimize the time to first result
+            if not first and not full.is_set():
+                await filling()
+
+            first = False
+
+            if done and not items:
+                break
+
+            batch = items
+            items = []
+            size = 0
+
+            if not done:
+                ready.clear()
+                full.clear()
+                room.set()
+
+            yield batch
+
+        # raise any exception from the generator
+        task.result()
+
+    finally:
+        if not task.done():
+            task.cancel()
+            await asyncio.wait((task,))
+
+async def t2call(link, meth, args, kwargs, yields=0):
     '''
     Call the given ``meth(*args, **kwargs)`` and handle the response to provide
     telepath task v2 events to the given link.
+
+    Notes:
+        If ``yields`` is a non-zero number of credits, generator results are
+        coalesced into ``t2:yields`` messages which contain the msgpack encoded
+        bytes of multiple items, and no more items than the client window allows
+        are read ahead of the client.
     '''
     try:
 
@@ -130,18 +333,36 @@ async def t2call(link, meth, args, kwargs):
         if s_coro.iscoro(valu):
             valu = await valu
 
+        batches = None
+
         try:
 
             first = True
             if isinstance(valu, types.AsyncGeneratorType):
 
-                async for item in valu:
+                if yields:
+
+                    window = YieldWindow(yields)
+                    link.set('t2:window', window)
 
-                    if first:
-                        await link.tx(('t2:genr', {}))
-                        first = False
+                    batches = _genrYields(valu, window)
+                    async for items in batches:
 
-                    await link.tx(('t2:yield', {'retn': (True, item)}))
+                        if first:
+                            await link.tx(('t2:genr', {}))
+                            first = False
+
+                        await link.sendv(_t2yields(items))
+
+                else:
+
+                    async for item in valu:
+
+                        if first:
+                            await link.tx(('t2:genr', {}))
+                            first = False
+
+                        await link.tx(('t2:yield', {'retn': (True, item)}))
 
                 if first:
                     await link.tx(('t2:genr', {}))
@@ -151,13 +372,29 @@ async def t2call(link, meth, args, kwargs):
 
             elif isinstance(valu, types.GeneratorType):
 
-                for item in valu:
+                if yields:
+
+                    window = YieldWindow(yields)
+                    link.set('t2:window', window)
+
+                    batches = _iterYields(valu, window)
+                    async for items in batches:
+
+                        if first:
+                            await link.tx(('t2:genr', {}))
+                            first = False
+
+                        await link.sendv(_t2yields(items))
+
+                else:
+
+                    for item in valu:
 
-                    if first:
-                        await link.tx(('t2:genr', {}))
-                        first = False
+                        if first:
+                            await link.tx(('t2:genr', {}))
+                            first = False
 
-                    await link.tx(('t2:yield', {'retn': (True, item)}))
+                        await link.tx(('t2:yield', {'retn': (True, item)}))
 
                 if first:
                     await link.tx(('t2:genr', {}))
@@ -180,6 +417,10 @@ async def t2call(link, meth, args, kwargs):
             else:
                 logger.exception(f'error during task {meth.__name__} {e}')
 
+            # the batches must be closed before the generator they consume
+            if batches is not None:
+                await batches.aclose()
+
             if isinstance(valu, types.AsyncGeneratorType):
                 await valu.aclose()
             elif isinstance(valu, types.GeneratorType):
@@ -231,6 +472,9 @@ class Daemon(s_base.Base):
 
         self.certdir = certdir
         self.televers = s_telepath.televers
+        self.telefeats = {
+            't2:yields': 1,
+        }
 
         self.addr = None    # our main listen address
         self.cells = {}     # all cells are shared.  not all shared are cells.
@@ -372,6 +616,11 @@ class Daemon(s_base.Base):
                     await link.fini()
                     return
 
+                # credits must be handled while the t2:init task is running
+                if isinstance(mesg, tuple) and mesg[:1] == ('t2:credit',):
+                    self._onTaskV2Credit(link, mesg)
+                    continue
+
                 if task is not None:
                     await task
 
@@ -420,6 +669,7 @@ class Daemon(s_base.Base):
         reply = ('tele:syn', {
             'vers': self.televers,
             'retn': (True, None),
+            'features': dict(self.telefeats),
         })
 
         if self.ahainfo is not None:
@@ -462,7 +712,7 @@ class Daemon(s_base.Base):
             link.set('sess', sess)
 
             if isinstance(item, s_telepath.Aware):
-                reply[1]['features'] = await item.getTeleFeats()
+                reply[1]['features'].update(await item.getTeleFeats())
                 item = await s_coro.ornot(item.getTeleApi, link, mesg, path)
                 if isinstance(item, s_base.Base):
                     link.onfini(item)
@@ -507,6 +757,7 @@ class Daemon(s_base.Base):
         name = mesg[1].get('name')
         sidn = mesg[1].get('sess')
         todo = mesg[1].get('todo')
+        yields = mesg[1].get('yields', 0)
 
         try:
 
@@ -534,7 +785,7 @@ class Daemon(s_base.Base):
                 logger.warning('%r has no method: %r', item, methname)
                 raise s_exc.NoSuchMeth(name=methname)
 
-            sessitem = await t2call(link, meth, args, kwargs)
+            sessitem = await t2call(link, meth, args, kwargs, yields=yields)
             if sessitem is not None:
                 sess.onfini(sessitem)
 
@@ -544,6 +795,21 @@ class Daemon(s_base.Base):
                 retn = s_common.retnexc(e)
                 await link.tx(('t2:fini', {'retn': retn}))
 
+        finally:
+            link.set('t2:window', None)
+
+    def _onTaskV2Credit(self, link: s_link.Link, mesg):
+
+        # t2:credit returns t2:yields credits as the client consumes items
+        window = link.get('t2:window')
+        if window is None:
+            return
+
+        try:
+            window.give(mesg[1].get('count', 0))
+        except Exception:
+            logger.exception(f'Error on t2:credit: {s_common.trimText(repr(mesg), n=80)} link={link.getAddrInfo()}')
+
     async def _onTaskInit(self, link, mesg):
 
         task = mesg[1].get('task')
@@ -131,10 +131,6 @@ class Prop:
         self.deprecated = self.info.get('deprecated', False)
 
         self.type = self.modl.getTypeClone(typedef)
-        self.typehash = self.type.typehash
-
-        if self.type.isarray:
-            self.arraytypehash = self.type.arraytype.typehash
 
         if form is not None:
             form.setProp(name, self)
@@ -152,6 +148,14 @@ class Prop:
     def __repr__(self):
         return f'DataModel Prop: {self.full}'
 
+    @property
+    def typehash(self):
+        return self.type.typehash
+
+    @property
+    def arraytypehash(self):
+        return self.type.arraytype.typehash
+
     def onSet(self, func):
         '''
         Add a callback for setting this property.
@@ -292,11 +296,6 @@ class Form:
         if self.type is None:
             raise s_exc.NoSuchType(name=name)
 
-        self.typehash = self.type.typehash
-
-        if self.type.isarray:
-            self.arraytypehash = self.type.arraytype.typehash
-
         self.form = self
 
         self.props = {}     # name: Prop()
@@ -315,6 +314,14 @@ class Form:
                     sys.audit('synapse.datamodel.Form.deprecated', mesg, self.full)
             self.onAdd(depfunc)
 
+    @property
+    def typehash(self):
+        return self.type.typehash
+
+    @property
+    def arraytypehash(self):
+        return self.type.arraytype.typehash
+
     def getStorNode(self, form):
 
         ndef = (form.name, form.type.norm(self.name)[0])
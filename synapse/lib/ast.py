@@ -241,6 +241,115 @@ class Query(AstNode):
                     if count >= limit:
                         break
 
+    def getCountHint(self):
+        '''
+        Return a hint which may be used to count the nodes produced by the
+        query using storage indexes or None if the query must be executed.
+        '''
+        if not self.kids or len(self.kids) > 2:
+            return None
+
+        lift = self.kids[0]
+
+        if len(self.kids) == 1:
+
+            if type(lift) is LiftProp and lift.kids[0].isconst:
+                return ('prop', {'name': lift.kids[0].value(), 'form': None})
+
+            if type(lift) is LiftTag and len(lift.kids) == 1 and lift.kids[0].isconst:
+                return ('tag', {'name': lift.kids[0].constval, 'form': None})
+
+            if type(lift) is LiftFormTag and len(lift.kids) == 2 and lift.kids[0].isconst and lift.kids[1].isconst:
+                return ('tag', {'name': lift.kids[1].constval, 'form': lift.kids[0].value()})
+
+            return None
+
+        # a form lift with a filter which the lift would use as a hint
+        filt = self.kids[1]
+        if type(lift) is not LiftProp or not lift.kids[0].isconst:
+            return None
+
+        if type(filt) is not FiltOper or filt.kids[0].value() != '+':
+            return None
+
+        form = lift.kids[0].value()
+        cond = filt.kids[1]
+
+        if type(cond) is TagCond:
+            tag = cond.kids[0]
+            if isinstance(tag, TagMatch) and tag.isconst and not tag.hasglob():
+                return ('tag', {'name': tag.constval, 'form': form})
+            return None
+
+        if type(cond) is HasRelPropCond:
+            relprop = cond.kids[0]
+            if not relprop.isconst:
+                return None
+
+            name = relprop.kids[0].value()
+            if name.find('::') != -1:
+                return None
+
+            if isinstance(relprop, UnivProp):
+                return ('prop', {'name': form + name, 'form': form})
+
+            return ('prop', {'name': f'{form}:{name}', 'form': form})
+
+        return None
+
+    def isLazySafe(self, yields=True):
+        '''
+        Return True if the query provably does not access the properties, tags, or
+        data of the nodes it lifts, which allows the lifts to defer retrieving the
+        storage nodes from layers which did not produce a node.
+
+        Args:
+            yields (bool): True if the nodes produced by the query are accessed by the caller.
+        '''
+        if not self.kids:
+            return False
+
+        output = False
+        for oper in self.kids:
+
+            if isinstance(oper, LiftOper):
+
+                # lift values which call functions or run queries may access nodes
+                todo = collections.deque(oper.kids)
+                while todo:
+                    kid = todo.popleft()
+                    if isinstance(kid, (FuncCall, SubQuery, ArgvQuery, EmbedQuery)):
+                        return False
+                    todo.extend(kid.kids)
+
+                output = True
+                continue
+
+            if type(oper) is not CmdOper:
+                return False
+
+            name = oper.kids[0].value()
+
+            argv = oper.kids[1]
+            if isinstance(argv, Const):
+                argv = argv.value()
+            elif all(isinstance(arg, Const) for arg in argv.kids):
+                argv = tuple(arg.value() for arg in argv.kids)
+            else:
+                return False
+
+            if name == 'uniq' and not argv:
+                continue
+
+            if name == 'count' and argv in ((), ('--yield',)):
+                if not argv:
+                    output = False
+                continue
+
+            return False
+
+        return not (yields and output)
+
 class Lookup(Query):
     '''
     When storm input mode is "lookup"
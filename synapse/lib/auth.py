@@ -29,6 +29,67 @@ def textFromRule(rule):
         text = '!' + text
     return text
 
+def compileRules(rules):
+    '''
+    Compile a list of (allow, path) rules into a trie keyed by permission path parts.
+
+    Each trie node is a list of [match, children, deepdeny] where match is the
+    (indx, allow, path) tuple of the first rule which ends at the node, children
+    is a dict of path part to child node, and deepdeny is True if a deny rule
+    ends below the node.
+    '''
+    trie = [None, {}, False]
+
+    for indx, (allow, path) in enumerate(rules):
+
+        node = trie
+        for part in path:
+
+            if not allow:
+                node[2] = True
+
+            step = node[1].get(part)
+            if step is None:
+                step = node[1][part] = [None, {}, False]
+
+            node = step
+
+        if node[0] is None:
+            node[0] = (indx, allow, path)
+
+    return trie
+
+def matchRuleTrie(trie, perm):
+    '''
+    Return the (indx, allow, path) tuple for the first rule in a compiled trie which matches the permission or None.
+    '''
+    # rules are checked in order so the first matching rule wins rather than the most specific
+    match = trie[0]
+
+    node = trie
+    for part in perm:
+
+        node = node[1].get(part)
+        if node is None:
+            break
+
+        if node[0] is not None and (match is None or node[0][0] < match[0]):
+            match = node[0]
+
+    return match
+
+def hasDeepDenyTrie(trie, perm):
+    '''
+    Return True if a compiled trie contains a deny rule which is more specific than the permission.
+    '''
+    node = trie
+    for part in perm:
+        node = node[1].get(part)
+        if node is None:
+            return False
+
+    return node[2]
+
 @dataclasses.dataclass(slots=True)
 class _allowedReason:
     value: Union[bool | None]
@@ -168,8 +229,10 @@ class Auth(s_nexus.Pusher):
             await self._addUser(guid, 'root')
             self.rootuser = self.user(guid)
 
-        await self.rootuser.setAdmin(True, logged=False)
-        await self.rootuser.setLocked(False, logged=False)
+        # read-only auth (such as in a spawned process) may not make changes
+        if not self.slab.readonly:
+            await self.rootuser.setAdmin(True, logged=False)
+            await self.rootuser.setLocked(False, logged=False)
 
     def users(self):
         for useriden in self.useridenbyname.values():
@@ -801,12 +864,14 @@ class AuthGate():
             user = self.auth.user(useriden)
             if user.authgates.pop(self.iden) is not None:
                 self.auth.userdefs.set(useriden, user.info)
+                user.ruletries.pop(self.iden, None)
                 user.clearAuthCache()
 
         for roleiden in self.gateroles.keys():
             role = self.auth.role(roleiden)
             if role.authgates.pop(self.iden) is not None:
                 self.auth.roledefs.set(roleiden, role.info)
+                role.ruletries.pop(self.iden, None)
                 role.clearAuthCache()
 
         self.auth.gatedefs.delete(self.iden)
@@ -851,6 +916,32 @@ class Ruler():
 
         self.authgates = info.get('authgates')
 
+        self.ruletries = {}  # gateiden -> (rules, trie)
+
+    def getRuleTrie(self, info, gateiden=None):
+        '''
+        Return the compiled rule trie for the rules in the given info dict.
+
+        Note:
+            Rule changes always replace the rules list in the info dict so the
+            trie is only recompiled for the rules which have changed.
+        '''
+        rules = info.get('rules', ())
+
+        cached = self.ruletries.get(gateiden)
+        if cached is not None and cached[0] is rules:
+            return cached[1]
+
+        trie = compileRules(rules)
+        self.ruletries[gateiden] = (rules, trie)
+        return trie
+
+    def _matchRule(self, perm, info, gateiden=None):
+        return matchRuleTrie(self.getRuleTrie(info, gateiden=gateiden), perm)
+
+    def _matchDeepDeny(self, perm, info, gateiden=None):
+        return hasDeepDenyTrie(self.getRuleTrie(info, gateiden=gateiden), perm)
+
     async def _setRulrInfo(self, name, valu, gateiden=None, nexs=True, mesg=None):  # pragma: no cover
         raise s_exc.NoSuchImpl(mesg='Subclass must implement _setRulrInfo')
 
@@ -945,15 +1036,13 @@ class Role(Ruler):
         if gateiden is not None:
             info = self.authgates.get(gateiden)
             if info is not None:
-                for allow, path in info.get('rules', ()):
-                    if perm[:len(path)] == path:
-                        return allow
+                if (rule := self._matchRule(perm, info, gateiden=gateiden)) is not None:
+                    return rule[1]
             return default
 
         # 2. check role rules
-        for allow, path in self.info.get('rules', ()):
-            if perm[:len(path)] == path:
-                return allow
+        if (rule := self._matchRule(perm, self.info)) is not None:
+            return rule[1]
 
         return default
 
@@ -1074,14 +1163,12 @@ class User(Ruler):
                 if info.get('admin'):
                     return True
 
-                for allow, path in info.get('rules', ()):
-                    if perm[:len(path)] == path:
-                        return allow
+                if (rule := self._matchRule(perm, info, gateiden=gateiden)) is not None:
+                    return rule[1]
 
         # 2. check user rules
-        for allow, path in self.info.get('rules', ()):
-            if perm[:len(path)] == path:
-                return allow
+        if (rule := self._matchRule(perm, self.info)) is not None:
+            return rule[1]
 
         # 3. check authgate role rules
         if gateiden is not None:
@@ -1092,15 +1179,13 @@ class User(Ruler):
                 if info is None:
                     continue
 
-                for allow, path in info.get('rules', ()):
-                    if perm[:len(path)] == path:
-                        return allow
+                if (rule := role._matchRule(perm, info, gateiden=gateiden)) is not None:
+                    return rule[1]
 
         # 4. check role rules
         for role in self.getRoles():
-            for allow, path in role.info.get('rules', ()):
-                if perm[:len(path)] == path:
-                    return allow
+            if (rule := role._matchRule(perm, role.info)) is not None:
+                return rule[1]
 
         return default
 
@@ -1131,14 +1216,12 @@ class User(Ruler):
                 if info.get('admin'):
                     return _allowedReason(True, isadmin=True, gateiden=gateiden)
 
-                for allow, path in info.get('rules', ()):
-                    if perm[:len(path)] == path:
-                        return _allowedReason(allow, gateiden=gateiden, rule=path)
+                if (rule := self._matchRule(perm, info, gateiden=gateiden)) is not None:
+                    return _allowedReason(rule[1], gateiden=gateiden, rule=rule[2])
 
         # 2. check user rules
-        for allow, path in self.info.get('rules', ()):
-            if perm[:len(path)] == path:
-                return _allowedReason(allow, rule=path)
+        if (rule := self._matchRule(perm, self.info)) is not None:
+            return _allowedReason(rule[1], rule=rule[2])
 
         # 3. check authgate role rules
         if gateiden is not None:
@@ -1149,23 +1232,19 @@ class User(Ruler):
                 if info is None:
                     continue
 
-                for allow, path in info.get('rules', ()):
-                    if perm[:len(path)] == path:
-                        return _allowedReason(allow, gateiden=gateiden, roleiden=role.iden, rolename=role.name,
-                                              rule=path)
+                if (rule := role._matchRule(perm, info, gateiden=gateiden)) is not None:
+                    return _allowedReason(rule[1], gateiden=gateiden, roleiden=role.iden, rolename=role.name,
+                                          rule=rule[2])
 
         # 4. check role rules
         for role in self.getRoles():
-            for allow, path in role.info.get('rules', ()):
-                if perm[:len(path)] == path:
-                    return _allowedReason(allow, roleiden=role.iden, rolename=role.name, rule=path)
+            if (rule := role._matchRule(perm, role.info)) is not None:
+                return _allowedReason(rule[1], roleiden=role.iden, rolename=role.name, rule=rule[2])
 
         return _allowedReason(default, default=True)
 
     def _hasDeepDeny(self, perm, gateiden):
 
-        permlen = len(perm)
-
         # 1. check authgate user rules
         if gateiden is not None:
 
@@ -1175,19 +1254,12 @@ class User(Ruler):
                 if info.get('admin'):
                     return False
 
-                for allow, path in info.get('rules', ()):
-                    if allow:
-                        continue
-                    if path[:permlen] == perm and len(path) > permlen:
-                        return True
+                if self._matchDeepDeny(perm, info, gateiden=gateiden):
+                    return True
 
         # 2. check user rules
-        for allow, path in self.info.get('rules', ()):
-            if allow:
-                continue
-
-            if path[:permlen] == perm and len(path) > permlen:
-                return True
+        if self._matchDeepDeny(perm, self.info):
+            return True
 
         # 3. check authgate role rules
         if gateiden is not None:
@@ -1198,19 +1270,13 @@ class User(Ruler):
                 if info is None:
                     continue
 
-                for allow, path in info.get('rules', ()):
-                    if allow:
-                        continue
-                    if path[:permlen] == perm and len(path) > permlen:
-                        return True
+                if role._matchDeepDeny(perm, info, gateiden=gateiden):
+                    return True
 
         # 4. check role rules
         for role in self.getRoles():
-            for allow, path in role.info.get('rules', ()):
-                if allow:
-                    continue
-                if path[:permlen] == perm and len(path) > permlen:
-                    return True
+            if role._matchDeepDeny(perm, role.info):
+                return True
 
         return False
 
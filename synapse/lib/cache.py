@@ -154,6 +154,74 @@ class LruDict(collections.abc.MutableMapping):
         '''
         return item in self.data
 
+class ByteLruDict(LruDict):
+    '''
+    An LruDict of bytes values which is bounded by the total size of the values.
+    '''
+    def __init__(self, size=16 * 1024 * 1024):
+        LruDict.__init__(self, size=size)
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        valu = self.data.get(key, s_common.novalu)
+        if valu is s_common.novalu:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self.data.move_to_end(key)
+        return valu
+
+    def __setitem__(self, key, valu):
+
+        if self.disabled:
+            return
+
+        size = len(valu)
+        if size > self.maxsize:
+            self.pop(key, None)
+            return
+
+        oldv = self.data.get(key)
+        if oldv is not None:
+            self.size -= len(oldv)
+
+        self.data[key] = valu
+        self.data.move_to_end(key)
+        self.size += size
+
+        while self.size > self.maxsize:
+            _, oldv = self.data.popitem(last=False)
+            self.size -= len(oldv)
+
+    def __delitem__(self, key):
+        valu = self.data.pop(key, None)
+        if valu is not None:
+            self.size -= len(valu)
+
+    def pop(self, key, default=None):
+        valu = self.data.pop(key, None)
+        if valu is None:
+            return default
+
+        self.size -= len(valu)
+        return valu
+
+    def clear(self):
+        self.data.clear()
+        self.size = 0
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': self.size,
+            'maxsize': self.maxsize,
+            'count': len(self.data),
+        }
+
 # Search for instances of escaped double or single asterisks
 # https://regex101.com/r/fOdmF2/1
 ReRegex = regex.compile(r'(\\\*\\\*)|(\\\*)')
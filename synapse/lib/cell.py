@@ -970,6 +970,19 @@ class Cell(s_nexus.Pusher, s_telepath.Aware):
             'description': 'Record all changes to a stream file on disk.  Required for mirroring (on both sides).',
             'type': 'boolean',
         },
+        'nexslog:group:size': {
+            'default': 1,
+            'description': 'The maximum number of pending Nexus events to log with a single write and then apply. '
+                           'A value of 1 disables grouping.',
+            'type': 'integer',
+            'minimum': 1,
+        },
+        'nexslog:group:wait': {
+            'default': 0.0,
+            'description': 'The maximum time, in seconds, to wait for additional Nexus events to fill a group.',
+            'type': 'number',
+            'minimum': 0,
+        },
         'nexslog:async': {
             'default': True,
             'description': 'Deprecated. This option ignored.',
@@ -4616,6 +4629,7 @@ class Cell(s_nexus.Pusher, s_telepath.Aware):
                 'verstring': self.VERSTRING,
                 'cellvers': dict(self.cellvers.items()),
                 'nexsindx': await self.getNexsIndx(),
+                'nexsgroup': self.nexsroot.getGroupStats(),
                 'uplink': self.nexsroot.miruplink.is_set(),
                 'mirror': mirror,
                 'aha': {
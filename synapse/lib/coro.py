@@ -12,6 +12,7 @@ import functools
 import contextlib
 import multiprocessing
 import concurrent.futures
+import concurrent.futures.process
 
 logger = logging.getLogger(__name__)
 
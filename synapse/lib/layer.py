@@ -58,10 +58,13 @@ Storage Node (<sode>)
 '''
 import os
 import math
+import heapq
 import shutil
+import types
 import struct
 import asyncio
 import logging
+import tempfile
 import contextlib
 import collections
 
@@ -76,6 +79,7 @@ import synapse.lib.gis as s_gis
 import synapse.lib.cell as s_cell
 import synapse.lib.coro as s_coro
 import synapse.lib.cache as s_cache
+import synapse.lib.const as s_const
 import synapse.lib.nexus as s_nexus
 import synapse.lib.queue as s_queue
 import synapse.lib.urlhelp as s_urlhelp
@@ -111,6 +115,9 @@ reqValidLdef = s_config.getJsValidator({
 WINDOW_MAXSIZE = 10_000
 MIGR_COMMIT_SIZE = 1_000
 
+# the number of index rows per database to sort in memory during a bulk load
+BULK_RUN_SIZE = 1_000_000
+
 class LayerApi(s_cell.CellApi):
 
     async def __anit__(self, core, link, user, layr):
@@ -194,7 +201,40 @@ class LayerApi(s_cell.CellApi):
         await self._reqUserAllowed(self.liftperm)
         return self.layr.iden
 
-BUID_CACHE_SIZE = 10000
+# the maximum size in bytes of packed storage nodes to cache per layer
+BUID_CACHE_SIZE = 64 * s_const.mebibyte
+
+emptysode = types.MappingProxyType({})
+
+def _freezeSode(item):
+    '''
+    Return a read-only copy of a storage node dict and the dicts nested within it.
+    '''
+    return types.MappingProxyType({k: _freezeSode(v) if isinstance(v, dict) else v for k, v in item.items()})
+
+class LazySodes:
+    '''
+    The storage nodes deferred by a lazy lift for a window of buids.
+
+    The deferred storage nodes for a layer are all read using one batch
+    the first time any of them are accessed.
+    '''
+    def __init__(self, layers):
+        self.layers = {layr.iden: layr for layr in layers}
+        self.buids = collections.defaultdict(list)
+        self.sodes = {}
+
+    def add(self, iden, buid):
+        self.buids[iden].append(buid)
+
+    def get(self, iden, buid):
+
+        sodes = self.sodes.get(iden)
+        if sodes is None:
+            buids = self.buids.pop(iden, ())
+            sodes = self.sodes[iden] = dict(zip(buids, self.layers[iden]._viewStorNodes(buids)))
+
+        return sodes.get(buid, emptysode)
 
 STOR_TYPE_UTF8 = 1
 
@@ -1404,6 +1444,56 @@ class StorTypeLatLon(StorType):
         lat = (int.from_bytes(bytz[5:], 'big') - self.latspace) / self.scale
         return (lat, lon)
 
+class _BulkIndxSpool:
+    '''
+    Accumulate index rows per database and spool them to disk as sorted runs.
+    '''
+    def __init__(self, dirn, runsize):
+        self.dirn = dirn
+        self.runsize = runsize
+        self.rows = collections.defaultdict(list)
+        self.runs = collections.defaultdict(list)
+
+    def add(self, db, lkey, lval):
+        rows = self.rows[db]
+        rows.append((lkey, lval))
+        if len(rows) >= self.runsize:
+            self._saveRun(db)
+
+    def _saveRun(self, db):
+
+        rows = self.rows.pop(db)
+        rows.sort()
+
+        path = os.path.join(self.dirn, f'{db}.{len(self.runs[db])}.mpk')
+        with open(path, 'wb') as fd:
+            for row in rows:
+                fd.write(s_msgpack.en(row))
+
+        self.runs[db].append(path)
+
+    def _iterRun(self, path):
+        with open(path, 'rb') as fd:
+            for lkey, lval in s_msgpack.iterfd(fd):
+                yield lkey, lval
+
+    def iter(self, db):
+        '''
+        Yield the unique rows for the database in sorted order.
+        '''
+        rows = self.rows.pop(db, [])
+        rows.sort()
+
+        genrs = [self._iterRun(path) for path in self.runs.get(db, ())]
+        genrs.append(iter(rows))
+
+        last = None
+        for row in heapq.merge(*genrs):
+            if row == last:
+                continue
+            last = row
+            yield row
+
 class Layer(s_nexus.Pusher):
     '''
     The base class for a cortex layer.
@@ -1505,7 +1595,7 @@ class Layer(s_nexus.Pusher):
         self.windows = []
         self.upstreamwaits = collections.defaultdict(lambda: collections.defaultdict(list))
 
-        self.buidcache = s_cache.LruDict(BUID_CACHE_SIZE)
+        self.buidcache = s_cache.ByteLruDict(BUID_CACHE_SIZE)
 
         self.onfini(self._onLayrFini)
 
@@ -1651,17 +1741,17 @@ class Layer(s_nexus.Pusher):
             self.layrslab.delete(abrv + indx, buid, db=self.byprop)
 
     def _testDelTagStor(self, buid, form, tag):
-        sode = self._getStorNode(buid)
+        sode = self._genStorNode(buid)
         sode['tags'].pop(tag, None)
         self.setSodeDirty(buid, sode, form)
 
     def _testDelPropStor(self, buid, form, prop):
-        sode = self._getStorNode(buid)
+        sode = self._genStorNode(buid)
         sode['props'].pop(prop, None)
         self.setSodeDirty(buid, sode, form)
 
     def _testDelFormValuStor(self, buid, form):
-        sode = self._getStorNode(buid)
+        sode = self._genStorNode(buid)
         sode['valu'] = None
         self.setSodeDirty(buid, sode, form)
 
@@ -2818,6 +2908,10 @@ class Layer(s_nexus.Pusher):
     async def stat(self):
         ret = {**self.layrslab.statinfo(),
                }
+
+        for name, valu in self.buidcache.stats().items():
+            ret[f'buidcache_{name}'] = valu
+
         if self.logedits:
             ret['nodeeditlog_indx'] = (self.nodeeditlog.index(), 0, 0)
         return ret
@@ -2897,8 +2991,9 @@ class Layer(s_nexus.Pusher):
         kvlist = []
 
         for buid, sode in self.dirty.items():
-            self.buidcache[buid] = sode
-            kvlist.append((buid, s_msgpack.en(sode)))
+            byts = s_msgpack.en(sode)
+            self.buidcache[buid] = byts
+            kvlist.append((buid, byts))
 
         self.layrslab._putmulti(kvlist, db=self.bybuidv3)
         self.dirty.clear()
@@ -2908,11 +3003,91 @@ class Layer(s_nexus.Pusher):
         return info.get('entries', 0)
 
     async def getStorNode(self, buid):
-        sode = self._getStorNode(buid)
+        sode = self._copyStorNode(buid)
         if sode is not None:
-            return deepcopy(sode)
+            return sode
         return {}
 
+    async def getStorNodesBatch(self, buids):
+        '''
+        Return a list of read-only storage node views for the given list of buids.
+
+        Storage nodes which are not dirty or cached are read from
+        the slab using a single cursor.
+        '''
+        return self._viewStorNodes(buids)
+
+    def _viewStorNodes(self, buids):
+        retn = []
+        todo = []
+
+        for buid in buids:
+
+            if buid in self.dirty:
+                retn.append(self._viewStorNode(buid))
+                continue
+
+            byts = self.buidcache.get(buid)
+            if byts is not None:
+                retn.append(types.MappingProxyType(s_msgpack.un(byts)))
+                continue
+
+            todo.append(len(retn))
+            retn.append(emptysode)
+
+        if todo:
+            lkeys = [buids[indx] for indx in todo]
+            for indx, lkey, byts in zip(todo, lkeys, self.layrslab.getmulti(lkeys, db=self.bybuidv3)):
+                if byts is None:
+                    continue
+
+                self.buidcache[lkey] = byts
+                retn[indx] = types.MappingProxyType(s_msgpack.un(byts))
+
+        return retn
+
+    def _viewStorNode(self, buid):
+        '''
+        Return a read-only view of the storage node for the given buid.
+
+        NOTE: Dirty storage nodes are copied into a read-only view since
+              the props/tags/tagprops dicts are modified in place by edits.
+        '''
+        sode = self.dirty.get(buid)
+        if sode is not None:
+            return _freezeSode(sode)
+
+        byts = self._getStorNodeByts(buid)
+        if byts is not None:
+            return types.MappingProxyType(s_msgpack.un(byts))
+
+    def _copyStorNode(self, buid):
+        '''
+        Return a copy of the storage node for the given buid which is safe to return outside of the Layer.
+        '''
+        sode = self.dirty.get(buid)
+        if sode is not None:
+            return deepcopy(sode)
+
+        byts = self._getStorNodeByts(buid)
+        if byts is not None:
+            return s_msgpack.un(byts)
+
+    def _getStorNodeByts(self, buid):
+        '''
+        Return the packed bytes of a clean (not dirty) storage node.
+        '''
+        byts = self.buidcache.get(buid)
+        if byts is not None:
+            return byts
+
+        byts = self.layrslab.get(buid, db=self.bybuidv3)
+        if byts is None:
+            return None
+
+        self.buidcache[buid] = byts
+        return byts
+
     def _getStorNode(self, buid):
         '''
         Return the storage node for the given buid.
@@ -2927,17 +3102,14 @@ class Layer(s_nexus.Pusher):
         if sode is not None:
             return sode
 
-        sode = self.buidcache.get(buid)
-        if sode is not None:
-            return sode
-
-        byts = self.layrslab.get(buid, db=self.bybuidv3)
+        # clean storage nodes are cached in their packed form
+        # and only unpacked into a dict when requested
+        byts = self._getStorNodeByts(buid)
         if byts is None:
             return None
 
         sode = collections.defaultdict(dict)
         sode.update(s_msgpack.un(byts))
-        self.buidcache[buid] = sode
 
         return sode
 
@@ -2948,10 +3120,7 @@ class Layer(s_nexus.Pusher):
         if sode is not None:
             return sode
 
-        sode = collections.defaultdict(dict)
-        self.buidcache[buid] = sode
-
-        return sode
+        return collections.defaultdict(dict)
 
     async def getTagCount(self, tagname, formname=None):
         '''
@@ -3067,21 +3236,56 @@ class Layer(s_nexus.Pusher):
 
             indx = lkey[abrvlen:]
             valu = stor.decodeIndx(indx)
+            if valu is s_common.novalu:
+                valu = self._getPropIndxValu(lkey, propname)
+
             if valu is not s_common.novalu:
                 yield indx, valu
-                continue
 
-            buid = self.layrslab.get(lkey, db=self.byprop)
-            if buid is not None:
-                sode = self._getStorNode(buid)
-                if sode is not None:
-                    if propname is None:
-                        valt = sode.get('valu')
-                    else:
-                        valt = sode['props'].get(propname)
+    async def iterPropValuCounts(self, formname, propname, stortype):
+        '''
+        Yield (indx, valu, count) tuples for each unique property value from the property index.
+        '''
+        try:
+            abrv = self.getPropAbrv(formname, propname)
+        except s_exc.NoSuchAbrv:
+            return
+
+        if stortype & 0x8000:
+            stortype = STOR_TYPE_MSGP
+
+        stor = self.stortypes[stortype]
+        abrvlen = len(abrv)
+
+        async for lkey, count in s_coro.pause(self.layrslab.scanKeyCountsByPref(abrv, db=self.byprop)):
+
+            indx = lkey[abrvlen:]
+            valu = stor.decodeIndx(indx)
+            if valu is s_common.novalu:
+                valu = self._getPropIndxValu(lkey, propname)
+
+            if valu is not s_common.novalu:
+                yield indx, valu, count
+
+    def _getPropIndxValu(self, lkey, propname):
+        # the index is lossy so retrieve the value from a storage node
+        buid = self.layrslab.get(lkey, db=self.byprop)
+        if buid is None:
+            return s_common.novalu
+
+        sode = self._getStorNode(buid)
+        if sode is None:
+            return s_common.novalu
 
-                    if valt is not None:
-                        yield indx, valt[0]
+        if propname is None:
+            valt = sode.get('valu')
+        else:
+            valt = sode['props'].get(propname)
+
+        if valt is None:
+            return s_common.novalu
+
+        return valt[0]
 
     async def iterPropIndxBuids(self, formname, propname, indx):
         try:
@@ -3092,6 +3296,50 @@ class Layer(s_nexus.Pusher):
         async for _, buid in s_coro.pause(self.layrslab.scanByDups(abrv + indx, db=self.byprop)):
             yield buid
 
+    async def iterPropBuids(self, formname, propname):
+        '''
+        Yield (indx, buid) tuples from the property index without loading storage nodes.
+        '''
+        try:
+            abrv = self.getPropAbrv(formname, propname)
+        except s_exc.NoSuchAbrv:
+            return
+
+        async for lkey, buid in s_coro.pause(self.layrslab.scanByPref(abrv, db=self.byprop)):
+            yield lkey[8:], buid
+
+    async def iterTagBuids(self, tag, formname=None):
+        '''
+        Yield buids from the tag index without loading storage nodes.
+
+        Note:
+            Buids are only yielded in sorted order if formname is specified.
+        '''
+        try:
+            abrv = self.tagabrv.bytsToAbrv(tag.encode())
+            if formname is not None:
+                abrv += self.getPropAbrv(formname, None)
+
+        except s_exc.NoSuchAbrv:
+            return
+
+        async for _, buid in s_coro.pause(self.layrslab.scanByPref(abrv, db=self.bytag)):
+            yield buid
+
+    def hasNodeBuid(self, buid):
+        '''
+        Return True if the layer contains the node (not only edits to it) for the given buid.
+        '''
+        sode = self.dirty.get(buid)
+        if sode is not None:
+            return sode.get('valu') is not None
+
+        byts = self._getStorNodeByts(buid)
+        if byts is None:
+            return False
+
+        return s_msgpack.un(byts).get('valu') is not None
+
     async def liftByTag(self, tag, form=None, reverse=False):
 
         try:
@@ -3109,12 +3357,12 @@ class Layer(s_nexus.Pusher):
 
         for lkey, buid in scan(abrv, db=self.bytag):
 
-            sode = self._getStorNode(buid)
+            sode = self._viewStorNode(buid)
             if sode is None: # pragma: no cover
                 # logger.warning(f'TagIndex for #{tag} has {s_common.ehex(buid)} but no storage node.')
                 continue
 
-            yield None, buid, deepcopy(sode)
+            yield None, buid, sode
 
     async def liftByTags(self, tags):
         # todo: support form and reverse kwargs
@@ -3139,11 +3387,11 @@ class Layer(s_nexus.Pusher):
 
             lastbuid = buid
 
-            sode = self._getStorNode(buid)
+            sode = self._viewStorNode(buid)
             if sode is None: # pragma: no cover
                 continue
 
-            yield None, buid, deepcopy(sode)
+            yield None, buid, sode
 
     async def liftByTagValu(self, tag, cmpr, valu, form=None, reverse=False):
 
@@ -3168,11 +3416,11 @@ class Layer(s_nexus.Pusher):
             # filter based on the ival value before lifting the node...
             valu = await self.getNodeTag(buid, tag)
             if filt(valu):
-                sode = self._getStorNode(buid)
+                sode = self._viewStorNode(buid)
                 if sode is None: # pragma: no cover
                     # logger.warning(f'TagValuIndex for #{tag} has {s_common.ehex(buid)} but no storage node.')
                     continue
-                yield None, buid, deepcopy(sode)
+                yield None, buid, sode
 
     async def hasTagProp(self, name):
         async for _ in self.liftTagProp(name):
@@ -3217,12 +3465,12 @@ class Layer(s_nexus.Pusher):
 
         for lkey, buid in scan(abrv, db=self.bytagprop):
 
-            sode = self._getStorNode(buid)
+            sode = self._viewStorNode(buid)
             if sode is None: # pragma: no cover
                 # logger.warning(f'TagPropIndex for {form}#{tag}:{prop} has {s_common.ehex(buid)} but no storage node.')
                 continue
 
-            yield lkey[8:], buid, deepcopy(sode)
+            yield lkey[8:], buid, sode
 
     async def liftByTagPropValu(self, form, tag, prop, cmprvals, reverse=False):
         '''
@@ -3232,12 +3480,12 @@ class Layer(s_nexus.Pusher):
 
             async for lkey, buid in self.stortypes[kind].indxByTagProp(form, tag, prop, cmpr, valu, reverse=reverse):
 
-                sode = self._getStorNode(buid)
+                sode = self._viewStorNode(buid)
                 if sode is None: # pragma: no cover
                     # logger.warning(f'TagPropValuIndex for {form}#{tag}:{prop} has {s_common.ehex(buid)} but no storage node.')
                     continue
 
-                yield lkey[8:], buid, deepcopy(sode)
+                yield lkey[8:], buid, sode
 
     async def liftByProp(self, form, prop, reverse=False):
 
@@ -3253,11 +3501,11 @@ class Layer(s_nexus.Pusher):
             scan = self.layrslab.scanByPref
 
         for lkey, buid in scan(abrv, db=self.byprop):
-            sode = self._getStorNode(buid)
+            sode = self._viewStorNode(buid)
             if sode is None: # pragma: no cover
                 # logger.warning(f'PropIndex for {form}:{prop} has {s_common.ehex(buid)} but no storage node.')
                 continue
-            yield lkey[8:], buid, deepcopy(sode)
+            yield lkey[8:], buid, sode
 
     # NOTE: form vs prop valu lifting is differentiated to allow merge sort
     async def liftByFormValu(self, form, cmprvals, reverse=False):
@@ -3267,11 +3515,11 @@ class Layer(s_nexus.Pusher):
                 kind = STOR_TYPE_MSGP
 
             async for lkey, buid in self.stortypes[kind].indxByForm(form, cmpr, valu, reverse=reverse):
-                sode = self._getStorNode(buid)
+                sode = self._viewStorNode(buid)
                 if sode is None: # pragma: no cover
                     # logger.warning(f'FormValuIndex for {form} has {s_common.ehex(buid)} but no storage node.')
                     continue
-                yield lkey[8:], buid, deepcopy(sode)
+                yield lkey[8:], buid, sode
 
     async def liftByPropValu(self, form, prop, cmprvals, reverse=False):
         for cmpr, valu, kind in cmprvals:
@@ -3281,21 +3529,21 @@ class Layer(s_nexus.Pusher):
 
             async for lkey, buid in self.stortypes[kind].indxByProp(form, prop, cmpr, valu, reverse=reverse):
 
-                sode = self._getStorNode(buid)
+                sode = self._viewStorNode(buid)
                 if sode is None: # pragma: no cover
                     # logger.warning(f'PropValuIndex for {form}:{prop} has {s_common.ehex(buid)} but no storage node.')
                     continue
 
-                yield lkey[8:], buid, deepcopy(sode)
+                yield lkey[8:], buid, sode
 
     async def liftByPropArray(self, form, prop, cmprvals, reverse=False):
         for cmpr, valu, kind in cmprvals:
             async for lkey, buid in self.stortypes[kind].indxByPropArray(form, prop, cmpr, valu, reverse=reverse):
-                sode = self._getStorNode(buid)
+                sode = self._viewStorNode(buid)
                 if sode is None: # pragma: no cover
                     # logger.warning(f'PropArrayIndex for {form}:{prop} has {s_common.ehex(buid)} but no storage node.')
                     continue
-                yield lkey[8:], buid, deepcopy(sode)
+                yield lkey[8:], buid, sode
 
     async def liftByDataName(self, name):
         try:
@@ -3306,19 +3554,17 @@ class Layer(s_nexus.Pusher):
 
         for abrv, buid in self.dataslab.scanByDups(abrv, db=self.dataname):
 
-            sode = self._getStorNode(buid)
+            sode = self._viewStorNode(buid)
             if sode is None: # pragma: no cover
                 # logger.warning(f'PropArrayIndex for {form}:{prop} has {s_common.ehex(buid)} but no storage node.')
                 continue
 
-            sode = deepcopy(sode)
-
             byts = self.dataslab.get(buid + abrv, db=self.nodedata)
             if byts is None:
                 # logger.warning(f'NodeData for {name} has {s_common.ehex(buid)} but no data.')
                 continue
 
-            sode['nodedata'] = {name: s_msgpack.un(byts)}
+            sode = types.MappingProxyType({**sode, 'nodedata': {name: s_msgpack.un(byts)}})
             yield None, buid, sode
 
     async def storNodeEdits(self, nodeedits, meta):
@@ -3381,6 +3627,10 @@ class Layer(s_nexus.Pusher):
         Returns:
             List[Tuple[buid, form, edits]]  Same list, but with only the edits actually applied (plus the old value)
         '''
+        # wait for any commits from the writer threads without blocking the loop
+        await self.layrslab.waitCommit()
+        await self.dataslab.waitCommit()
+
         edited = False
 
         # use/abuse python's dict ordering behavior
@@ -3391,11 +3641,10 @@ class Layer(s_nexus.Pusher):
 
             buid, form, edits = nodeedits.popleft()
 
-            sode = self._genStorNode(buid)
-
             changes = []
             for edit in edits:
 
+                sode = self._genStorNode(buid)
                 delt = await self.editors[edit[0]](buid, form, edit, sode, meta)
                 if delt and edit[2]:
                     nodeedits.extend(edit[2])
@@ -3468,6 +3717,272 @@ class Layer(s_nexus.Pusher):
         self._reqNotReadOnly()
         await self._push('edits', nodeedits, meta)
 
+    async def bulkLoad(self, nodeedits, meta=None, runsize=BULK_RUN_SIZE):
+        '''
+        Load node edits into an empty layer, building the indexes from sorted batches.
+
+        Args:
+            nodeedits: A generator or async generator of (buid, form, edits) tuples.
+            meta (dict): Edit metadata. The "time" key is used for node creation times.
+            runsize (int): The number of index rows per database to sort in memory before spooling to disk.
+
+        Notes:
+            Only node, property, tag, tag property, node data, and edge additions are supported.
+            The edits are not saved to the Nexus or the layer edit log, so this API should only
+            be used to populate a new layer before it is in use or mirrored.
+
+        Returns:
+            dict: A dictionary of node and index row counts and any verification errors.
+        '''
+        self._reqNotReadOnly()
+
+        if meta is None:
+            meta = {}
+
+        for db in self._getBulkIndxDbs():
+            if self.layrslab.stat(db=db).get('entries'):
+                mesg = f'Bulk loading requires an empty layer: {self.iden}'
+                raise s_exc.BadState(mesg=mesg)
+
+        if self.getStorNodeCount() or self.dirty:
+            mesg = f'Bulk loading requires an empty layer: {self.iden}'
+            raise s_exc.BadState(mesg=mesg)
+
+        logger.warning(f'Bulk loading node edits into layer {self.iden}')
+
+        todo = collections.deque()
+        async for nodeedit in s_coro.agen(nodeedits):
+
+            todo.append(nodeedit)
+            while todo:
+
+                buid, form, edits = todo.popleft()
+                for edit in edits:
+
+                    sode = self._genStorNode(buid)
+                    await self._bulkEditSode(buid, form, edit, sode, meta)
+
+                    if edit[2]:
+                        todo.extend(edit[2])
+
+            await asyncio.sleep(0)
+
+        await self._saveDirtySodes()
+
+        logger.warning('...building indexes')
+
+        formcounts = collections.defaultdict(int)
+
+        tmpdir = s_common.gendir(self.core.dirn, 'tmp')
+        with tempfile.TemporaryDirectory(dir=tmpdir, prefix='bulkload_') as dirn:
+
+            spool = _BulkIndxSpool(dirn, runsize)
+
+            for buid, byts in self.layrslab.scanByFull(db=self.bybuidv3):
+
+                sode = s_msgpack.un(byts)
+                if sode.get('valu') is not None:
+                    formcounts[sode.get('form')] += 1
+
+                for db, lkey, lval in self._iterBulkIndxRows(buid, sode):
+                    spool.add(db, lkey, lval)
+
+                await asyncio.sleep(0)
+
+            rows = {}
+            for db in self._getBulkIndxDbs():
+                rows[db] = await self._bulkPutRows(spool.iter(db), db)
+
+        for form, count in formcounts.items():
+            self.formcounts.set(form, count)
+
+        logger.warning('...verifying layer')
+
+        errors = []
+        for db, count in rows.items():
+            entries = self.layrslab.stat(db=db).get('entries')
+            if entries != count:
+                errors.append(('BulkIndexCount', {'db': db, 'rows': count, 'entries': entries}))
+
+        async for error in self.verify():
+            errors.append(error)
+
+        nodes = sum(formcounts.values())
+        logger.warning(f'...bulk load complete! ({nodes} nodes, {len(errors)} errors)')
+
+        return {
+            'nodes': nodes,
+            'sodes': self.getStorNodeCount(),
+            'rows': rows,
+            'errors': errors,
+        }
+
+    async def _bulkPutRows(self, rows, db):
+
+        # py-lmdb does not expose MDB_APPENDDUP, so only the first row for each key may be appended
+        count = 0
+        batch = []
+        append = True
+        lastkey = None
+
+        for lkey, lval in rows:
+
+            isnew = lkey != lastkey
+            lastkey = lkey
+
+            if batch and (isnew != append or len(batch) >= MIGR_COMMIT_SIZE):
+                self.layrslab._putmulti(batch, append=append, db=db)
+                batch = []
+
+            if not batch:
+                append = isnew
+
+            batch.append((lkey, lval))
+
+            count += 1
+            if count % MIGR_COMMIT_SIZE == 0:
+                await asyncio.sleep(0)
+
+        if batch:
+            self.layrslab._putmulti(batch, append=append, db=db)
+
+        return count
+
+    def _getBulkIndxDbs(self):
+        return (self.byform, self.byprop, self.byarray, self.bytag, self.bytagprop, self.byndef)
+
+    async def _bulkEditSode(self, buid, form, edit, sode, meta):
+
+        etyp = edit[0]
+
+        if etyp == EDIT_NODE_ADD:
+            sode['valu'] = edit[1]
+            tick = meta.get('time')
+            if tick is None:
+                tick = s_common.now()
+            self._bulkSetSodeValu(sode['props'], '.created', tick, STOR_TYPE_MINTIME)
+
+        elif etyp == EDIT_PROP_SET:
+            prop, valu, oldv, stortype = edit[1]
+            self._bulkSetSodeValu(sode['props'], prop, valu, stortype)
+
+        elif etyp == EDIT_TAG_SET:
+            tag, valu, oldv = edit[1]
+            oldv = sode['tags'].get(tag)
+            if oldv is not None and oldv != (None, None) and valu != (None, None):
+                valu = (min(oldv[0], valu[0]), max(oldv[1], valu[1]))
+            sode['tags'][tag] = valu
+
+        elif etyp == EDIT_TAGPROP_SET:
+            tag, prop, valu, oldv, stortype = edit[1]
+            if tag not in sode['tagprops']:
+                sode['tagprops'][tag] = {}
+            self._bulkSetSodeValu(sode['tagprops'][tag], prop, valu, stortype)
+
+        elif etyp in (EDIT_NODEDATA_SET, EDIT_EDGE_ADD):
+            # setting the form first prevents the editor from adding to the byform index
+            self.setSodeDirty(buid, sode, form)
+            await self.editors[etyp](buid, form, edit, sode, meta)
+            return
+
+        else:
+            mesg = f'Bulk loading does not support edit type: {etyp}'
+            raise s_exc.BadArg(mesg=mesg, etyp=etyp)
+
+        self.setSodeDirty(buid, sode, form)
+
+    def _bulkSetSodeValu(self, valus, name, valu, stortype):
+
+        oldv, oldt = valus.get(name, (None, None))
+        if oldv is not None:
+
+            if stortype == STOR_TYPE_IVAL:
+                valu = (min(*oldv, *valu), max(*oldv, *valu))
+
+            elif stortype == STOR_TYPE_MINTIME:
+                valu = min(valu, oldv)
+
+            elif stortype == STOR_TYPE_MAXTIME:
+                valu = max(valu, oldv)
+
+        valus[name] = (valu, stortype)
+
+    def _iterBulkIndxRows(self, buid, sode):
+        '''
+        Yield the (db, lkey, lval) index rows for a storage node.
+        '''
+        form = sode.get('form')
+        if form is None:  # pragma: no cover
+            return
+
+        formabrv = self.setPropAbrv(form, None)
+        yield self.byform, formabrv, buid
+
+        valt = sode.get('valu')
+        if valt is not None:
+
+            valu, stortype = valt
+            if stortype & STOR_FLAG_ARRAY:
+
+                for indx in self.getStorIndx(stortype, valu):
+                    yield self.byarray, formabrv + indx, buid
+
+                for indx in self.getStorIndx(STOR_TYPE_MSGP, valu):
+                    yield self.byprop, formabrv + indx, buid
+
+            else:
+                for indx in self.getStorIndx(stortype, valu):
+                    yield self.byprop, formabrv + indx, buid
+
+        for prop, (valu, stortype) in sode.get('props', {}).items():
+
+            abrv = self.setPropAbrv(form, prop)
+            univabrv = None
+
+            if prop[0] == '.':
+                univabrv = self.setPropAbrv(None, prop)
+
+            if stortype & STOR_FLAG_ARRAY:
+
+                realtype = stortype & 0x7fff
+
+                for indx in self.getStorIndx(stortype, valu):
+                    yield self.byarray, abrv + indx, buid
+                    if univabrv is not None:
+                        yield self.byarray, univabrv + indx, buid
+
+                    if realtype == STOR_TYPE_NDEF:
+                        yield self.byndef, indx, buid + abrv
+
+                for indx in self.getStorIndx(STOR_TYPE_MSGP, valu):
+                    yield self.byprop, abrv + indx, buid
+                    if univabrv is not None:
+                        yield self.byprop, univabrv + indx, buid
+
+            else:
+
+                for indx in self.getStorIndx(stortype, valu):
+                    yield self.byprop, abrv + indx, buid
+                    if univabrv is not None:
+                        yield self.byprop, univabrv + indx, buid
+
+                    if stortype == STOR_TYPE_NDEF:
+                        yield self.byndef, indx, buid + abrv
+
+        for tag in sode.get('tags', {}).keys():
+            tagabrv = self.tagabrv.setBytsToAbrv(tag.encode())
+            yield self.bytag, tagabrv + formabrv, buid
+
+        for tag, props in sode.get('tagprops', {}).items():
+            for prop, (valu, stortype) in props.items():
+
+                tp_abrv = self.setTagPropAbrv(None, tag, prop)
+                ftp_abrv = self.setTagPropAbrv(form, tag, prop)
+
+                for indx in self.getStorIndx(stortype, valu):
+                    yield self.bytagprop, tp_abrv + indx, buid
+                    yield self.bytagprop, ftp_abrv + indx, buid
+
     async def _editNodeAdd(self, buid, form, edit, sode, meta):
 
         valt = edit[1]
@@ -4342,13 +4857,21 @@ class Layer(s_nexus.Pusher):
                                 perm = perm_tags + key
                                 user.confirm(perm, gateiden=gateiden)
 
-    async def iterLayerNodeEdits(self):
+    async def iterLayerNodeEdits(self, startbuid=None):
         '''
         Scan the full layer and yield artificial sets of nodeedits.
+
+        Args:
+            startbuid (bytes): Optional buid to begin the scan from (inclusive).
         '''
         await self._saveDirtySodes()
 
-        for buid, byts in self.layrslab.scanByFull(db=self.bybuidv3):
+        if startbuid is None:
+            genr = self.layrslab.scanByFull(db=self.bybuidv3)
+        else:
+            genr = self.layrslab.scanByRange(startbuid, db=self.bybuidv3)
+
+        for buid, byts in genr:
 
             sode = s_msgpack.un(byts)
 
@@ -234,19 +234,80 @@ class Link(s_base.Base):
         '''
         return dict(self._addrinfo)
 
+    async def _write(self, byts):
+        # the caller must hold the _txlock
+        size = len(byts)
+        if size <= MAXWRITE:
+            self.writer.write(byts)
+            await self.writer.drain()
+            return
+
+        # memoryview slices do not copy the large message
+        view = memoryview(byts)
+        for offs in range(0, size, MAXWRITE):
+            self.writer.write(view[offs:offs + MAXWRITE])
+            await self.writer.drain()
+
     async def send(self, byts):
 
-        offs = 0
-        size = len(byts)
+        async with self._txlock:
+            await self._write(byts)
+
+    async def sendv(self, frames):
+        '''
+        Send a list of pre-encoded frames to the link.
+
+        Args:
+            frames (list): A list of bytes objects to send in order.
+
+        Notes:
+            Frames are handed to the transport together, up to MAXWRITE bytes
+            at a time, to avoid joining them into a single bytes object.
+        '''
+        if self.isfini:
+            raise s_exc.IsFini()
 
         async with self._txlock:
 
-            while offs < size:
+            try:
+
+                size = 0
+                todo = []
+
+                for byts in frames:
+
+                    if len(byts) > MAXWRITE:
+
+                        if todo:
+                            self.writer.writelines(todo)
+                            await self.writer.drain()
+                            todo.clear()
+                            size = 0
+
+                        await self._write(byts)
+                        continue
+
+                    if size + len(byts) > MAXWRITE:
+                        self.writer.writelines(todo)
+                        await self.writer.drain()
+                        todo.clear()
+                        size = 0
 
-                self.writer.write(byts[offs:offs + MAXWRITE])
-                offs += MAXWRITE
+                    todo.append(byts)
+                    size += len(byts)
 
-                await self.writer.drain()
+                if todo:
+                    self.writer.writelines(todo)
+                    await self.writer.drain()
+
+            except (asyncio.CancelledError, Exception) as e:
+
+                await self.fini()
+
+                einfo = s_common.retnexc(e)
+                logger.debug('link.sendv connection trouble %s', einfo)
+
+                raise
 
     async def tx(self, mesg):
         '''
@@ -255,20 +316,12 @@ class Link(s_base.Base):
         if self.isfini:
             raise s_exc.IsFini()
 
-        offs = 0
         byts = s_msgpack.en(mesg)
-        size = len(byts)
 
         async with self._txlock:
 
             try:
-
-                while offs < size:
-
-                    self.writer.write(byts[offs:offs + MAXWRITE])
-                    offs += MAXWRITE
-
-                    await self.writer.drain()
+                await self._write(byts)
 
             except (asyncio.CancelledError, Exception) as e:
 
@@ -286,16 +339,25 @@ class Link(s_base.Base):
         return await self.reader.read(size)
 
     async def recvsize(self, size):
-        byts = b''
-        while size:
+        '''
+        Receive exactly size bytes from the link.
+
+        Returns:
+            bytearray: The received bytes or None if the link was closed.
+        '''
+        offs = 0
+        byts = bytearray(size)
+        view = memoryview(byts)
+
+        while offs < size:
 
-            recv = await self.reader.read(size)
+            recv = await self.reader.read(size - offs)
             if not recv:
                 await self.fini()
                 return None
 
-            size -= len(recv)
-            byts += recv
+            view[offs:offs + len(recv)] = recv
+            offs += len(recv)
 
         return byts
 
@@ -1,8 +1,10 @@
 import os
+import bisect
 import shutil
 import asyncio
 import threading
 import collections
+import concurrent.futures
 
 import logging
 logger = logging.getLogger(__name__)
@@ -434,6 +436,7 @@ class HotCount(HotKeyVal):
         byts = name.encode()
         self.cache[byts] += valu
         self.dirty.add(byts)
+        self.slab.dirty = True
 
     def set(self, name: str, valu):
         byts = name.encode()
@@ -531,6 +534,8 @@ class MultiQueue(s_base.Base):
         '''
         Pop a single entry from the named queue by offset.
         '''
+        await self.slab.waitCommit()
+
         abrv = self.abrv.nameToAbrv(name)
         byts = self.slab.pop(abrv + s_common.int64en(offs), db=self.qdata)
         if byts is not None:
@@ -542,6 +547,8 @@ class MultiQueue(s_base.Base):
 
     async def puts(self, name, items, reqid=None):
 
+        await self.slab.waitCommit()
+
         if self.queues.get(name) is None:
             mesg = f'No queue named {name}.'
             raise s_exc.NoSuchName(mesg=mesg, name=name)
@@ -575,6 +582,7 @@ class MultiQueue(s_base.Base):
         '''
         Yield (offs, item) tuples from the message queue.
         '''
+        await self.slab.waitCommit()
 
         if self.queues.get(name) is None:
             mesg = f'No queue named {name}.'
@@ -589,6 +597,8 @@ class MultiQueue(s_base.Base):
 
         while not self.slab.isfini:
 
+            await self.slab.waitCommit()
+
             indx = s_common.int64en(offs)
 
             for lkey, lval in self.slab.scanByRange(abrv + indx, abrv + int64max, db=self.qdata):
@@ -615,6 +625,8 @@ class MultiQueue(s_base.Base):
         '''
         Remove up-to (and including) the queue entry at offs.
         '''
+        await self.slab.waitCommit()
+
         if self.queues.get(name) is None:
             mesg = f'No queue named {name}.'
             raise s_exc.NoSuchName(mesg=mesg, name=name)
@@ -635,6 +647,8 @@ class MultiQueue(s_base.Base):
         '''
         Remove queue entries from minoffs, up-to (and including) the queue entry at maxoffs.
         '''
+        await self.slab.waitCommit()
+
         if self.queues.get(name) is None:
             mesg = f'No queue named {name}.'
             raise s_exc.NoSuchName(mesg=mesg, name=name)
@@ -656,6 +670,8 @@ class MultiQueue(s_base.Base):
         '''
         Overwrite queue entries with the values in items, starting at offs.
         '''
+        await self.slab.waitCommit()
+
         if self.queues.get(name) is None:
             mesg = f'No queue named {name}.'
             raise s_exc.NoSuchName(mesg=mesg, name=name)
@@ -777,6 +793,12 @@ class Slab(s_base.Base):
     # warn if commit takes too long
     WARN_COMMIT_TIME_MS = int(float(os.environ.get('SYN_SLAB_COMMIT_WARN', '1.0')) * 1000)
 
+    # commit transactions from a dedicated writer thread rather than the loop thread
+    ASYNC_COMMIT = s_common.envbool('SYN_SLAB_ASYNC_COMMIT')
+
+    # upper bounds (in milliseconds) of the commit latency histogram buckets
+    COMMIT_HIST_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
     DEFAULT_MAPSIZE = s_const.gibibyte
     DEFAULT_GROWSIZE = None
 
@@ -840,7 +862,8 @@ class Slab(s_base.Base):
                 'maxsize': slab.maxsize,
                 'growsize': slab.growsize,
                 'mapasync': True,
-
+                'asynccommit': slab.writer is not None,
+                'commithist': slab.getCommitHist(),
             })
         return retn
 
@@ -892,6 +915,7 @@ class Slab(s_base.Base):
         self.readonly = opts.get('readonly', False)
         self.readahead = opts.get('readahead', True)
         self.lockmemory = opts.pop('lockmemory', False)
+        self.asynccommit = opts.pop('asynccommit', self.ASYNC_COMMIT)
 
         if self.lockmemory:
             lockmem_override = s_common.envbool('SYN_LOCKMEM_DISABLE')
@@ -920,6 +944,14 @@ class Slab(s_base.Base):
 
         self.scans = set()
 
+        # LMDB requires that the thread which begins a write transaction also ends it
+        self.writer = None
+        self.commitfut = None
+        if self.asynccommit and not self.readonly:
+            self.writer = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='slabcommit')
+
+        self._xact = None
+
         self.dirty = False
         if self.readonly:
             self.xact = None
@@ -953,6 +985,7 @@ class Slab(s_base.Base):
         self.onfini(self._onSlabFini)
 
         self.commitstats = collections.deque(maxlen=1000)  # stores Tuple[time, replayloglen, commit time delta]
+        self.commithist = [0] * (len(self.COMMIT_HIST_BUCKETS) + 1)
 
         if not self.readonly:
             await Slab.initSyncLoop(self)
@@ -960,6 +993,27 @@ class Slab(s_base.Base):
     def __repr__(self):
         return 'Slab: %r' % (self.path,)
 
+    @property
+    def xact(self):
+        # wait for any commit which is still running in the writer thread
+        while self.commitfut is not None:
+            self._waitCommit()
+        return self._xact
+
+    @xact.setter
+    def xact(self, xact):
+        self._xact = xact
+
+    def getCommitHist(self):
+        '''
+        Get the commit latency histogram for the Slab.
+
+        Returns:
+            list: A list of (maxms, count) tuples. The last bucket has a maxms of None.
+        '''
+        maxs = self.COMMIT_HIST_BUCKETS + (None,)
+        return list(zip(maxs, self.commithist))
+
     async def trash(self):
         '''
         Deletes underlying storage
@@ -1045,6 +1099,23 @@ class Slab(s_base.Base):
             self._handle_mapfull()
             # There's no need to re-try self.forcecommit as _growMapSize does it
 
+        # yield to the loop while the writer thread commits
+        await self.waitCommit()
+
+    async def waitCommit(self):
+        '''
+        Wait for a commit running in the writer thread without blocking the loop.
+
+        Notes:
+            Accessing the transaction while a commit is running blocks the loop
+            until the commit completes, so async callers should use this first.
+        '''
+        while self.commitfut is not None:
+            futu = self.commitfut[0]
+            await asyncio.wait((asyncio.wrap_future(futu),))
+            if self.commitfut is not None and self.commitfut[0] is futu:
+                self._waitCommit()
+
     async def fini(self):
         await self.fire('commit')
         return await s_base.Base.fini(self)
@@ -1054,12 +1125,15 @@ class Slab(s_base.Base):
 
         while True:
             try:
-                self._finiCoXact()
+                self._finiCoXact(wait=True)
             except lmdb.MapFullError:
                 self._handle_mapfull()
                 continue
             break
 
+        if self.writer is not None:
+            self.writer.shutdown()
+
         self.dirty = False
         self.lenv.close()
         self.allslabs.pop(self.path, None)
@@ -1071,7 +1145,7 @@ class Slab(s_base.Base):
             self.__class__.synctask = None
             self.__class__.syncevnt = None
 
-    def _finiCoXact(self):
+    def _finiCoXact(self, wait=False):
         '''
         Note:
             This method may raise a MapFullError
@@ -1085,13 +1159,89 @@ class Slab(s_base.Base):
         if self.xact is None:
             return
 
-        self.xact.commit()
+        if self.writer is not None and not wait:
+            # the loop continues until the next access to the transaction
+            xact, self._xact = self._xact, None
+            futu = self.writer.submit(self._commitXact, xact)
+            self.commitfut = (futu, s_common.now(), len(self.xactops))
+            self.dirty = False
+            return
+
+        self._runInWriter(self.xact.commit)
 
         self.xactops.clear()
 
-        del self.xact
         self.xact = None
 
+    def _commitXact(self, xact):
+        # runs in the writer thread
+        starttime = s_common.now()
+        xact.commit()
+        delta = s_common.now() - starttime
+
+        # begin the next transaction here rather than in another round trip from the loop
+        try:
+            return delta, self.lenv.begin(write=True)
+        except lmdb.MapResizedError:
+            return delta, None
+
+    def _waitCommit(self):
+        '''
+        Wait for the commit running in the writer thread and begin a new transaction.
+        '''
+        futu, starttime, xactopslen = self.commitfut
+        self.commitfut = None
+
+        # the caller may have already marked the slab as dirty and logged an operation
+        dirty = self.dirty
+
+        try:
+            delta, xact = futu.result()
+
+        except lmdb.MapFullError:
+            # the failed commit was aborted so we replay it into a new transaction
+            pending = self.xactops[xactopslen:]
+            del self.xactops[xactopslen:]
+
+            self._initCoXact()
+            self._handle_mapfull()
+
+            self.xactops.extend(pending)
+            self.dirty = self.dirty or dirty
+            return
+
+        del self.xactops[:xactopslen]
+        self._addCommitStats(starttime, xactopslen, delta)
+
+        if xact is None:
+            self._initCoXact()
+        else:
+            self.xact = xact
+
+        self.dirty = dirty
+
+    def _addCommitStats(self, starttime, xactopslen, delta):
+
+        self.commitstats.append((starttime, xactopslen, delta))
+        self.commithist[bisect.bisect_left(self.COMMIT_HIST_BUCKETS, delta)] += 1
+
+        if self.WARN_COMMIT_TIME_MS and delta > self.WARN_COMMIT_TIME_MS:
+
+            extra = {
+                'delta': delta,
+                'path': self.path,
+                'sysctls': s_thisplat.getSysctls(),
+                'xactopslen': xactopslen,
+            }
+
+            mesg = f'Commit with {xactopslen} items in {self!r} took {delta} ms - performance may be degraded.'
+            logger.warning(mesg, extra={'synapse': extra})
+
+    def _runInWriter(self, func, *args, **kwargs):
+        if self.writer is None:
+            return func(*args, **kwargs)
+        return self.writer.submit(func, *args, **kwargs).result()
+
     def addResizeCallback(self, callback):
         self.resizecallbacks.append(callback)
 
@@ -1252,7 +1402,7 @@ class Slab(s_base.Base):
                     db = self.lenv.open_db(name.encode('utf8'), txn=self.xact, dupsort=dupsort, integerkey=integerkey,
                                            dupfixed=dupfixed)
                     self.dirty = True
-                    self.forcecommit()
+                    self.forcecommit(wait=True)
 
                 self.dbnames[name] = (db, dupsort)
                 return name
@@ -1280,7 +1430,7 @@ class Slab(s_base.Base):
 
                 self.dirty = True
                 self.xact.drop(db, delete=True)
-                self.forcecommit()
+                self.forcecommit(wait=True)
                 return
 
             except lmdb.MapFullError:
@@ -1301,6 +1451,24 @@ class Slab(s_base.Base):
         finally:
             self._relXactForReading()
 
+    def getmulti(self, lkeys, db=None):
+        '''
+        Return a list of values (or None) for the given keys using a single cursor.
+        '''
+        self._acqXactForReading()
+        realdb, dupsort = self.dbnames[db]
+        try:
+            retn = []
+            with self.xact.cursor(db=realdb) as curs:
+                for lkey in lkeys:
+                    if curs.set_key(lkey):
+                        retn.append(curs.value())
+                    else:
+                        retn.append(None)
+            return retn
+        finally:
+            self._relXactForReading()
+
     def last(self, db=None):
         '''
         Return the last key/value pair from the given db.
@@ -1428,6 +1596,23 @@ class Slab(s_base.Base):
 
                 yield lkey
 
+    def scanKeyCountsByPref(self, byts, db=None):
+        '''
+        Yield (lkey, count) tuples for each unique key with the matching prefix bytes.
+        '''
+        with ScanKeys(self, db, nodup=True) as scan:
+
+            if not scan.set_range(byts):
+                return
+
+            size = len(byts)
+            for lkey in scan.iternext():
+
+                if lkey[:size] != byts:
+                    return
+
+                yield lkey, scan.curs.count()
+
     async def countByPref(self, byts, db=None, maxsize=None):
         '''
         Return the number of rows in the given db with the matching prefix bytes.
@@ -1584,13 +1769,13 @@ class Slab(s_base.Base):
 
     def _initCoXact(self):
         try:
-            self.xact = self.lenv.begin(write=not self.readonly)
+            self.xact = self._runInWriter(self.lenv.begin, write=not self.readonly)
         except lmdb.MapResizedError:
             # This is what happens when some *other* process increased the mapsize.  setting mapsize to 0 should
             # set my mapsize to whatever the other process raised it to
             self.lenv.set_mapsize(0)
             self.mapsize = self.lenv.info()['map_size']
-            self.xact = self.lenv.begin(write=not self.readonly)
+            self.xact = self._runInWriter(self.lenv.begin, write=not self.readonly)
         self.dirty = False
 
     def _logXactOper(self, func, *args, **kwargs):
@@ -1611,20 +1796,19 @@ class Slab(s_base.Base):
 
         while True:
             try:
-                self.xact.abort()
+                self._runInWriter(self.xact.abort)
 
-                del self.xact
                 self.xact = None  # Note: it is possible for us to be fini'd in _growMapSize
 
                 self._growMapSize()
 
-                self.xact = self.lenv.begin(write=not self.readonly)
+                self.xact = self._runInWriter(self.lenv.begin, write=not self.readonly)
 
                 self.recovering = True
                 self.last_retn = self._runXactOpers()
                 self.recovering = False
 
-                self.forcecommit()
+                self.forcecommit(wait=True)
 
             except lmdb.MapFullError:
                 continue
@@ -1653,6 +1837,8 @@ class Slab(s_base.Base):
 
     async def putmulti(self, kvpairs, dupdata=False, append=False, db=None):
 
+        await self.waitCommit()
+
         # Use a fast path when we have a small amount of data to prevent creating new
         # list objects when we don't have to.
         if isinstance(kvpairs, (list, tuple)) and len(kvpairs) <= self.max_xactops_len:
@@ -1666,6 +1852,7 @@ class Slab(s_base.Base):
         # could cause a greedy commit operation from happening.
         consumed, added = 0, 0
         for chunk in s_common.chunks(kvpairs, self.max_xactops_len):
+            await self.waitCommit()
             rc, ra = self._putmulti(chunk, dupdata=dupdata, append=append, db=db)
             consumed = consumed + rc
             added = added + ra
@@ -1775,8 +1962,11 @@ class Slab(s_base.Base):
         '''
         return self._xact_action(self.replace, lmdb.Transaction.replace, lkey, lval, db=db)
 
-    def forcecommit(self):
+    def forcecommit(self, wait=False):
         '''
+        Args:
+            wait (bool): Complete the commit before returning when using a writer thread.
+
         Note:
             This method may raise a MapFullError
         '''
@@ -1787,24 +1977,15 @@ class Slab(s_base.Base):
 
         # ok... lets commit and re-open
         starttime = s_common.now()
-        self._finiCoXact()
-        donetime = s_common.now()
-
-        delta = donetime - starttime
+        self._finiCoXact(wait=wait)
 
-        self.commitstats.append((starttime, xactopslen, delta))
-
-        if self.WARN_COMMIT_TIME_MS and delta > self.WARN_COMMIT_TIME_MS:
+        # the next transaction begins once the writer thread completes the commit
+        if self.commitfut is not None:
+            return True
 
-            extra = {
-                'delta': delta,
-                'path': self.path,
-                'sysctls': s_thisplat.getSysctls(),
-                'xactopslen': xactopslen,
-            }
+        donetime = s_common.now()
 
-            mesg = f'Commit with {xactopslen} items in {self!r} took {delta} ms - performance may be degraded.'
-            logger.warning(mesg, extra={'synapse': extra})
+        self._addCommitStats(starttime, xactopslen, donetime - starttime)
 
         self._initCoXact()
         return True
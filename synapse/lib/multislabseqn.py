@@ -353,7 +353,9 @@ class MultiSlabSeqn(s_base.Base):
         else:
             indx = self.indx
 
-        assert self.tailseqn
+        assert self.tailseqn and self.tailslab
+        await self.tailslab.waitCommit()
+
         retn = self.tailseqn.add(item, indx=indx)
 
         if advances:
@@ -363,6 +365,36 @@ class MultiSlabSeqn(s_base.Base):
 
         return retn
 
+    async def save(self, items: List[Any]) -> int:
+        '''
+        Add a list of items to the end of the sequence with a single write.
+
+        Returns:
+            The index of the first item.
+        '''
+        info = await self.saveInfo(items)
+        return info['orig']
+
+    async def saveInfo(self, items: List[Any]) -> Dict[str, Any]:
+        '''
+        Add a list of items to the end of the sequence with a single write.
+
+        Returns:
+            The metrics dictionary from saving the items to the tail slab.
+        '''
+        assert self.tailseqn
+
+        indx = self.indx
+
+        # the tail seqn may be behind if our index was advanced by setIndex()
+        self.tailseqn.indx = indx
+        info = await self.tailseqn.save(items)
+
+        self.indx += len(items)
+        self._wake_waiters()
+
+        return info
+
     async def last(self) -> Optional[Tuple[int, Any]]:
         ridx = self._getRangeIndx(self.indx - 1)
         if ridx is None:
@@ -418,6 +450,34 @@ class MultiSlabSeqn(s_base.Base):
 
             ri += 1
 
+    async def rows(self, offs: int) -> AsyncIterator[Tuple[int, bytes]]:
+        '''
+        Iterate over raw (indx, bytes) tuples from a given offset.
+        '''
+        offs = max(offs, self.firstindx)
+
+        ri = ridx = self._getRangeIndx(offs)
+        assert ridx is not None
+
+        while ri < len(self._ranges):
+            if ri > ridx:
+                offs = self._ranges[ri]
+
+            async with self._getSeqn(ri) as seqn:
+                for item in seqn.rows(offs):
+                    yield item
+
+            ri += 1
+
+    def getRangeStart(self, offs: int) -> Optional[int]:
+        '''
+        Return the starting index of the slab which contains the offset.
+        '''
+        ridx = self._getRangeIndx(offs)
+        if ridx is None:
+            return None
+        return self._ranges[ridx]
+
     async def gets(self, offs, wait=True) -> AsyncIterator[Tuple[int, Any]]:
         '''
         Just like iter, but optionally waits for new entries once the end is reached.
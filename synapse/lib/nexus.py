@@ -4,6 +4,7 @@ import asyncio
 import logging
 import functools
 import contextlib
+import collections
 
 from typing import List, Dict, Any, Callable, Tuple, Optional, AsyncIterator
 
@@ -12,6 +13,7 @@ import synapse.common as s_common
 import synapse.telepath as s_telepath
 
 import synapse.lib.base as s_base
+import synapse.lib.coro as s_coro
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +97,16 @@ class NexsRoot(s_base.Base):
         self.ready = asyncio.Event()
         self.donexslog = self.cell.conf.get('nexslog:en')
 
+        # group commit of pending events
+        self.groupsize = self.cell.conf.get('nexslog:group:size', 1)
+        self.groupwait = self.cell.conf.get('nexslog:group:wait', 0.0)
+        self.grouptask = None
+        self.grouphist = collections.defaultdict(int)
+
+        self._grouped = collections.deque()
+        self._groupevnt = asyncio.Event()
+        self._groupfull = asyncio.Event()
+
         self.miruplink = asyncio.Event()
         self._mirready = asyncio.Event()  # for testing
 
@@ -138,6 +150,9 @@ class NexsRoot(s_base.Base):
             for futu in self._futures.values():  # pragma: no cover
                 futu.cancel()
 
+            for _, futu in self._grouped:
+                futu.cancel()
+
             await self.nexsslab.fini()
             await self.nexslog.fini()
 
@@ -257,14 +272,24 @@ class NexsRoot(s_base.Base):
             # We have a brand new log
             return
 
-        try:
-            await self._apply(*indxitem)
+        offs = indxitem[0]
 
-        except asyncio.CancelledError:  # pragma: no cover  TODO:  remove once >= py 3.8 only
-            raise
+        # if the last entry was logged as part of a group, the whole group may not have been applied
+        groffs = self.nexshot.get('nexs:group:offs')
+        grsize = self.nexshot.get('nexs:group:size')
+        if groffs <= offs < groffs + grsize:
+            offs = max(groffs, self.nexslog.firstindx)
+
+        async for indxitem in self.nexslog.iter(offs):
+
+            try:
+                await self._apply(*indxitem)
+
+            except asyncio.CancelledError:  # pragma: no cover  TODO:  remove once >= py 3.8 only
+                raise
 
-        except Exception:
-            logger.exception(f'Exception while replaying log: {s_common.trimText(repr(indxitem))}')
+            except Exception:
+                logger.exception(f'Exception while replaying log: {s_common.trimText(repr(indxitem))}')
 
     async def addWriteHold(self, reason):
 
@@ -334,29 +359,161 @@ class NexsRoot(s_base.Base):
             await client.issue(nexsiden, event, args, kwargs, meta)
             return await s_common.wait_for(futu, timeout=FOLLOWER_WRITE_WAIT_S)
 
-    async def eat(self, nexsiden, event, args, kwargs, meta):
+    async def eat(self, nexsiden, event, args, kwargs, meta, group=True):
         '''
         Actually mutate for the given nexsiden instance.
+
+        Notes:
+            Events from the leader are applied by mirrors one at a time and
+            use group=False to avoid waiting for a group to fill.
         '''
         if meta is None:
             meta = {}
 
-        async with self.cell.nexslock:
-            if (nexus := self._nexskids.get(nexsiden)) is None:
-                mesg = f'No Nexus Pusher with iden {nexsiden} {event=} args={s_common.trimText(repr(args))} ' \
-                       f'kwargs={s_common.trimText(repr(kwargs))}'
-                raise s_exc.NoSuchIden(mesg=mesg, iden=nexsiden, event=event)
-
-            if event not in nexus._nexshands:
-                mesg = f'No event handler for event {event} args={s_common.trimText(repr(args))} ' \
-                       f'kwargs={s_common.trimText(repr(kwargs))}'
-                raise s_exc.NoSuchName(mesg=mesg, iden=nexsiden, event=event)
+        if group and self.groupsize > 1:
+            return await self._eatGrouped((nexsiden, event, args, kwargs, meta))
 
+        async with self.cell.nexslock:
+            self._reqValidEvent(nexsiden, event, args, kwargs)
             self.reqNotReadOnly()
             # Keep a reference to the shielded task to ensure it isn't GC'd
             self.applytask = asyncio.create_task(self._eat((nexsiden, event, args, kwargs, meta)))
             return await asyncio.shield(self.applytask)
 
+    def _reqValidEvent(self, nexsiden, event, args, kwargs):
+
+        if (nexus := self._nexskids.get(nexsiden)) is None:
+            mesg = f'No Nexus Pusher with iden {nexsiden} {event=} args={s_common.trimText(repr(args))} ' \
+                   f'kwargs={s_common.trimText(repr(kwargs))}'
+            raise s_exc.NoSuchIden(mesg=mesg, iden=nexsiden, event=event)
+
+        if event not in nexus._nexshands:
+            mesg = f'No event handler for event {event} args={s_common.trimText(repr(args))} ' \
+                   f'kwargs={s_common.trimText(repr(kwargs))}'
+            raise s_exc.NoSuchName(mesg=mesg, iden=nexsiden, event=event)
+
+    async def _eatGrouped(self, item):
+        '''
+        Queue an event to be logged and applied as part of a group and wait for the result.
+        '''
+        self.reqNotReadOnly()
+
+        futu = self.loop.create_future()
+        self._grouped.append((item, futu))
+
+        if len(self._grouped) >= self.groupsize:
+            self._groupfull.set()
+
+        self._groupevnt.set()
+
+        if self.grouptask is None:
+            self.grouptask = self.schedCoro(self._runGroupLoop())
+
+        return await asyncio.shield(futu)
+
+    async def _runGroupLoop(self):
+
+        while not self.isfini:
+
+            await self._groupevnt.wait()
+
+            if len(self._grouped) < self.groupsize and self.groupwait:
+                await s_coro.event_wait(self._groupfull, timeout=self.groupwait)
+
+            async with self.cell.nexslock:
+
+                group = []
+                while self._grouped and len(group) < self.groupsize:
+                    group.append(self._grouped.popleft())
+
+                if len(self._grouped) < self.groupsize:
+                    self._groupfull.clear()
+
+                if not self._grouped:
+                    self._groupevnt.clear()
+
+                if not group:
+                    continue
+
+                # Keep a reference to the shielded task to ensure it isn't GC'd
+                self.applytask = asyncio.create_task(self._eatGroup(group))
+                await asyncio.shield(self.applytask)
+
+    async def _eatGroup(self, group):
+        '''
+        Log a group of events with a single write and then apply them in order.
+        '''
+        todo = []
+        for item, futu in group:
+
+            if futu.done():
+                continue
+
+            try:
+                self._reqValidEvent(*item[:4])
+                self.reqNotReadOnly()
+            except Exception as e:
+                futu.set_exception(e)
+                continue
+
+            todo.append((item, futu))
+
+        if not todo:
+            return
+
+        try:
+
+            if self.donexslog:
+
+                # record the group boundary before logging so recovery may replay the whole group
+                self.nexshot.set('nexs:group:offs', self.nexslog.index())
+                self.nexshot.set('nexs:group:size', len(todo))
+                self.nexshot.sync()
+                self.nexsslab.forcecommit(wait=True)
+
+                saveindx = await self.nexslog.save([item for (item, futu) in todo])
+                [dist.update() for dist in tuple(self._mirrors)]
+
+            else:
+                saveindx = self.nexshot.get('nexs:indx')
+                self.nexshot.inc('nexs:indx', valu=len(todo))
+
+        except Exception as e:  # pragma: no cover
+            logger.exception('Error while saving a group of nexus events.')
+            [futu.set_exception(e) for (item, futu) in todo if not futu.done()]
+            return
+
+        self.grouphist[1 << (len(todo) - 1).bit_length()] += 1
+
+        for offs, (item, futu) in enumerate(todo, start=saveindx):
+
+            try:
+                retn = await self._apply(offs, item)
+
+            except asyncio.CancelledError:  # pragma: no cover
+                raise
+
+            except Exception as e:
+                if not futu.done():
+                    futu.set_exception(e)
+                continue
+
+            if not futu.done():
+                futu.set_result((offs, retn))
+
+    def getGroupStats(self):
+        '''
+        Return nexus group commit settings and a histogram of group sizes.
+
+        Notes:
+            Group sizes are counted in power of 2 buckets keyed by the upper bound of the bucket.
+        '''
+        return {
+            'size': self.groupsize,
+            'wait': self.groupwait,
+            'hist': dict(sorted(self.grouphist.items())),
+        }
+
     async def index(self):
         if self.donexslog:
             return self.nexslog.index()
@@ -575,7 +732,7 @@ class NexsRoot(s_base.Base):
                     respfutu = self._futures.get(respiden)
 
                     try:
-                        retn = await self.eat(*args)
+                        retn = await self.eat(*args, group=False)
 
                     except Exception as e:
                         if respfutu is not None:
@@ -717,6 +717,38 @@ class Node:
         async for name in self.snap.iterNodeDataKeys(self.buid):
             yield name
 
+class LazyNode(Node):
+    '''
+    A Node constructed by a lazy lift which defers retrieving the storage
+    nodes for layers which did not produce it until the properties, tags,
+    tag properties, or node data are accessed. The deferred storage nodes
+    are retrieved in a batch with those of the other nodes from the same lift window.
+    '''
+    _lazyattrs = ('sode', 'bylayer', 'props', 'tags', 'tagprops', 'nodedata')
+
+    def __init__(self, snap, buid, ndef, sodes):
+        self.snap = snap
+        self.buid = buid
+        self.ndef = ndef
+        self.form = snap.core.model.form(ndef[0])
+        self._lazysodes = sodes
+
+    def __getattr__(self, name):
+        # only called for attributes which have not been set yet
+        if name not in self._lazyattrs:
+            raise AttributeError(name)
+
+        sodes = self.snap._fillLazySodes(self.buid, self._lazysodes)
+        joined = self.snap._joinPode(self.buid, sodes)
+        if joined is None:
+            # the node has been deleted since it was lifted
+            joined = ((self.buid, {'ndef': self.ndef}), {'ndef': None, 'tags': {}, 'props': {}, 'tagprops': {}})
+
+        Node.__init__(self, self.snap, joined[0], bylayer=joined[1])
+        del self._lazysodes
+
+        return object.__getattribute__(self, name)
+
 class Path:
     '''
     A path context tracked through the storm runtime.
@@ -1,5 +1,9 @@
+import os
 import ast
+import sys
+import stat
 import hashlib
+import logging
 import collections
 
 import lark  # type: ignore
@@ -12,6 +16,11 @@ import synapse.lib.ast as s_ast
 import synapse.lib.coro as s_coro
 import synapse.lib.cache as s_cache
 import synapse.lib.datfile as s_datfile
+import synapse.lib.msgpack as s_msgpack
+import synapse.lib.version as s_version
+import synapse.lib.stormtypes as s_stormtypes
+
+logger = logging.getLogger(__name__)
 
 # TL;DR:  *rules* are the internal nodes of an abstract syntax tree (AST), *terminals* are the leaves
 
@@ -432,7 +441,7 @@ class AstConverter(lark.Transformer):
         if kids[2] == '$':
             tokencls = terminalClassMap.get(kids[3].type, s_ast.Const)
             kidfo = self.metaToAstInfo(kids[3], isterm=True)
-            newkid = s_ast.VarValue(kidfo, kids=[tokencls(kids[3], kids[3])])
+            newkid = s_ast.VarValue(kidfo, kids=[tokencls(kidfo, kids[3])])
         else:
             newkid = self._convert_child(kids[2])
         return s_ast.VarDeref(astinfo, kids=(kids[0], newkid))
@@ -478,8 +487,77 @@ class AstConverter(lark.Transformer):
 with s_datfile.openDatFile('synapse.lib/storm.lark') as larkf:
     _grammar = larkf.read().decode()
 
-LarkParser = lark.Lark(_grammar, regex=True, start=['query', 'lookup', 'cmdrargs', 'evalvalu', 'search'],
-                       maybe_placeholders=False, propagate_positions=True, parser='lalr')
+_larkopts = {
+    'regex': True,
+    'start': ['query', 'lookup', 'cmdrargs', 'evalvalu', 'search'],
+    'maybe_placeholders': False,
+    'propagate_positions': True,
+    'parser': 'lalr',
+}
+
+# The version of the serialized parser for this grammar, lark, and python
+larkvers = hashlib.sha256(s_msgpack.en((_grammar, _larkopts, lark.__version__, sys.version_info[:2]))).hexdigest()
+
+def _isSafeParserCache(fd):
+    '''
+    Return True if the parser cache file is owned by the current user and may not be written by others.
+    '''
+    info = os.fstat(fd.fileno())
+
+    getuid = getattr(os, 'getuid', None)
+    if getuid is not None and info.st_uid != getuid():
+        return False
+
+    return not info.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+def _initLarkParser():
+    '''
+    Load the Storm parser from the parser cache or build and cache it.
+
+    Notes:
+        Building the LALR tables for the Storm grammar dominates the import time
+        of this module.  The serialized parser is stored in the Synapse directory
+        and is only rebuilt when the grammar, lark, or python version changes.
+        The cache is unpickled, so it is only loaded if it is owned by the current
+        user and may not be written by others.  Set SYN_PARSER_CACHE=0 to disable
+        the parser cache.
+    '''
+    if not s_common.envbool('SYN_PARSER_CACHE', 'true'):
+        return lark.Lark(_grammar, **_larkopts)
+
+    path = s_common.getSynPath('parsers', f'storm-{larkvers}.lark')
+
+    try:
+        with open(path, 'rb') as fd:
+
+            if _isSafeParserCache(fd):
+                return lark.Lark.load(fd)
+
+            logger.warning(f'Ignoring the cached Storm parser at {path} which is not owned by the current user '
+                           'or may be written by others.')
+
+    except FileNotFoundError:
+        pass
+
+    except Exception as e:  # pragma: no cover
+        logger.warning(f'Failed to load the cached Storm parser from {path}: {e}')
+
+    parser = lark.Lark(_grammar, **_larkopts)
+
+    # write to a temp file and rename so concurrent processes never load a partial file
+    tmppath = f'{path}.{os.getpid()}.tmp'
+    try:
+        s_common.gendir(os.path.dirname(path))
+        with open(os.open(tmppath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as fd:
+            parser.save(fd)
+        os.replace(tmppath, path)
+
+    except OSError as e:
+        logger.debug(f'Failed to save the Storm parser cache to {path}: {e}')
+
+    return parser
+
+LarkParser = _initLarkParser()
 
 class Parser:
     '''
@@ -629,11 +707,107 @@ def parseQuery(text, mode='storm'):
 def parseEval(text):
     return Parser(text).eval()
 
+# Increment when the packed AST format changes
+_astformat = 1
+
+# The version of packed ASTs which are compatible with this grammar and AST implementation
+astvers = hashlib.sha256(s_msgpack.en((_astformat, s_version.version, _grammar))).hexdigest()
+
+_astclasses = {
+    name: clss for name, clss in vars(s_ast).items()
+    if isinstance(clss, type) and issubclass(clss, s_ast.AstNode)
+}
+
+_astattrtypes = (bool, int, float, str, type(None))
+
+def _packValu(valu):
+    if isinstance(valu, s_stormtypes.Number):
+        return ('n', str(valu.value()))
+    if isinstance(valu, list):
+        return ('l', valu)
+    if isinstance(valu, str):
+        return ('v', str(valu))
+    return ('v', valu)
+
+def _unpackValu(item):
+    kind, valu = item
+    if kind == 'n':
+        return s_stormtypes.Number(valu)
+    if kind == 'l':
+        return list(valu)
+    return valu
+
+def _packAst(astn):
+
+    attrs = {}
+    for name, valu in astn.__dict__.items():
+        if name in ('kids', 'astinfo', 'pindex', 'valu'):
+            continue
+        if type(valu) in _astattrtypes:
+            attrs[name] = valu
+
+    valu = None
+    if isinstance(astn, s_ast.Const):
+        valu = _packValu(astn.valu)
+
+    kids = [_packAst(k) for k in astn.kids]
+    return (astn.__class__.__name__, tuple(astn.astinfo[1:]), attrs, kids, valu)
+
+def _unpackAst(text, item):
+
+    name, info, attrs, kids, valu = item
+
+    clss = _astclasses.get(name)
+    if clss is None:
+        raise s_exc.BadArg(mesg=f'Invalid AST node class: {name}')
+
+    astinfo = AstInfo(text, *info)
+    kids = [_unpackAst(text, k) for k in kids]
+
+    if valu is not None:
+        astn = clss(astinfo, _unpackValu(valu), kids=kids)
+    else:
+        astn = clss(astinfo, kids=kids)
+
+    astn.__dict__.update(attrs)
+    return astn
+
+def packAst(astn):
+    '''
+    Pack a parsed AST into a compact msgpack serialized form.
+
+    Args:
+        astn (s_ast.AstNode): An uninitialized AST node returned by the parser.
+
+    Returns:
+        bytes: The packed AST.
+    '''
+    return s_msgpack.en(_packAst(astn))
+
+def unpackAst(text, byts):
+    '''
+    Construct a new AST from the packed form produced by packAst().
+
+    Args:
+        text (str): The text which was parsed to produce the AST.
+        byts (bytes): The packed AST.
+
+    Returns:
+        s_ast.AstNode: A new uninitialized AST node.
+    '''
+    return _unpackAst(text, s_msgpack.un(byts))
+
+def parsePackedQuery(text, mode='storm'):
+    return packAst(parseQuery(text, mode=mode))
+
+def parsePackedEval(text):
+    return packAst(parseEval(text))
+
 async def _forkedParseQuery(args):
-    return await s_coro._parserforked(parseQuery, args[0], mode=args[1])
+    return await s_coro._parserforked(parsePackedQuery, args[0], mode=args[1])
 
 async def _forkedParseEval(text):
-    return await s_coro._parserforked(parseEval, text)
+    return await s_coro._parserforked(parsePackedEval, text)
 
 evalcache = s_cache.FixedCache(_forkedParseEval, size=100)
 querycache = s_cache.FixedCache(_forkedParseQuery, size=100)
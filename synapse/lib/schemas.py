@@ -286,6 +286,7 @@ _stormPoolOptsSchema = {
     'properties': {
         'timeout:sync': {'type': 'integer', 'minimum': 1},
         'timeout:connection': {'type': 'integer', 'minimum': 1},
+        'balance': {'type': 'string', 'enum': ['roundrobin', 'least', 'ewma', 'lag']},
     },
     'additionalProperties': False,
 }
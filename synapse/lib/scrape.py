@@ -3,6 +3,7 @@ import asyncio
 import logging
 import pathlib
 import functools
+import itertools
 import collections
 
 import idna
@@ -283,43 +284,65 @@ def url_scheme_check(match: regex.Match):
 
     return valu, cbfo
 
+# Texts larger than this are split into chunks which are scraped in parallel by the async APIs.
+scrape_chunk_size = 1_000_000
+
+# Scrape rules with triggers are only run on the regions of text which contain one of the
+# triggers. Rule values never contain ASCII whitespace, so the region is the whitespace
+# delimited token containing the trigger. Rules which may match whitespace set "lines" to use
+# the line containing the trigger instead.
+scrape_triggers = {
+    'dot': r'[.\u3002\uff0e\uff61][\p{L}\p{N}]',
+    'colon': r':',
+    'scheme': r'://',
+    'slash': r'/',
+    'bslash': r'\\',
+    'at': r'@',
+    'hex': r'[a-f0-9]{32}',
+    'alnum': r'[a-z0-9]{25}',
+    'bech32': r'(?:bc|bcrt|tb)1',
+    'cve': r'cve',
+    'cwe': r'cwe-',
+    'cpe': r'cpe:2\.3:',
+}
+
 # these must be ordered from most specific to least specific to allow first=True to work
 scrape_types = [  # type: ignore
-    ('file:path', linux_path_regex, {'callback': linux_path_check, 'flags': regex.VERBOSE}),
-    ('file:path', windows_path_regex, {'callback': windows_path_check, 'flags': regex.VERBOSE}),
+    ('file:path', linux_path_regex, {'callback': linux_path_check, 'flags': regex.VERBOSE, 'triggers': ('slash',), 'lines': True}),
+    ('file:path', windows_path_regex, {'callback': windows_path_check, 'flags': regex.VERBOSE, 'triggers': ('bslash',), 'lines': True}),
     ('inet:url', r'(?P<prefix>[\\{<\(\[]?)(?P<valu>[a-zA-Z][a-zA-Z0-9]*://(?(?=[,.]+[ \'\"\t\n\r\f\v])|[^ \'\"\t\n\r\f\v])+)',
-     {'callback': url_scheme_check}),
-    ('inet:url', r'(["\'])?(?P<valu>\\[^\n]+?)(?(1)\1|\s)', {'callback': unc_path_check}),
-    ('inet:email', r'(?=(?:[^a-z0-9_.+-]|^)(?P<valu>[a-z0-9_\.\-+]{1,256}@(?:[a-z0-9_-]{1,63}\.){1,10}(?:%s))(?:[^a-z0-9_.-]|[.\s]|$))' % tldcat, {}),
+     {'callback': url_scheme_check, 'triggers': ('scheme',)}),
+    ('inet:url', r'(["\'])?(?P<valu>\\[^\n]+?)(?(1)\1|\s)', {'callback': unc_path_check, 'triggers': ('bslash',), 'lines': True}),
+    ('inet:email', r'(?=(?:[^a-z0-9_.+-]|^)(?P<valu>[a-z0-9_\.\-+]{1,256}@(?:[a-z0-9_-]{1,63}\.){1,10}(?:%s))(?:[^a-z0-9_.-]|[.\s]|$))' % tldcat, {'triggers': ('at',)}),
     ('inet:server', fr'(?P<valu>(?:(?<!\d|\d\.|[0-9a-f:]:)((?P<addr>{ipv4_match})|\[(?P<v6addr>{ipv6_match})\]):(?P<port>\d{{1,5}})(?!\d|\.\d)))',
-     {'callback': inet_server_check, 'flags': regex.VERBOSE}),
-    ('inet:ipv4', ipv4_regex, {'flags': regex.VERBOSE}),
-    ('inet:ipv6', ipv6_regex, {'callback': ipv6_check, 'flags': regex.VERBOSE}),
-    ('inet:fqdn', r'(?=(?:[^\p{L}\p{M}\p{N}\p{S}\u3002\uff0e\uff61_.-]|^|[' + idna_disallowed + '])(?P<valu>(?:((?![' + idna_disallowed + r'])[\p{L}\p{M}\p{N}\p{S}_-]){1,63}[\u3002\uff0e\uff61\.]){1,10}(?:' + tldcat + r'))(?:[^\p{L}\p{M}\p{N}\p{S}\u3002\uff0e\uff61_.-]|[\u3002\uff0e\uff61.]([\p{Z}\p{Cc}]|$)|$|[' + idna_disallowed + r']))', {'callback': fqdn_check}),
-    ('hash:md5', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>[A-Fa-f0-9]{32})(?:[^A-Za-z0-9]|$))', {}),
-    ('hash:sha1', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>[A-Fa-f0-9]{40})(?:[^A-Za-z0-9]|$))', {}),
-    ('hash:sha256', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>[A-Fa-f0-9]{64})(?:[^A-Za-z0-9]|$))', {}),
-    ('it:sec:cve', fr'(?:[^a-z0-9]|^)(?P<valu>CVE[{cve_dashes}][0-9]{{4}}[{cve_dashes}][0-9]{{4,}})(?:[^a-z0-9]|$)', {'callback': cve_check}),
-    ('it:sec:cwe', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>CWE-[0-9]{1,8})(?:[^A-Za-z0-9]|$))', {}),
-    ('it:sec:cpe', _cpe23_regex, {'flags': regex.VERBOSE}),
+     {'callback': inet_server_check, 'flags': regex.VERBOSE, 'triggers': ('colon',)}),
+    ('inet:ipv4', ipv4_regex, {'flags': regex.VERBOSE, 'triggers': ('dot',)}),
+    ('inet:ipv6', ipv6_regex, {'callback': ipv6_check, 'flags': regex.VERBOSE, 'triggers': ('colon',)}),
+    ('inet:fqdn', r'(?=(?:[^\p{L}\p{M}\p{N}\p{S}\u3002\uff0e\uff61_.-]|^|[' + idna_disallowed + '])(?P<valu>(?:((?![' + idna_disallowed + r'])[\p{L}\p{M}\p{N}\p{S}_-]){1,63}[\u3002\uff0e\uff61\.]){1,10}(?:' + tldcat + r'))(?:[^\p{L}\p{M}\p{N}\p{S}\u3002\uff0e\uff61_.-]|[\u3002\uff0e\uff61.]([\p{Z}\p{Cc}]|$)|$|[' + idna_disallowed + r']))', {'callback': fqdn_check, 'triggers': ('dot',)}),
+    ('hash:md5', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>[A-Fa-f0-9]{32})(?:[^A-Za-z0-9]|$))', {'triggers': ('hex',)}),
+    ('hash:sha1', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>[A-Fa-f0-9]{40})(?:[^A-Za-z0-9]|$))', {'triggers': ('hex',)}),
+    ('hash:sha256', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>[A-Fa-f0-9]{64})(?:[^A-Za-z0-9]|$))', {'triggers': ('hex',)}),
+    ('it:sec:cve', fr'(?:[^a-z0-9]|^)(?P<valu>CVE[{cve_dashes}][0-9]{{4}}[{cve_dashes}][0-9]{{4,}})(?:[^a-z0-9]|$)', {'callback': cve_check, 'triggers': ('cve',)}),
+    ('it:sec:cwe', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>CWE-[0-9]{1,8})(?:[^A-Za-z0-9]|$))', {'triggers': ('cwe',)}),
+    ('it:sec:cpe', _cpe23_regex, {'flags': regex.VERBOSE, 'triggers': ('cpe',)}),
     ('crypto:currency:address', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>[1][a-zA-HJ-NP-Z0-9]{25,39})(?:[^A-Za-z0-9]|$))',
-     {'callback': s_coin.btc_base58_check}),
+     {'callback': s_coin.btc_base58_check, 'triggers': ('alnum',)}),
     ('crypto:currency:address', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>3[a-zA-HJ-NP-Z0-9]{33})(?:[^A-Za-z0-9]|$))',
-     {'callback': s_coin.btc_base58_check}),
+     {'callback': s_coin.btc_base58_check, 'triggers': ('alnum',)}),
     ('crypto:currency:address', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>(bc|bcrt|tb)1[qpzry9x8gf2tvdw0s3jn54khce6mua7l]{3,71})(?:[^A-Za-z0-9]|$))',
-     {'callback': s_coin.btc_bech32_check}),
+     {'callback': s_coin.btc_bech32_check, 'triggers': ('bech32',)}),
     ('crypto:currency:address', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>0x[A-Fa-f0-9]{40})(?:[^A-Za-z0-9]|$))',
-     {'callback': s_coin.eth_check}),
+     {'callback': s_coin.eth_check, 'triggers': ('hex',)}),
     ('crypto:currency:address', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>(bitcoincash|bchtest):[qpzry9x8gf2tvdw0s3jn54khce6mua7l]{42})(?:[^A-Za-z0-9]|$))',
-     {'callback': s_coin.bch_check}),
+     {'callback': s_coin.bch_check, 'triggers': ('alnum',)}),
     ('crypto:currency:address', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>[xr][a-zA-HJ-NP-Z0-9]{25,46})(?:[^A-Za-z0-9]|$))',
-     {'callback': s_coin.xrp_check}),
+     {'callback': s_coin.xrp_check, 'triggers': ('alnum',)}),
     ('crypto:currency:address', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>[1a-z][a-zA-HJ-NP-Z0-9]{46,47})(?:[^A-Za-z0-9]|$))',
-     {'callback': s_coin.substrate_check}),
+     {'callback': s_coin.substrate_check, 'triggers': ('alnum',)}),
     ('crypto:currency:address', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>(DdzFF|Ae2td)[a-zA-HJ-NP-Z0-9]{54,99})(?:[^A-Za-z0-9]|$))',
-     {'callback': s_coin.cardano_byron_check}),
+     {'callback': s_coin.cardano_byron_check, 'triggers': ('alnum',)}),
     ('crypto:currency:address', r'(?=(?:[^A-Za-z0-9]|^)(?P<valu>addr1[qpzry9x8gf2tvdw0s3jn54khce6mua7l]{53,})(?:[^A-Za-z0-9]|$))',
-     {'callback': s_coin.cardano_shelly_check}),
+     {'callback': s_coin.cardano_shelly_check, 'triggers': ('alnum',)}),
 ]
 
 _regexes = collections.defaultdict(list)
@@ -327,6 +350,69 @@ for (name, rule, opts) in scrape_types:
     blob = (regex.compile(rule, regex.IGNORECASE | opts.get('flags', 0)), opts)
     _regexes[name].append(blob)
 
+_trigger_regexes = {name: regex.compile(rule, regex.IGNORECASE) for (name, rule) in scrape_triggers.items()}
+_token_start_regex = regex.compile(r'[ \t\n\r\f\v]', regex.REVERSE)
+_token_end_regex = regex.compile(r'[ \t\n\r\f\v]')
+
+def _getTriggerSpans(text):
+    '''
+    Return a dict of trigger name to the (start, end) spans of the tokens in the text which contain it.
+    '''
+    spans = {}
+    textsize = len(text)
+
+    for name, regx in _trigger_regexes.items():
+
+        tokens = spans[name] = []
+
+        offs = 0
+        while (match := regx.search(text, offs)) is not None:
+
+            mstart, mend = match.span()
+
+            # the start and end of the whitespace delimited token containing the trigger
+            wsmatch = _token_start_regex.search(text, 0, mstart)
+            start = 0 if wsmatch is None else wsmatch.end()
+
+            wsmatch = _token_end_regex.search(text, mend)
+            end = textsize if wsmatch is None else wsmatch.start()
+
+            tokens.append((start, end))
+            offs = end
+
+    return spans
+
+def _getRuleRegions(text, spans, opts):
+    '''
+    Return a list of the merged (start, end) regions of the text which a scrape rule must be run on.
+    '''
+    triggers = opts.get('triggers')
+    if triggers is None:
+        return None
+
+    lines = opts.get('lines', False)
+    textsize = len(text)
+
+    regions = []
+    for start, end in sorted(itertools.chain(*[spans.get(name, ()) for name in triggers])):
+
+        if lines:
+            start = text.rfind('\n', 0, start) + 1
+            end = text.find('\n', end)
+            end = textsize if end == -1 else end + 1
+        else:
+            # include the surrounding characters used as context by the rules
+            start = max(start - 2, 0)
+            end = min(end + 2, textsize)
+
+        if regions and start <= regions[-1][1]:
+            regions[-1][1] = max(end, regions[-1][1])
+            continue
+
+        regions.append([start, end])
+
+    return regions
+
 def getForms():
     '''
     Get a list of forms recognized by the scrape APIs.
@@ -465,11 +551,9 @@ def _rewriteRawValu(text: str, offsets: dict, info: dict):
         if k < offset:
             baseoff = baseoff + offsets[k] - 1
 
-    # If our return valu is not a str, then base our text recovery on the
-    # original regex matched valu.
-    valu = info.get('valu')
-    if not isinstance(valu, str):
-        valu = info.get('match')
+    # Base our text recovery on the original regex matched valu since the
+    # callbacks may return a valu of a different length.
+    valu = info.get('match')
 
     # Start enumerating each character in our valu, incrementing the end_offset
     # by 1, or the recorded offset difference in offsets dictionary.
@@ -485,11 +569,20 @@ def _rewriteRawValu(text: str, offsets: dict, info: dict):
 def _genMatchList(text: str, regx: regex.Regex, opts: dict):
     return [info for info in _genMatches(text, regx, opts)]
 
-def _genMatches(text: str, regx: regex.Regex, opts: dict):
+def _genMatches(text: str, regx: regex.Regex, opts: dict, regions=None, pos=0, mspans=None):
 
     cb = opts.get('callback')
 
-    for valu in regx.finditer(text):  # type: regex.Match
+    if regions is None:
+        matches = regx.finditer(text, pos)
+    else:
+        matches = itertools.chain.from_iterable(regx.finditer(text, max(start, pos), end) for (start, end) in regions if end > pos)
+
+    for valu in matches:  # type: regex.Match
+
+        if mspans is not None:
+            mspans.append(valu.span())
+
         raw_span = valu.span('valu')
         raw_valu = valu.group('valu')
 
@@ -577,39 +670,145 @@ async def genMatchesAsync(text: str, regx: regex.Regex, opts: dict):
     for info in matches:
         yield info
 
-def _contextMatches(scrape_text, text, ruletype, refang, offsets):
+def _contextRuleMatches(scrape_text, text, ruletype, regx, opts, refang, offsets, spans=None, pos=0, mspans=None):
 
-        for (regx, opts) in _regexes[ruletype]:
+    regions = None
+    if spans is not None:
+        regions = _getRuleRegions(scrape_text, spans, opts)
+
+    for info in _genMatches(scrape_text, regx, opts, regions=regions, pos=pos, mspans=mspans):
 
-            for info in genMatches(scrape_text, regx, opts):
+        info['form'] = ruletype
 
-                info['form'] = ruletype
+        if refang and offsets:
+            _rewriteRawValu(text, offsets, info)
 
-                if refang and offsets:
-                    _rewriteRawValu(text, offsets, info)
+        yield info
+
+def _contextMatches(scrape_text, text, ruletype, refang, offsets, spans=None):
 
-                yield info
+        for (regx, opts) in _regexes[ruletype]:
+            yield from _contextRuleMatches(scrape_text, text, ruletype, regx, opts, refang, offsets, spans=spans)
 
 def _contextScrapeList(text, form=None, refang=True, first=False):
     return [info for info in _contextScrape(text, form=form, refang=refang, first=first)]
 
-def _contextScrape(text, form=None, refang=True, first=False):
+def _contextScrape(text, form=None, refang=True, first=False, prefilter=True):
     scrape_text = text
     offsets = {}
     if refang:
         scrape_text, offsets = refang_text2(text)
 
+    spans = None
+    if prefilter:
+        spans = _getTriggerSpans(scrape_text)
+
     for ruletype, blobs in _regexes.items():
         if form and form != ruletype:
             continue
 
-        for info in _contextMatches(scrape_text, text, ruletype, refang, offsets):
+        for info in _contextMatches(scrape_text, text, ruletype, refang, offsets, spans=spans):
 
             yield info
 
             if first:
                 return
 
+def _chunkText(text, size):
+    '''
+    Split the text on line boundaries into a list of (offset, chunk) tuples of at least size characters.
+    '''
+    chunks = []
+
+    offs = 0
+    textsize = len(text)
+    while offs < textsize:
+        end = text.find('\n', offs + size)
+        end = textsize if end == -1 else end + 1
+        chunks.append((offs, text[offs:end]))
+        offs = end
+
+    return chunks
+
+def _contextScrapeChunk(text, offs, form=None, refang=True):
+    '''
+    Scrape a chunk of a larger text and return a list of the matches for each scrape rule.
+
+    Notes:
+        Chunks after the first begin with the newline which ends the previous chunk. A rule
+        which consumes a trailing character (such as the CVE rule) may consume that newline
+        when scraping the whole text, in which case the scan resumes after it. For each rule
+        the matches are returned as a tuple of (infos, tail, altinfos, alttail), where the
+        alternate matches are scanned from after the leading newline and are only present if
+        they may differ. The tail values indicate if the last match consumed the trailing newline.
+    '''
+    scrape_text = text
+    offsets = {}
+    if refang:
+        scrape_text, offsets = refang_text2(text)
+
+    spans = _getTriggerSpans(scrape_text)
+    textsize = len(scrape_text)
+
+    def scan(pos=0):
+        mspans = []
+        infos = list(_contextRuleMatches(scrape_text, text, ruletype, regx, opts, refang, offsets,
+                                         spans=spans, pos=pos, mspans=mspans))
+        for info in infos:
+            info['offset'] += offs
+        return infos, mspans
+
+    retn = []
+    for ruletype, blobs in _regexes.items():
+        if form and form != ruletype:
+            continue
+
+        for (regx, opts) in blobs:
+
+            infos, mspans = scan()
+            tail = bool(mspans) and mspans[-1][1] == textsize
+
+            altinfos = alttail = None
+            if offs and mspans and mspans[0][0] == 0:
+                altinfos, mspans = scan(pos=1)
+                alttail = bool(mspans) and mspans[-1][1] == textsize
+
+            retn.append((infos, tail, altinfos, alttail))
+
+    return retn
+
+async def _contextScrapeAsync(text, form=None, refang=True, first=False):
+
+    if first or s_coro.forkpool is None or len(text) <= scrape_chunk_size:
+        return await s_coro.semafork(_contextScrapeList, text, form=form, refang=refang, first=first)
+
+    # No scrape rule matches across a newline, so the chunks may be scraped independently.
+    # Each chunk overlaps the previous one by the newline which separates them, and the
+    # results for each rule are concatenated in offset order using the alternate matches
+    # for a chunk if the previous chunk consumed that newline.
+    todo = []
+    for offs, chunk in _chunkText(text, scrape_chunk_size):
+        if offs:
+            offs -= 1
+            chunk = text[offs] + chunk
+        todo.append(s_coro.semafork(_contextScrapeChunk, chunk, offs, form=form, refang=refang))
+
+    results = await asyncio.gather(*todo)
+
+    retn = []
+    for rules in zip(*results):
+
+        consumed = False
+        for (infos, tail, altinfos, alttail) in rules:
+
+            if consumed and altinfos is not None:
+                infos, tail = altinfos, alttail
+
+            retn.extend(infos)
+            consumed = tail
+
+    return retn
+
 def contextScrape(text, form=None, refang=True, first=False):
     '''
     Scrape types from a blob of text and yield info dictionaries.
@@ -660,6 +859,7 @@ def scrape(text, ptype=None, refang=True, first=False):
 async def contextScrapeAsync(text, form=None, refang=True, first=False):
     '''
     Scrape types from a blob of text and yield info dictionaries, using the shared forked process pool.
+    Texts larger than ``scrape_chunk_size`` are split on line boundaries and scraped in parallel.
 
     Args:
         text (str): Text to scrape.
@@ -685,13 +885,14 @@ async def contextScrapeAsync(text, form=None, refang=True, first=False):
     Returns:
         (dict): Yield info dicts of results.
     '''
-    matches = await s_coro.semafork(_contextScrapeList, text, form=form, refang=refang, first=first)
+    matches = await _contextScrapeAsync(text, form=form, refang=refang, first=first)
     for info in matches:
         yield info
 
 async def scrapeAsync(text, ptype=None, refang=True, first=False):
     '''
     Scrape types from a blob of text and return node tuples, using the shared forked process pool.
+    Texts larger than ``scrape_chunk_size`` are split on line boundaries and scraped in parallel.
 
     Args:
         text (str): Text to scrape.
@@ -702,6 +903,6 @@ async def scrapeAsync(text, ptype=None, refang=True, first=False):
     Returns:
         (str, object): Yield tuples of node ndef values.
     '''
-    matches = await s_coro.semafork(_contextScrapeList, text, form=ptype, refang=refang, first=first)
+    matches = await _contextScrapeAsync(text, form=ptype, refang=refang, first=first)
     for info in matches:
         yield info.get('form'), info.get('valu')
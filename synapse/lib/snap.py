@@ -13,11 +13,13 @@ import synapse.common as s_common
 import synapse.lib.base as s_base
 import synapse.lib.json as s_json
 import synapse.lib.node as s_node
+import synapse.lib.const as s_const
 import synapse.lib.time as s_time
 import synapse.lib.cache as s_cache
 import synapse.lib.layer as s_layer
 import synapse.lib.storm as s_storm
 import synapse.lib.types as s_types
+import synapse.lib.msgpack as s_msgpack
 
 logger = logging.getLogger(__name__)
 
@@ -662,6 +664,9 @@ class Snap(s_base.Base):
     tagcachesize = 1000
     buidcachesize = 100000
 
+    addnodesbatch = 1000
+    addnodesbytes = 4 * s_const.mebibyte
+
     async def __anit__(self, view, user):
         '''
         Args:
@@ -693,6 +698,7 @@ class Snap(s_base.Base):
         self.debug = False      # Set to true to enable debug output.
         self.write = False      # True when the snap has a write lock on a layer.
         self.cachebuids = True
+        self.lazynodes = False  # True to defer retrieving storage nodes not produced by a lift.
 
         self.tagnorms = s_cache.FixedCache(self._getTagNorm, size=self.tagcachesize)
         self.tagcache = s_cache.FixedCache(self._getTagNode, size=self.tagcachesize)
@@ -924,7 +930,7 @@ class Snap(s_base.Base):
             mesg = f'No tag property named {name}'
             raise s_exc.NoSuchTagProp(name=name, mesg=mesg)
 
-        async for (buid, sodes) in self.core._liftByTagProp(form, tag, name, self.layers, reverse=reverse):
+        async for (buid, sodes) in self.core._liftByTagProp(form, tag, name, self.layers, reverse=reverse, lazy=self.lazynodes):
             node = await self._joinSodes(buid, sodes)
             if node is not None:
                 yield node
@@ -940,7 +946,7 @@ class Snap(s_base.Base):
         if not cmprvals:
             return
 
-        async for (buid, sodes) in self.core._liftByTagPropValu(form, tag, name, cmprvals, self.layers, reverse=reverse):
+        async for (buid, sodes) in self.core._liftByTagPropValu(form, tag, name, cmprvals, self.layers, reverse=reverse, lazy=self.lazynodes):
             node = await self._joinSodes(buid, sodes)
             if node is not None:
                 yield node
@@ -974,6 +980,55 @@ class Snap(s_base.Base):
             await asyncio.sleep(0)
             return node
 
+        if any(isinstance(sode, s_layer.LazySodes) for (_, sode) in sodes):
+            node = self._joinLazySodes(buid, sodes)
+
+        else:
+            joined = self._joinPode(buid, sodes)
+            if joined is not None:
+                node = s_node.Node(self, joined[0], bylayer=joined[1])
+
+        if node is None:
+            await asyncio.sleep(0)
+            return None
+
+        if self.cachebuids:
+            self.livenodes[buid] = node
+            self.buidcache.append(node)
+
+        await asyncio.sleep(0)
+        return node
+
+    def _joinLazySodes(self, buid, sodes):
+        '''
+        Construct a LazyNode from a list of sodes which contains s_layer.LazySodes
+        for storage nodes which have not been retrieved from the layer yet.
+        '''
+        for (layr, sode) in sodes:
+            if isinstance(sode, s_layer.LazySodes):
+                continue
+
+            valt = sode.get('valu')
+            if valt is not None:
+                return s_node.LazyNode(self, buid, (sode.get('form'), valt[0]), sodes)
+
+    def _fillLazySodes(self, buid, sodes):
+        '''
+        Retrieve the storage nodes which were deferred by a lazy lift.
+        '''
+        retn = []
+        for (layr, sode) in sodes:
+            if isinstance(sode, s_layer.LazySodes):
+                sode = sode.get(layr, buid)
+            retn.append((layr, sode))
+        return retn
+
+    def _joinPode(self, buid, sodes):
+        '''
+        Join a list of (layer iden, sode) tuples into a (pode, bylayer) tuple.
+
+        Returns None if none of the storage nodes contain the primary property.
+        '''
         ndef = None
         tags = {}
         props = {}
@@ -1022,7 +1077,6 @@ class Snap(s_base.Base):
                 nodedata.update(stordata)
 
         if ndef is None:
-            await asyncio.sleep(0)
             return None
 
         pode = (buid, {
@@ -1033,16 +1087,10 @@ class Snap(s_base.Base):
             'tagprops': tagprops,
         })
 
-        node = s_node.Node(self, pode, bylayer=bylayer)
-        if self.cachebuids:
-            self.livenodes[buid] = node
-            self.buidcache.append(node)
-
-        await asyncio.sleep(0)
-        return node
+        return pode, bylayer
 
     async def nodesByDataName(self, name):
-        async for (buid, sodes) in self.core._liftByDataName(name, self.layers):
+        async for (buid, sodes) in self.core._liftByDataName(name, self.layers, lazy=self.lazynodes):
             node = await self._joinSodes(buid, sodes)
             if node is not None:
                 yield node
@@ -1060,14 +1108,14 @@ class Snap(s_base.Base):
             return
 
         if prop.isform:
-            async for (buid, sodes) in self.core._liftByProp(prop.name, None, self.layers, reverse=reverse):
+            async for (buid, sodes) in self.core._liftByProp(prop.name, None, self.layers, reverse=reverse, lazy=self.lazynodes):
                 node = await self._joinSodes(buid, sodes)
                 if node is not None:
                     yield node
             return
 
         if prop.isuniv:
-            async for (buid, sodes) in self.core._liftByProp(None, prop.name, self.layers, reverse=reverse):
+            async for (buid, sodes) in self.core._liftByProp(None, prop.name, self.layers, reverse=reverse, lazy=self.lazynodes):
                 node = await self._joinSodes(buid, sodes)
                 if node is not None:
                     yield node
@@ -1078,7 +1126,7 @@ class Snap(s_base.Base):
             formname = prop.form.name
 
         # Prop is secondary prop
-        async for (buid, sodes) in self.core._liftByProp(formname, prop.name, self.layers, reverse=reverse):
+        async for (buid, sodes) in self.core._liftByProp(formname, prop.name, self.layers, reverse=reverse, lazy=self.lazynodes):
             node = await self._joinSodes(buid, sodes)
             if node is not None:
                 yield node
@@ -1136,7 +1184,7 @@ class Snap(s_base.Base):
             return
 
         if prop.isform:
-            async for (buid, sodes) in self.core._liftByFormValu(prop.name, cmprvals, self.layers, reverse=reverse):
+            async for (buid, sodes) in self.core._liftByFormValu(prop.name, cmprvals, self.layers, reverse=reverse, lazy=self.lazynodes):
                 node = await self._joinSodes(buid, sodes)
                 if node is not None:
                     yield node
@@ -1144,26 +1192,26 @@ class Snap(s_base.Base):
             return
 
         if prop.isuniv:
-            async for (buid, sodes) in self.core._liftByPropValu(None, prop.name, cmprvals, self.layers, reverse=reverse):
+            async for (buid, sodes) in self.core._liftByPropValu(None, prop.name, cmprvals, self.layers, reverse=reverse, lazy=self.lazynodes):
                 node = await self._joinSodes(buid, sodes)
                 if node is not None:
                     yield node
             return
 
-        async for (buid, sodes) in self.core._liftByPropValu(prop.form.name, prop.name, cmprvals, self.layers, reverse=reverse):
+        async for (buid, sodes) in self.core._liftByPropValu(prop.form.name, prop.name, cmprvals, self.layers, reverse=reverse, lazy=self.lazynodes):
             node = await self._joinSodes(buid, sodes)
             if node is not None:
                 yield node
 
     async def nodesByTag(self, tag, form=None, reverse=False):
-        async for (buid, sodes) in self.core._liftByTag(tag, form, self.layers, reverse=reverse):
+        async for (buid, sodes) in self.core._liftByTag(tag, form, self.layers, reverse=reverse, lazy=self.lazynodes):
             node = await self._joinSodes(buid, sodes)
             if node is not None:
                 yield node
 
     async def nodesByTagValu(self, tag, cmpr, valu, form=None, reverse=False):
         norm, info = self.core.model.type('ival').norm(valu)
-        async for (buid, sodes) in self.core._liftByTagValu(tag, cmpr, norm, form, self.layers, reverse=reverse):
+        async for (buid, sodes) in self.core._liftByTagValu(tag, cmpr, norm, form, self.layers, reverse=reverse, lazy=self.lazynodes):
             node = await self._joinSodes(buid, sodes)
             if node is not None:
                 yield node
@@ -1199,7 +1247,7 @@ class Snap(s_base.Base):
             cmprvals = ((cmpr, valu, prop.type.arraytype.stortype),)
 
         if prop.isform:
-            async for (buid, sodes) in self.core._liftByPropArray(prop.name, None, cmprvals, self.layers, reverse=reverse):
+            async for (buid, sodes) in self.core._liftByPropArray(prop.name, None, cmprvals, self.layers, reverse=reverse, lazy=self.lazynodes):
                 node = await self._joinSodes(buid, sodes)
                 if node is not None:
                     yield node
@@ -1209,7 +1257,7 @@ class Snap(s_base.Base):
         if prop.form is not None:
             formname = prop.form.name
 
-        async for (buid, sodes) in self.core._liftByPropArray(formname, prop.name, cmprvals, self.layers, reverse=reverse):
+        async for (buid, sodes) in self.core._liftByPropArray(formname, prop.name, cmprvals, self.layers, reverse=reverse, lazy=self.lazynodes):
             node = await self._joinSodes(buid, sodes)
             if node is not None:
                 yield node
@@ -1708,6 +1756,10 @@ class Snap(s_base.Base):
 
             ( (form, valu), {'props':{}, 'tags':{}})
 
+        The edits for multiple nodedefs are accumulated and saved to the write
+        layer as a single batch of up to addnodesbatch nodedefs or addnodesbytes
+        of encoded edits.
+
         Args:
             nodedefs (list): A list of nodedef tuples.
 
@@ -1721,11 +1773,40 @@ class Snap(s_base.Base):
         oldstrict = self.strict
         self.strict = False
         try:
+            todo = []
+            buids = set()
+            size = 0
+
             for nodedefn in nodedefs:
                 try:
-                    node = await self._addNodeDef(nodedefn)
-                    if node is not None:
-                        yield node
+                    retn = await self._getNodeDefEdits(nodedefn)
+                    if retn is not None and retn[0] in buids:
+                        # the node must be edited against the results of the pending batch
+                        async for node in self._saveNodeDefEdits(todo, oldstrict):
+                            yield node
+
+                        todo.clear()
+                        buids.clear()
+                        size = 0
+
+                        retn = await self._getNodeDefEdits(nodedefn)
+
+                    if retn is not None:
+
+                        buid, nodeedits, nodecache = retn
+
+                        todo.append((nodedefn, buid, nodeedits, nodecache))
+                        buids.update(nodeedit[0] for nodeedit in nodeedits)
+                        size += len(s_msgpack.en(nodeedits))
+
+                        if len(todo) >= self.addnodesbatch or size >= self.addnodesbytes:
+
+                            async for node in self._saveNodeDefEdits(todo, oldstrict):
+                                yield node
+
+                            todo.clear()
+                            buids.clear()
+                            size = 0
 
                     await asyncio.sleep(0)
 
@@ -1737,13 +1818,65 @@ class Snap(s_base.Base):
                         raise
                     await self.warn(f'addNodes failed on {nodedefn}: {e}')
                     await asyncio.sleep(0)
+
+            async for node in self._saveNodeDefEdits(todo, oldstrict):
+                yield node
+
         finally:
             self.strict = oldstrict
 
+    async def _saveNodeDefEdits(self, todo, strict):
+
+        nodeedits = []
+        nodecache = {}
+
+        for _, _, edits, cache in todo:
+            nodeedits.extend(edits)
+            nodecache.update(cache)
+
+        if nodeedits:
+            try:
+                await self.applyNodeEdits(nodeedits, nodecache=nodecache)
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception:
+                if strict:
+                    raise
+
+                # apply each nodedef individually to isolate the bad record(s)
+                for nodedefn, _, edits, cache in todo:
+                    try:
+                        await self.applyNodeEdits(edits, nodecache=cache)
+
+                    except asyncio.CancelledError:
+                        raise
+
+                    except Exception as e:
+                        await self.warn(f'addNodes failed on {nodedefn}: {e}')
+
+        for _, buid, _, _ in todo:
+            node = await self.getNodeByBuid(buid)
+            if node is not None:
+                yield node
+
     async def _addNodeDef(self, nodedefn):
 
-        n2buids = set()
+        retn = await self._getNodeDefEdits(nodedefn)
+        if retn is None:
+            return
+
+        buid, nodeedits, nodecache = retn
+        if nodeedits:
+            await self.applyNodeEdits(nodeedits, nodecache=nodecache)
 
+        return await self.getNodeByBuid(buid)
+
+    async def _getNodeDefEdits(self, nodedefn):
+        '''
+        Return a (buid, nodeedits, nodecache) tuple for the nodedef without applying the edits.
+        '''
         (formname, formvalu), forminfo = nodedefn
 
         props = forminfo.get('props')
@@ -1752,42 +1885,45 @@ class Snap(s_base.Base):
         if props is not None:
             props.pop('.created', None)
 
-        async with self.getEditor() as editor:
+        editor = SnapEditor(self)
 
-            protonode = await editor.addNode(formname, formvalu, props=props)
-            if protonode is None:
-                return
+        protonode = await editor.addNode(formname, formvalu, props=props)
+        if protonode is None:
+            return
 
-            tags = forminfo.get('tags')
-            if tags is not None:
-                for tagname, tagvalu in tags.items():
-                    await protonode.addTag(tagname, tagvalu)
+        tags = forminfo.get('tags')
+        if tags is not None:
+            for tagname, tagvalu in tags.items():
+                await protonode.addTag(tagname, tagvalu)
 
-            nodedata = forminfo.get('nodedata')
-            if isinstance(nodedata, dict):
-                for dataname, datavalu in nodedata.items():
-                    if not isinstance(dataname, str):
-                        continue
-                    await protonode.setData(dataname, datavalu)
+        nodedata = forminfo.get('nodedata')
+        if isinstance(nodedata, dict):
+            for dataname, datavalu in nodedata.items():
+                if not isinstance(dataname, str):
+                    continue
+                await protonode.setData(dataname, datavalu)
 
-            tagprops = forminfo.get('tagprops')
-            if tagprops is not None:
-                for tag, props in tagprops.items():
-                    for name, valu in props.items():
-                        await protonode.setTagProp(tag, name, valu)
+        tagprops = forminfo.get('tagprops')
+        if tagprops is not None:
+            for tag, props in tagprops.items():
+                for name, valu in props.items():
+                    await protonode.setTagProp(tag, name, valu)
 
-            for verb, n2iden in forminfo.get('edges', ()):
+        for verb, n2iden in forminfo.get('edges', ()):
 
-                if isinstance(n2iden, (tuple, list)):
-                    n2proto = await editor.addNode(*n2iden)
-                    if n2proto is None:
-                        continue
+            if isinstance(n2iden, (tuple, list)):
+                n2proto = await editor.addNode(*n2iden)
+                if n2proto is None:
+                    continue
 
-                    n2iden = n2proto.iden()
+                n2iden = n2proto.iden()
 
-                await protonode.addEdge(verb, n2iden)
+            await protonode.addEdge(verb, n2iden)
 
-        return await self.getNodeByBuid(protonode.buid)
+        nodeedits = editor.getNodeEdits()
+        nodecache = {proto.buid: proto.node for proto in editor.protonodes.values()}
+
+        return protonode.buid, nodeedits, nodecache
 
     async def getRuntNodes(self, full, valu=None, cmpr=None):
 
@@ -0,0 +1,430 @@
+'''
+A pool of worker processes which execute read-only Storm queries.
+
+Spawned workers open the Cortex slabs read-only and rely on LMDB to
+provide a consistent snapshot for each read transaction.  Results are
+streamed back to the Cortex over a Link created from a socket pair.
+'''
+import os
+import asyncio
+import logging
+import contextlib
+import collections
+import multiprocessing
+
+import synapse.exc as s_exc
+import synapse.common as s_common
+import synapse.cortex as s_cortex
+import synapse.datamodel as s_datamodel
+
+import synapse.lib.auth as s_auth
+import synapse.lib.base as s_base
+import synapse.lib.boss as s_boss
+import synapse.lib.coro as s_coro
+import synapse.lib.link as s_link
+import synapse.lib.view as s_view
+import synapse.lib.layer as s_layer
+import synapse.lib.nexus as s_nexus
+import synapse.lib.trigger as s_trigger
+import synapse.lib.lmdbslab as s_lmdbslab
+
+logger = logging.getLogger(__name__)
+
+class SpawnLayer(s_layer.Layer):
+    '''
+    A Layer which opens its slabs read-only.
+    '''
+    async def _initSlabs(self, slabopts):
+        slabopts['readonly'] = True
+        slabopts['lockmemory'] = False
+        await s_layer.Layer._initSlabs(self, slabopts)
+
+    def _loadFormCounts(self):
+        # the Cortex may have changed the counts since they were cached
+        counts = self.formcounts
+        counts.cache.clear()
+        for lkey, lval in self.layrslab.scanByFull(db=counts.db):
+            counts.cache[lkey] = counts.DecFunc(lval)
+
+class SpawnView(s_view.View):
+    '''
+    A View over read-only layers which does not persist any state.
+    '''
+    async def __anit__(self, core, vdef, layers):
+
+        self.iden = vdef.get('iden')
+        self.bidn = s_common.uhex(self.iden)
+        self.info = vdef
+
+        self.core = core
+        self.dirn = None
+
+        self.triggers = s_trigger.Triggers(self)
+
+        await s_nexus.Pusher.__anit__(self, iden=self.iden)
+
+        self.layers = layers
+        self.invalid = None
+        self.parent = None
+        self.merging = False
+
+        self.trigtask = None
+        self.mergetask = None
+
+class SpawnCore(s_cortex.Cortex):
+    '''
+    A read-only Cortex used by spawned Storm worker processes.
+
+    Notes:
+        Only the Cortex APIs required to run read-only Storm queries are
+        initialized.  Storm services, queues, and other Cell facilities
+        are not available.
+    '''
+    async def __anit__(self, spawninfo):
+
+        await s_base.Base.__anit__(self)
+
+        self.spawninfo = spawninfo
+
+        self.iden = spawninfo.get('iden')
+        self.dirn = spawninfo.get('dirn')
+        self.conf = spawninfo.get('conf')
+
+        self.isactive = False
+        self.inaugural = False
+        self.nexsroot = None
+        self.ahasvcname = None
+
+        self._initCoreAttrs()
+
+        # the package graphs are initialized with the graph storage in the Cortex
+        self.pkggraphs = {}
+
+        self.boss = await s_boss.Boss.anit()
+        self.onfini(self.boss)
+
+        path = os.path.join(self.dirn, 'slabs', 'cell.lmdb')
+        self.slab = await s_lmdbslab.Slab.anit(path, readonly=True)
+        self.onfini(self.slab)
+
+        self.cortexdata = self.slab.getSafeKeyVal('cortex')
+        self.stormvars = self.cortexdata.getSubKeyVal('storm:vars:')
+        self.tagmeta = self.cortexdata.getSubKeyVal('tagmeta:')
+        self.cmddefs = self.cortexdata.getSubKeyVal('storm:cmds:')
+        self.pkgdefs = self.cortexdata.getSubKeyVal('storm:packages:')
+        self.svcdefs = self.cortexdata.getSubKeyVal('storm:services:')
+
+        seed = s_common.guid((self.iden, 'hive', 'auth'))
+        self.auth = await s_auth.Auth.anit(self.slab, 'auth', seed=seed)
+        self.onfini(self.auth)
+
+        self.permdefs = None
+        self.permlook = None
+
+        self.dynitems = {
+            'auth': self.auth,
+            'cell': self,
+            'cortex': self,
+        }
+
+        self.model = s_datamodel.Model(core=self)
+        self.model.addDataModels(spawninfo.get('model'))
+
+        self._initStormLibs()
+        await self._initStormCmds()
+
+        storminfo = spawninfo.get('storm')
+
+        for cdef in storminfo.get('cmds'):
+            await self._trySetStormCmd(cdef.get('name'), cdef)
+
+        for pkgdef in storminfo.get('pkgs'):
+            await self._tryLoadStormPkg(pkgdef)
+
+        async def fini():
+            [await layr.fini() for layr in list(self.layers.values())]
+
+        self.onfini(fini)
+
+    async def fini(self):
+        # the spawned process does not hold the cell guid lock
+        return await s_base.Base.fini(self)
+
+    async def getLogExtra(self, **kwargs):
+        return {'synapse': kwargs}
+
+    def _clearAuthCache(self):
+        self.auth.userbyidencache.clear()
+        self.auth.useridenbynamecache.clear()
+        self.auth.rolebyidencache.clear()
+        self.auth.roleidenbynamecache.clear()
+        self.auth.authgates.clear()
+
+    async def _getSpawnLayer(self, layrinfo):
+
+        iden = layrinfo.get('iden')
+
+        layr = self.layers.get(iden)
+        if layr is not None:
+            layr._loadFormCounts()
+            return layr
+
+        layr = await SpawnLayer.anit(self, layrinfo)
+        self.layers[iden] = layr
+        return layr
+
+    async def _getSpawnView(self, vdef, layrinfos):
+        layers = [await self._getSpawnLayer(layrinfo) for layrinfo in layrinfos]
+        return await SpawnView.anit(self, vdef, layers)
+
+    async def _runSpawnTodo(self, link, todo):
+
+        name, info = todo
+
+        # always use the current auth state from the Cortex
+        self._clearAuthCache()
+
+        try:
+
+            async with await self._getSpawnView(info.get('view'), info.get('layers')) as view:
+
+                text = info.get('text')
+                opts = info.get('opts')
+
+                if name == 'storm':
+                    async for mesg in view.storm(text, opts=opts):
+                        await link.tx(('mesg', mesg))
+                    retn = (True, None)
+
+                elif name == 'count':
+                    retn = (True, await view.count(text, opts=opts))
+
+                else:
+                    raise s_exc.BadMesgFormat(mesg=f'Unknown spawn task: {name}')
+
+        except Exception as e:
+            retn = s_common.retnexc(e)
+
+        await link.tx(('retn', {'retn': retn}))
+
+async def _spawnProcMain(spawninfo):
+
+    link = await s_link.fromspawn(spawninfo.pop('link'))
+
+    async with link:
+
+        async with await SpawnCore.anit(spawninfo) as core:
+
+            while not link.isfini:
+
+                todo = await link.rx()
+                if todo is None:
+                    return
+
+                await core._runSpawnTodo(link, todo)
+
+def _runSpawnProc(spawninfo):
+    # This is a new process: configure logging
+    s_common.setlogging(logger, **spawninfo.get('logconf', {}))
+    asyncio.run(_spawnProcMain(spawninfo))
+
+class SpawnProc(s_base.Base):
+    '''
+    A worker process which executes read-only Storm queries for a Cortex.
+    '''
+    async def __anit__(self, spawninfo, vers):
+
+        await s_base.Base.__anit__(self)
+
+        self.vers = vers
+
+        self.link, sock = await s_link.linksock()
+        self.onfini(self.link)
+
+        spawninfo = dict(spawninfo)
+        spawninfo['link'] = {'info': {'unix': True}, 'sock': sock}
+
+        ctx = multiprocessing.get_context('spawn')
+        self.proc = ctx.Process(target=_runSpawnProc, args=(spawninfo,))
+
+        try:
+            await s_coro.executor(self.proc.start)
+        finally:
+            sock.close()
+
+        async def fini():
+            # the process exits once the link is closed
+            await s_coro.executor(self.proc.join, 10)
+            if self.proc.is_alive():  # pragma: no cover
+                logger.warning(f'Spawned Storm process {self.proc.pid} did not exit, terminating it.')
+                self.proc.terminate()
+                await s_coro.executor(self.proc.join)
+
+        self.onfini(fini)
+
+    async def _rxSpawnMesg(self):
+        mesg = await self.link.rx()
+        if mesg is None:
+            raise s_exc.SpawnExit(mesg='Spawned Storm process exited unexpectedly.', code=self.proc.exitcode)
+        return mesg
+
+    async def storm(self, todo):
+
+        await self.link.tx(todo)
+
+        while True:
+
+            mesg = await self._rxSpawnMesg()
+            if mesg[0] == 'retn':
+                s_common.result(mesg[1].get('retn'))
+                return
+
+            yield mesg[1]
+
+    async def count(self, todo):
+        await self.link.tx(todo)
+        mesg = await self._rxSpawnMesg()
+        return s_common.result(mesg[1].get('retn'))
+
+class SpawnPool(s_base.Base):
+    '''
+    A pool of spawned processes which execute read-only Storm queries for a Cortex.
+    '''
+    async def __anit__(self, core, size):
+
+        await s_base.Base.__anit__(self)
+
+        self.core = core
+        self.size = size
+
+        # bumped when the Cortex state used to initialize a process changes
+        self.vers = 0
+        self.spawninfo = None
+
+        self.idle = collections.deque()
+        self.procs = set()
+
+        self.sema = asyncio.Semaphore(size)
+
+        self.core.on('core:extmodel:change', self._onSpawnChange)
+        self.core.on('core:tagprop:change', self._onSpawnChange)
+
+        async def fini():
+            self.idle.clear()
+            [await proc.fini() for proc in list(self.procs)]
+
+        self.onfini(fini)
+
+    async def _onSpawnChange(self, mesg):
+        self.bump()
+
+    def bump(self):
+        '''
+        Retire the current processes because the Cortex state they were created from has changed.
+        '''
+        self.vers += 1
+        self.spawninfo = None
+
+        while self.idle:
+            proc = self.idle.popleft()
+            self.schedCoro(proc.fini())
+
+    async def _initSpawnProc(self):
+
+        vers = self.vers
+
+        spawninfo = self.spawninfo
+        if spawninfo is None:
+            spawninfo = self.spawninfo = await self.core.getSpawnInfo()
+
+        proc = await SpawnProc.anit(spawninfo, vers)
+
+        self.procs.add(proc)
+
+        async def fini():
+            self.procs.discard(proc)
+
+        proc.onfini(fini)
+        return proc
+
+    @contextlib.asynccontextmanager
+    async def getSpawnProc(self):
+
+        async with self.sema:
+
+            proc = None
+            while self.idle:
+                proc = self.idle.popleft()
+                if not proc.isfini:
+                    break
+                proc = None
+
+            if proc is None:
+                proc = await self._initSpawnProc()
+
+            done = False
+
+            try:
+                yield proc
+                done = True
+
+            finally:
+                # a process which did not complete its task may still be running it
+                if done and not self.isfini and not proc.isfini and proc.vers == self.vers:
+                    self.idle.append(proc)
+                else:
+                    await proc.fini()
+
+    async def _syncSlab(self, slab, dirty=False):
+        # only commit slabs with writes which are not yet visible to other processes
+        if dirty or slab.dirty or slab.commitfut is not None:
+            await slab.sync()
+
+    async def _getSpawnTodo(self, name, view, text, opts):
+
+        # ensure the spawned process sees any pending changes
+        await self._syncSlab(self.core.slab)
+
+        for layr in view.layers:
+            await self._syncSlab(layr.layrslab, dirty=bool(layr.dirty))
+            await self._syncSlab(layr.dataslab)
+
+        opts = dict(opts)
+        opts.pop('task', None)
+        opts['readonly'] = True
+
+        info = {
+            'text': text,
+            'opts': opts,
+            'view': view.info,
+            'layers': [layr.layrinfo for layr in view.layers],
+        }
+
+        return (name, info)
+
+    async def storm(self, view, text, opts):
+        '''
+        Execute a read-only Storm query in a spawned process and yield the messages.
+        '''
+        user = self.core._userFromOpts(opts)
+
+        taskinfo = {'query': text, 'view': view.iden, 'spawn': True}
+        synt = await self.core.boss.promote('storm', user=user, info=taskinfo, taskiden=opts.get('task'))
+
+        todo = await self._getSpawnTodo('storm', view, text, opts)
+
+        # use the same task iden in the spawned process
+        todo[1]['opts']['task'] = synt.iden
+
+        async with self.getSpawnProc() as proc:
+            async for mesg in proc.storm(todo):
+                yield mesg
+
+    async def count(self, view, text, opts):
+        '''
+        Count the nodes produced by a read-only Storm query in a spawned process.
+        '''
+        todo = await self._getSpawnTodo('count', view, text, opts)
+
+        async with self.getSpawnProc() as proc:
+            return await proc.count(todo)
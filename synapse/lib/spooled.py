@@ -1,3 +1,5 @@
+import heapq
+import asyncio
 import tempfile
 
 import synapse.common as s_common
@@ -9,6 +11,59 @@ import synapse.lib.lmdbslab as s_lmdbslab
 
 MAX_SPOOL_SIZE = 10000
 
+async def sortedItems(items, key=None, reverse=False, dirn=None, size=MAX_SPOOL_SIZE):
+    '''
+    Yield items in sorted order without holding more than size items in RAM.
+
+    Args:
+        items (iter): An iterable of msgpack compatible items to sort.
+        key (func): An optional function to return the sort key of an item.
+        reverse (bool): Yield items in descending order.
+        dirn (Optional[str]): base directory used for temporary files.  If None, system temporary directory is used
+        size (int): maximum number of items stored in RAM before a sorted run is spooled to disk
+
+    Notes:
+        Items are sorted in runs of size items and each run is spooled to a temporary
+        file.  The runs are then merged as the sorted items are consumed.
+    '''
+    if dirn is not None:
+        # Consolidate the spooled files underneath 'tmp' to make it easy for backup tool to avoid copying
+        dirn = s_common.gendir(dirn, 'tmp')
+
+    runs = []
+    chunk = []
+
+    try:
+
+        for item in items:
+
+            chunk.append(item)
+            if len(chunk) < size:
+                continue
+
+            chunk.sort(key=key, reverse=reverse)
+
+            fd = tempfile.TemporaryFile(dir=dirn, prefix='spooled_', suffix='.sort')
+            runs.append(fd)
+
+            [fd.write(s_msgpack.en(valu)) for valu in chunk]
+
+            fd.seek(0)
+            chunk.clear()
+
+            await asyncio.sleep(0)
+
+        chunk.sort(key=key, reverse=reverse)
+
+        genrs = [s_msgpack.iterfd(fd) for fd in runs]
+        genrs.append(chunk)
+
+        for item in heapq.merge(*genrs, key=key, reverse=reverse):
+            yield item
+
+    finally:
+        [fd.close() for fd in runs]
+
 class Spooled(s_base.Base):
     '''
     A Base class that can be used to implement objects which fallback to lmdb.
@@ -208,3 +263,79 @@ class Dict(Spooled):
 
         for item in list(self.realdict.items()):
             yield item
+
+class Counter(Spooled):
+    '''
+    A counter implementation which pre-aggregates counts in RAM and spools them to a slab on large growth.
+
+    Items are yielded in the order they were first counted.
+    '''
+
+    async def __anit__(self, dirn=None, size=MAX_SPOOL_SIZE, cell=None):
+
+        await Spooled.__anit__(self, dirn=dirn, size=size, cell=cell)
+
+        # the totals, or the pending increments once we have fallen back
+        self.realdict = {}
+        self.len = 0
+
+    async def _initFallBack(self):
+        await Spooled._initFallBack(self)
+        self.counts = self.slab.initdb('counts')
+        self.order = self.slab.initdb('order')
+
+    def _flush(self):
+
+        for key, valu in self.realdict.items():
+
+            lkey = s_msgpack.en(key)
+
+            byts = self.slab.get(lkey, db=self.counts)
+            if byts is None:
+                self.slab.put(s_common.int64en(self.len), lkey, db=self.order)
+                self.len += 1
+            else:
+                valu += s_msgpack.un(byts)
+
+            self.slab.put(lkey, s_msgpack.en(valu), db=self.counts)
+
+        self.realdict.clear()
+
+    def __len__(self):
+        if self.fallback:
+            self._flush()
+            return self.len
+        return len(self.realdict)
+
+    async def inc(self, key, valu=1):
+
+        self.realdict[key] = self.realdict.get(key, 0) + valu
+
+        if len(self.realdict) >= self.size:
+            if not self.fallback:
+                await self._initFallBack()
+            self._flush()
+
+    def get(self, key, defv=0):
+
+        if not self.fallback:
+            return self.realdict.get(key, defv)
+
+        byts = self.slab.get(s_msgpack.en(key), db=self.counts)
+        if byts is None:
+            return self.realdict.get(key, defv)
+
+        return s_msgpack.un(byts) + self.realdict.get(key, 0)
+
+    def items(self):
+
+        if not self.fallback:
+            # avoid edit while iter issues...
+            for item in list(self.realdict.items()):
+                yield item
+            return
+
+        self._flush()
+
+        for _, lkey in self.slab.scanByFull(db=self.order):
+            yield s_msgpack.un(lkey), s_msgpack.un(self.slab.get(lkey, db=self.counts))
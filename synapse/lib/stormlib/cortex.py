@@ -1248,6 +1248,10 @@ class StormPoolSetCmd(s_storm.Cmd):
             help='The maximum amount of time to wait for a connection from the pool to become available.')
         pars.add_argument('--sync-timeout', type='int', default=2,
             help='The maximum amount of time to wait for the mirror to be in sync with the leader')
+        pars.add_argument('--balance', type='str', default='roundrobin',
+            choices=('roundrobin', 'least', 'ewma', 'lag'),
+            help='The policy used to select a pool member: roundrobin, least (fewest in-flight queries), '
+                 'ewma (in-flight queries weighted by latency), or lag (fewest in-flight queries then lowest nexus lag).')
         pars.add_argument('url', type='str', required=True, help='The telepath URL for the AHA service pool.')
         return pars
 
@@ -1269,6 +1273,7 @@ class StormPoolSetCmd(s_storm.Cmd):
             raise s_exc.BadArg(mesg=f'Unable to set Storm pool URL from url={self.opts.url} : {e.get("mesg")}') from None
 
         opts = {
+            'balance': self.opts.balance,
             'timeout:sync': self.opts.sync_timeout,
             'timeout:connection': self.opts.connection_timeout,
         }
@@ -1321,3 +1326,4 @@ class StormPoolGetCmd(s_storm.Cmd):
         await self.runt.printf(f'Storm Pool URL: {url}')
         await self.runt.printf(f'Sync Timeout (secs): {opts.get("timeout:sync")}')
         await self.runt.printf(f'Connection Timeout (secs): {opts.get("timeout:connection")}')
+        await self.runt.printf(f'Balancing Policy: {opts.get("balance", "roundrobin")}')
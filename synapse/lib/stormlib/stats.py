@@ -1,9 +1,11 @@
-import collections
+import heapq
 
 import synapse.exc as s_exc
 import synapse.common as s_common
 
+import synapse.lib.coro as s_coro
 import synapse.lib.storm as s_storm
+import synapse.lib.spooled as s_spooled
 import synapse.lib.stormtypes as s_stormtypes
 
 class StatsCountByCmd(s_storm.Cmd):
@@ -20,6 +22,9 @@ class StatsCountByCmd(s_storm.Cmd):
 
         // Show counts of attacker names for risk:compromise nodes.
         risk:compromise | stats.countby :attacker::name
+
+        // Show counts of inet:fqdn:domain values using the property index.
+        stats.countby --prop inet:fqdn:domain
     '''
 
     name = 'stats.countby'
@@ -41,6 +46,8 @@ class StatsCountByCmd(s_storm.Cmd):
                           help='Maximum width of the labels to display.')
         pars.add_argument('--yield', default=False, action='store_true',
                           dest='yieldnodes', help='Yield inbound nodes.')
+        pars.add_argument('--prop', type='str', default=None,
+                          help='Tally the values of a property in the view using the property index instead of inbound nodes.')
         pars.add_argument('--by-name', default=False, action='store_true',
                           help='Print stats sorted by name instead of count.')
         return pars
@@ -59,79 +66,107 @@ class StatsCountByCmd(s_storm.Cmd):
 
         byname = await s_stormtypes.tobool(self.opts.by_name)
 
-        counts = collections.defaultdict(int)
-
         usenode = self.opts.valu is s_common.novalu
 
-        async for node, path in genr:
-            if self.opts.yieldnodes:
-                yield node, path
+        prop = None
+        propname = await s_stormtypes.tostr(self.opts.prop, noneok=True)
+        if propname is not None:
+            if not usenode:
+                mesg = 'The --prop option may not be used with a value to tally.'
+                raise s_exc.BadArg(mesg=mesg)
 
-            if usenode:
-                valu = node.repr()
-            else:
-                valu = self.opts.valu
-                if s_stormtypes.ismutable(valu):
-                    raise s_exc.BadArg(mesg='Mutable values cannot be used for counting.')
+            prop = runt.model.reqProp(propname)
 
-                valu = await s_stormtypes.tostr(await s_stormtypes.toprim(valu))
+        core = runt.snap.core
+        async with await s_spooled.Counter.anit(dirn=core.dirn, cell=core) as counts:
 
-            counts[valu] += 1
+            async for node, path in genr:
+                if self.opts.yieldnodes:
+                    yield node, path
 
-        if len(counts) == 0:
-            await runt.printf('No values to display!')
-            return
+                if prop is not None:
+                    continue
 
-        if byname:
-            # Try to sort numerically instead of lexicographically
-            def coerce(indx):
-                def wrapped(valu):
-                    valu = valu[indx]
+                if usenode:
+                    valu = node.repr()
+                else:
+                    valu = self.opts.valu
+                    if s_stormtypes.ismutable(valu):
+                        raise s_exc.BadArg(mesg='Mutable values cannot be used for counting.')
+
+                    valu = await s_stormtypes.tostr(await s_stormtypes.toprim(valu))
+
+                await counts.inc(valu)
+
+            if prop is not None:
+                async for valu, count in runt.snap.view.iterPropValuCounts(prop.full):
+                    await counts.inc(prop.type.repr(valu), count)
+
+            if len(counts) == 0:
+                await runt.printf('No values to display!')
+                return
+
+            # Ties are sorted by the order the values were first counted
+            if byname:
+                # Try to sort numerically instead of lexicographically
+                def sortkey(item):
+                    indx, (name, count) = item
                     try:
-                        return int(valu)
+                        return (int(name), indx)
                     except ValueError:
-                        return valu
-                return wrapped
+                        return (name, indx)
 
-            values = list(sorted(counts.items(), key=coerce(0)))
-            maxv = max(val[1] for val in values)
+            else:
+                def sortkey(item):
+                    indx, (name, count) = item
+                    return (count, indx)
 
-        else:
-            values = list(sorted(counts.items(), key=lambda x: x[1]))
-            maxv = values[-1][1]
+            size = await s_stormtypes.toint(self.opts.size, noneok=True)
+            char = (await s_stormtypes.tostr(self.opts.char))[0]
+            reverse = self.opts.reverse
 
-        size = await s_stormtypes.toint(self.opts.size, noneok=True)
-        char = (await s_stormtypes.tostr(self.opts.char))[0]
-        reverse = self.opts.reverse
+            maxv = max(count for (name, count) in counts.items())
 
-        if reverse:
-            order = 1
             if size:
-                values = values[:size]
-        else:
-            order = -1
-            if size:
-                values = values[len(values) - size:]
 
-        namewidth = 0
-        countwidth = 0
-        for (name, count) in values:
-            if (namelen := len(str(name))) > namewidth:
-                namewidth = namelen
+                items = enumerate(counts.items())
+
+                if reverse:
+                    values = heapq.nsmallest(size, items, key=sortkey)
+                else:
+                    values = heapq.nlargest(size, items, key=sortkey)
+
+                shown = (item for (indx, item) in values)
+
+            else:
+                shown = counts.items()
+
+            namewidth = 0
+            countwidth = 0
+            for (name, count) in shown:
+                if (namelen := len(str(name))) > namewidth:
+                    namewidth = namelen
+
+                if (countlen := len(str(count))) > countwidth:
+                    countwidth = countlen
 
-            if (countlen := len(str(count))) > countwidth:
-                countwidth = countlen
+            if labelwidth is not None:
+                namewidth = min(labelwidth, namewidth)
 
-        if labelwidth is not None:
-            namewidth = min(labelwidth, namewidth)
+            if size:
+                values = s_coro.agen(values)
+            else:
+                # all of the values are displayed, so they are sorted on disk and streamed
+                items = enumerate(counts.items())
+                values = s_spooled.sortedItems(items, key=sortkey, reverse=not reverse, dirn=core.dirn)
 
-        for (name, count) in values[::order]:
+            async for (indx, (name, count)) in values:
 
-            barsize = int((count / maxv) * barwidth)
-            bar = ''.ljust(barsize, char)
-            line = f'{name[0:namewidth].rjust(namewidth)} | {count:>{countwidth}} | {bar}'
+                barsize = int((count / maxv) * barwidth)
+                bar = ''.ljust(barsize, char)
+                line = f'{name[0:namewidth].rjust(namewidth)} | {count:>{countwidth}} | {bar}'
 
-            await runt.printf(line)
+                await runt.printf(line)
 
 @s_stormtypes.registry.registerLib
 class LibStats(s_stormtypes.Lib):
@@ -152,7 +187,9 @@ class LibStats(s_stormtypes.Lib):
 
     @s_stormtypes.stormfunc(readonly=True)
     async def tally(self):
-        return StatTally(path=self.path)
+        core = self.runt.snap.core
+        counters = await s_spooled.Counter.anit(dirn=core.dirn, cell=core)
+        return StatTally(counters, path=self.path)
 
 @s_stormtypes.registry.registerType
 class StatTally(s_stormtypes.Prim):
@@ -199,9 +236,9 @@ class StatTally(s_stormtypes.Prim):
     )
     _ismutable = True
 
-    def __init__(self, path=None):
+    def __init__(self, counters, path=None):
         s_stormtypes.Prim.__init__(self, {}, path=path)
-        self.counters = collections.defaultdict(int)
+        self.counters = counters
         self.locls.update(self.getObjLocals())
 
     def getObjLocals(self):
@@ -222,7 +259,7 @@ class StatTally(s_stormtypes.Prim):
     async def inc(self, name, valu=1):
         name = await s_stormtypes.tostr(name)
         valu = await s_stormtypes.toint(valu)
-        self.counters[name] += valu
+        await self.counters.inc(name, valu)
 
     @s_stormtypes.stormfunc(readonly=True)
     async def get(self, name):
@@ -230,10 +267,10 @@ class StatTally(s_stormtypes.Prim):
         return self.counters.get(name, 0)
 
     def value(self):
-        return dict(self.counters)
+        return dict(self.counters.items())
 
     async def iter(self):
-        for item in tuple(self.counters.items()):
+        for item in self.counters.items():
             yield item
 
     @s_stormtypes.stormfunc(readonly=True)
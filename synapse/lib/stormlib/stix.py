@@ -14,8 +14,6 @@ import synapse.lib.schemas as s_schemas
 import synapse.lib.stormctrl as s_stormctrl
 import synapse.lib.stormtypes as s_stormtypes
 
-import stix2validator
-
 logger = logging.getLogger(__name__)
 
 def uuid5(valu=None):
@@ -583,6 +581,10 @@ def _validateConfig(runt, config):
                             raise s_exc.BadConfValu(mesg=mesg)
 
 def validateStix(bundle, version='2.1'):
+
+    # stix2validator is slow to import and only needed here
+    import stix2validator
+
     ret = {
         'ok': False,
         'mesg': '',
@@ -7978,6 +7978,22 @@ class View(Prim):
                   ),
                   'returns': {'name': 'yields', 'type': 'any', 'desc': 'Unique property values.', }}},
 
+        {'name': 'getPropValueCounts',
+         'desc': '''
+            Yield (value, count) tuples for the unique property values in the view for the given form or property name.
+
+            Notes:
+               The counts are calculated from the property indexes of each layer
+               without lifting nodes. Property values which are overwritten in
+               higher layers of the view are not included in the count.
+            ''',
+         'type': {'type': 'function', '_funcname': '_methGetPropValueCounts',
+                  'args': (
+                      {'name': 'propname', 'type': 'str', 'desc': 'The property or form name to look up.', },
+                  ),
+                  'returns': {'name': 'yields', 'type': 'list',
+                              'desc': 'A tuple of a unique property value and the number of nodes with that value.', }}},
+
         {'name': 'detach', 'desc': 'Detach the view from its parent. WARNING: This cannot be reversed.',
          'type': {'type': 'function', '_funcname': 'detach',
                   'args': (),
@@ -8083,6 +8099,7 @@ class View(Prim):
             'getFormCounts': self._methGetFormcount,
             'getPropCount': self._methGetPropCount,
             'getPropValues': self._methGetPropValues,
+            'getPropValueCounts': self._methGetPropValueCounts,
             'getTagPropCount': self._methGetTagPropCount,
             'getPropArrayCount': self._methGetPropArrayCount,
 
@@ -8210,6 +8227,17 @@ class View(Prim):
         async for valu in view.iterPropValues(propname):
             yield valu
 
+    @stormfunc(readonly=True)
+    async def _methGetPropValueCounts(self, propname):
+        propname = await tostr(propname)
+
+        viewiden = self.valu.get('iden')
+        self.runt.confirm(('view', 'read'), gateiden=viewiden)
+        view = self.runt.snap.core.getView(viewiden)
+
+        async for item in view.iterPropValuCounts(propname):
+            yield item
+
     @stormfunc(readonly=True)
     async def _methGetChildren(self):
         view = self._reqView()
@@ -78,15 +78,30 @@ class Type:
         self.locked = False
         self.deprecated = bool(self.info.get('deprecated', False))
 
+        self._typehash = None
+
         self.postTypeInit()
 
-        normopts = dict(self.opts)
-        for optn, valu in normopts.items():
-            if isinstance(valu, float):
-                normopts[optn] = str(valu)
+    @property
+    def typehash(self):
+        '''
+        A hash of the type class and options.
 
-        ctor = '.'.join([self.__class__.__module__, self.__class__.__qualname__])
-        self.typehash = sys.intern(s_common.guid((ctor, s_common.flatten(normopts))))
+        Notes:
+            This is computed on first use since most of the types created while
+            loading the data model are never compared.
+        '''
+        if self._typehash is None:
+
+            normopts = dict(self.opts)
+            for optn, valu in normopts.items():
+                if isinstance(valu, float):
+                    normopts[optn] = str(valu)
+
+            ctor = '.'.join([self.__class__.__module__, self.__class__.__qualname__])
+            self._typehash = sys.intern(s_common.guid((ctor, s_common.flatten(normopts))))
+
+        return self._typehash
 
     def _storLiftSafe(self, cmpr, valu):
         try:
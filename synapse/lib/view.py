@@ -23,6 +23,9 @@ import synapse.lib.stormtypes as s_stormtypes
 
 logger = logging.getLogger(__name__)
 
+MERGE_CHUNK_SIZE = 1000        # number of nodeedits applied to the parent layer per nexus event
+MERGE_CHECKPOINT_SIZE = 10000  # number of merged nodes between resumable merge checkpoints
+
 class ViewApi(s_cell.CellApi):
 
     async def __anit__(self, core, link, user, view):
@@ -392,8 +395,10 @@ class View(s_nexus.Pusher):  # type: ignore
         # not receiving any edits.
         try:
 
+            layr = self.layers[0]
+
             # ensure there are none marked dirty
-            await self.layers[0]._saveDirtySodes()
+            await layr._saveDirtySodes()
 
             merge = self.getMergeRequest()
             votes = [vote async for vote in self.getMergeVotes()]
@@ -404,24 +409,32 @@ class View(s_nexus.Pusher):  # type: ignore
                 'merge': merge.get('iden'),
             }
 
+            # resume from the checkpoint saved by a previous run of this merge
+            count = 0
+            startbuid = None
+
+            byts = self.core.slab.get(self.bidn + b'merge:offs', db='view:meta')
+            if byts is not None:
+                startbuid, count = s_msgpack.un(byts)
+
             async def chunked():
                 nodeedits = []
 
-                async for nodeedit in self.layers[0].iterLayerNodeEdits():
+                async for nodeedit in layr.iterLayerNodeEdits(startbuid=startbuid):
 
                     nodeedits.append(nodeedit)
 
-                    if len(nodeedits) == 10:
+                    if len(nodeedits) == MERGE_CHUNK_SIZE:
                         yield nodeedits
-                        nodeedits.clear()
+                        nodeedits = []
 
                 if nodeedits:
                     yield nodeedits
 
-            total = self.layers[0].getStorNodeCount()
+            total = layr.getStorNodeCount()
 
-            count = 0
-            nextprog = 1000
+            nextprog = (count // 1000 + 1) * 1000
+            nextsave = count + MERGE_CHECKPOINT_SIZE
 
             await self.core.feedBeholder('view:merge:prog', {'view': self.iden, 'count': count, 'total': total, 'merge': merge, 'votes': votes})
 
@@ -431,7 +444,14 @@ class View(s_nexus.Pusher):  # type: ignore
 
                     meta['time'] = s_common.now()
 
-                    await snap.saveNodeEdits(edits, meta)
+                    # edits only need to be applied through the snap to fire triggers in the parent
+                    # view, otherwise they are saved directly to the parent write layer in bulk.
+                    # triggers may be added during a long running merge so this is checked per chunk.
+                    if not self.parent.triggers.triggers:
+                        await snap.wlyr.saveNodeEdits(edits, meta)
+                    else:
+                        await snap.saveNodeEdits(edits, meta)
+
                     await asyncio.sleep(0)
 
                     count += len(edits)
@@ -440,6 +460,10 @@ class View(s_nexus.Pusher):  # type: ignore
                         await self.core.feedBeholder('view:merge:prog', {'view': self.iden, 'count': count, 'total': total, 'merge': merge, 'votes': votes})
                         nextprog += 1000
 
+                    if count >= nextsave:
+                        await self._setMergeCheckpoint(snap.wlyr, edits[-1][0], count)
+                        nextsave += MERGE_CHECKPOINT_SIZE
+
             await self.core.feedBeholder('view:merge:fini', {'view': self.iden, 'merge': merge, 'merge': merge, 'votes': votes})
 
             # remove the view and top layer
@@ -448,6 +472,12 @@ class View(s_nexus.Pusher):  # type: ignore
         except Exception as e: # pragma: no cover
             logger.exception(f'Error while merging view: {self.iden}')
 
+    async def _setMergeCheckpoint(self, wlyr, buid, count):
+        # the parent layer must be committed before the checkpoint to allow resuming after a crash
+        await wlyr.layrslab.sync()
+
+        self.core.slab.put(self.bidn + b'merge:offs', s_msgpack.en((buid, count)), db='view:meta')
+
     async def isMergeReady(self):
         # count the current votes and potentially trigger a merge
 
@@ -867,6 +897,72 @@ class View(s_nexus.Pusher):  # type: ignore
                         yield valu
                         break
 
+    async def iterPropValuCounts(self, propname):
+        '''
+        Yield (valu, count) tuples for each unique property value in the view from the property indexes.
+
+        Nodes are not lifted; rows which are shadowed by the property being set
+        in a higher layer of the view are not counted.
+        '''
+        prop = self.core.model.reqProp(propname)
+
+        formname = None
+        propname = None
+
+        if prop.isform:
+            formname = prop.name
+        else:
+            propname = prop.name
+            if not prop.isuniv:
+                formname = prop.form.name
+
+        def isset(sode):
+            if propname is None:
+                return sode.get('valu') is not None
+            return sode['props'].get(propname) is not None
+
+        async def wrapgenr(lidx, layr):
+
+            uppers = self.layers[:lidx]
+
+            async for indx, valu, count in layr.iterPropValuCounts(formname, propname, prop.type.stortype):
+
+                if uppers:
+                    count = 0
+                    async for buid in layr.iterPropIndxBuids(formname, propname, indx):
+                        for upper in uppers:
+                            if (sode := upper._getStorNode(buid)) is not None and isset(sode):
+                                break
+                        else:
+                            count += 1
+
+                    if count == 0:
+                        continue
+
+                yield indx, valu, count
+
+        genrs = [wrapgenr(lidx, layr) for (lidx, layr) in enumerate(self.layers)]
+
+        lastindx = None
+        lastvalu = None
+        total = 0
+
+        async for indx, valu, count in s_common.merggenr2(genrs, cmprkey=lambda x: x[0]):
+
+            if indx == lastindx:
+                total += count
+                continue
+
+            if lastindx is not None:
+                yield lastvalu, total
+
+            lastindx = indx
+            lastvalu = valu
+            total = count
+
+        if lastindx is not None:
+            yield lastvalu, total
+
     async def getEdgeVerbs(self):
 
         async with await s_spooled.Set.anit(dirn=self.core.dirn, cell=self.core) as vset:
@@ -932,9 +1028,101 @@ class View(s_nexus.Pusher):  # type: ignore
             await self.core.boss.promote('storm', user=user, info=taskinfo, taskiden=taskiden)
 
             async with await self.snap(user=user) as snap:
+
+                query = await self.core.getStormQuery(text, mode=opts.get('mode', 'storm'))
+                snap.lazynodes = query.isLazySafe(yields=not opts.get('_count', False))
+
                 async for node in snap.eval(text, opts=opts, user=user):
                     yield node
 
+    async def count(self, text, opts=None):
+        '''
+        Return the number of nodes produced by a storm query.
+
+        Notes:
+            Queries which only lift by a form, property, or tag (optionally with
+            a filter which the lift uses as a hint) are counted using the storage
+            indexes rather than constructing the nodes. Queries which only lift
+            nodes and pass them through the uniq or count commands defer retrieving
+            the storage nodes for layers which did not produce a lifted node.
+        '''
+        opts = self.core._initStormOpts(opts)
+
+        count = await self._getIndxCount(text, opts)
+        if count is not None:
+            return count
+
+        # the nodes produced by the query are only counted
+        opts = opts.copy()
+        opts['_count'] = True
+
+        count = 0
+        async for _ in self.eval(text, opts=opts):
+            count += 1
+
+        return count
+
+    async def _getIndxCount(self, text, opts):
+
+        if opts.get('mode', 'storm') != 'storm':
+            return None
+
+        if opts.get('idens') or opts.get('ndefs') or opts.get('limit') is not None:
+            return None
+
+        query = await self.core.getStormQuery(text)
+
+        hint = query.getCountHint()
+        if hint is None:
+            return None
+
+        name = hint[1].get('name')
+        form = hint[1].get('form')
+
+        if form is not None:
+            form = self.core.model.form(form)
+            if form is None or form.isrunt:
+                return None
+
+        if hint[0] == 'prop':
+
+            prop = self.core.model.prop(name)
+            if prop is None or prop.isrunt:
+                return None
+
+            if form is not None and prop.form is not form:
+                return None
+
+            if prop.isform:
+                formname, propname = prop.name, None
+            elif prop.isuniv:
+                formname, propname = None, prop.name
+            else:
+                formname, propname = prop.form.name, prop.name
+
+            async def countfunc():
+                return await self.core._countByProp(formname, propname, self.layers)
+
+        else:
+
+            formname = None
+            if form is not None:
+                formname = form.name
+
+            async def countfunc():
+                return await self.core._countByTag(name, formname, self.layers)
+
+        user = self.core._userFromOpts(opts)
+
+        info = opts.get('_loginfo', {})
+        info.update({'mode': 'storm', 'view': self.iden})
+        self.core._logStormQuery(text, user, info=info)
+
+        taskinfo = {'query': text, 'view': self.iden}
+        await self.core.boss.promote('storm', user=user, info=taskinfo, taskiden=opts.get('task'))
+
+        return await countfunc()
+
     async def callStorm(self, text, opts=None):
         user = self.core._userFromOpts(opts)
         try:
@@ -1024,7 +1212,7 @@ class View(s_nexus.Pusher):  # type: ignore
 
                 # Try text parsing. If this fails, we won't be able to get a storm
                 # runtime in the snap, so catch and pass the `err` message
-                await self.core.getStormQuery(text, mode=mode)
+                query = await self.core.getStormQuery(text, mode=mode)
 
                 shownode = (not show or 'node' in show)
 
@@ -1032,6 +1220,8 @@ class View(s_nexus.Pusher):  # type: ignore
 
                     async with await self.snap(user=user) as snap:
 
+                        snap.lazynodes = query.isLazySafe(yields=shownode)
+
                         if keepalive:
                             snap.schedCoro(snap.keepalive(keepalive))
 
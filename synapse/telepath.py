@@ -19,6 +19,7 @@ import synapse.lib.base as s_base
 import synapse.lib.coro as s_coro
 import synapse.lib.link as s_link
 import synapse.lib.queue as s_queue
+import synapse.lib.msgpack as s_msgpack
 import synapse.lib.certdir as s_certdir
 import synapse.lib.threads as s_threads
 import synapse.lib.urlhelp as s_urlhelp
@@ -33,6 +34,19 @@ aha_clients = {}
 
 LINK_CULL_INTERVAL = 10
 
+# the number of generator items which may be sent ahead of the consumer
+T2_YIELDS_WINDOW = 1000
+
+POOL_EWMA_ALPHA = 0.3
+
+# pool balancing policies and the sort keys used to select the member with the lowest load
+poolpolicies = {
+    'roundrobin': None,
+    'least': lambda stats: (stats['inflight'], stats['count']),
+    'ewma': lambda stats: ((stats['inflight'] + 1) * (stats['ewma'] or 0.0), stats['count']),
+    'lag': lambda stats: (stats['inflight'], stats['lag'] or 0, stats['count']),
+}
+
 async def addAhaUrl(url):
     '''
     Add (incref) an aha registry URL.
@@ -881,6 +895,10 @@ class Proxy(s_base.Base):
                 'name': name,
                 'sess': self.sess})
 
+        # peers which support it may send batches of generator items
+        if self._hasTeleFeat('t2:yields'):
+            mesg[1]['yields'] = T2_YIELDS_WINDOW
+
         link = await self.getPoolLink()
 
         await link.tx(mesg)
@@ -906,6 +924,16 @@ class Proxy(s_base.Base):
                         if mesg is None:
                             raise s_exc.LinkShutDown(mesg='Remote peer disconnected')
 
+                        if mesg[0] == 't2:yields':
+                            count = 0
+                            for _, item in s_msgpack.Unpk().feed(mesg[1].get('byts')):
+                                count += 1
+                                yield item
+
+                            # return the credits for the consumed items
+                            await link.tx(('t2:credit', {'count': count}))
+                            continue
+
                         if mesg[0] != 't2:yield':  # pragma: no cover
                             info = 'Telepath protocol violation:  unexpected message received'
                             raise s_exc.BadMesgFormat(mesg=info)
@@ -1078,6 +1106,9 @@ class ClientV2(s_base.Base):
 
         self.poolname = None
 
+        self.policy = 'roundrobin'
+        self.poolstats = {}  # proxy -> load stats dict
+
         self.onlink = onlink
 
         self.bootdeque = collections.deque()
@@ -1193,11 +1224,13 @@ class ClientV2(s_base.Base):
                 self.proxies.remove(proxy)
             if proxy in self.deque:
                 self.deque.remove(proxy)
+            self.poolstats.pop(proxy, None)
             if not len(self.proxies):
                 self.ready.clear()
 
         proxy.onfini(onfini)
         self.proxies.add(proxy)
+        self.poolstats[proxy] = {'inflight': 0, 'count': 0, 'ewma': None, 'lag': None}
         self.ready.set()
 
         if self.onlink is not None:
@@ -1219,6 +1252,7 @@ class ClientV2(s_base.Base):
         self.ready.clear()
         self.clients.clear()
         self.proxies.clear()
+        self.poolstats.clear()
 
     async def _toposync(self):
 
@@ -1246,8 +1280,106 @@ class ClientV2(s_base.Base):
                 logger.warning(f'AHA pool topology task restarting: {e}')
                 await self.waitfini(timeout=1)
 
-    async def proxy(self, timeout=None):
+    def setPoolPolicy(self, policy):
+        '''
+        Set the policy used to select a pool member for proxy().
+
+        Args:
+            policy (str): One of roundrobin, least (fewest in-flight calls), ewma (in-flight calls
+                          weighted by latency), or lag (fewest in-flight calls then lowest nexus lag).
+        '''
+        if policy not in poolpolicies:
+            mesg = f'Invalid pool balancing policy: {policy}'
+            raise s_exc.BadArg(mesg=mesg, policy=policy)
+
+        self.policy = policy
+
+    def setPoolLag(self, proxy, lag):
+        '''
+        Record the most recently observed nexus lag for a pool member.
+        '''
+        stats = self.poolstats.get(proxy)
+        if stats is not None:
+            stats['lag'] = lag
+
+    @contextlib.contextmanager
+    def track(self, proxy):
+        '''
+        Track an in-flight call to a pool member for load-aware balancing.
+        '''
+        stats = self.poolstats.get(proxy)
+        if stats is None:
+            yield
+            return
+
+        stats['inflight'] += 1
+        tick = time.monotonic()
+
+        try:
+            yield
+
+        finally:
+            took = (time.monotonic() - tick) * 1000
+
+            stats['inflight'] -= 1
+            stats['count'] += 1
+
+            if stats['ewma'] is None:
+                stats['ewma'] = took
+            else:
+                stats['ewma'] += POOL_EWMA_ALPHA * (took - stats['ewma'])
+
+    def getPoolStats(self):
+        '''
+        Return the balancing policy and the load stats for each pool member.
+        '''
+        members = []
+        for proxy, stats in self.poolstats.items():
+            info = dict(stats)
+            info['name'] = proxy._ahainfo.get('name')
+            members.append(info)
+
+        return {
+            'policy': self.policy,
+            'members': members,
+        }
+
+    def _getPolicyProxy(self, exclude):
+
+        sortkey = poolpolicies.get(self.policy)
+
+        best = None
+        bestkey = None
+
+        # iterate in round-robin order to distribute the ties
+        for proxy in self.deque:
+
+            if proxy in exclude:
+                continue
+
+            stats = self.poolstats.get(proxy)
+            if stats is None:  # pragma: no cover
+                continue
+
+            key = sortkey(stats)
+            if bestkey is None or key < bestkey:
+                best = proxy
+                bestkey = key
 
+        if best is not None:
+            self.deque.remove(best)
+            self.deque.append(best)
+
+        return best
+
+    async def proxy(self, timeout=None, exclude=()):
+        '''
+        Return a proxy for a pool member selected by the balancing policy.
+
+        Args:
+            timeout (int): The maximum amount of time to wait for a pool member.
+            exclude (set): Proxies which should not be selected by a load-aware policy unless no others are available.
+        '''
         async def getNextProxy():
 
             while not self.isfini:
@@ -1257,6 +1389,16 @@ class ClientV2(s_base.Base):
                 if self.isfini:  # pragma: no cover
                     raise s_exc.IsFini()
 
+                if self.policy != 'roundrobin':
+
+                    if len(self.deque) != len(self.proxies):
+                        self.deque.clear()
+                        self.deque.extend(self.proxies)
+
+                    proxy = self._getPolicyProxy(exclude)
+                    if proxy is not None:
+                        return proxy
+
                 if not self.deque:
                     self.deque.extend(self.proxies)
 
@@ -4,6 +4,7 @@ import csv
 import sys
 import base64
 import shutil
+import random
 import struct
 import asyncio
 import hashlib
@@ -533,6 +534,73 @@ bar baz",vv
 
             self.eq(bbufretn[0], await axon.save(bbufhash, emptygen(), size=bbufretn[0]))
 
+            info = await axon.metrics()
+            self.eq(info.get('size:bytes'), info.get('size:stored'))
+
+    async def test_axon_blob_codec(self):
+
+        with self.raises(s_exc.BadConfValu):
+            async with self.getTestAxon(conf={'blob:codec': 'newp'}) as axon:
+                pass
+
+        async with self.getTestAxon(conf={'blob:codec': 'zlib'}) as axon:
+
+            await self.runAxonTestBase(axon)
+
+            info = await axon.metrics()
+            self.lt(info.get('size:stored'), info.get('size:bytes') / 10)
+
+            byts = os.urandom(100000)
+            size, sha256 = await axon.put(byts)
+            self.eq(byts, b''.join([b async for b in axon.get(sha256)]))
+            self.eq(byts[1000:1100], b''.join([b async for b in axon.get(sha256, 1000, size=100)]))
+
+            # incompressible blocks are stored as is
+            self.len(0, list(axon.blobslab.scanByPref(sha256, db=axon.blobcodecdb)))
+
+            byts = b'asdf' * 100000
+            size, sha256 = await axon.put(byts)
+            self.len(1, list(axon.blobslab.scanByPref(sha256, db=axon.blobcodecdb)))
+            self.eq(byts[3:3003], b''.join([b async for b in axon.get(sha256, 3, size=3000)]))
+
+            stored = (await axon.metrics()).get('size:stored')
+            self.true(await axon.del_(sha256))
+            self.len(0, list(axon.blobslab.scanByPref(sha256, db=axon.blobcodecdb)))
+            self.lt((await axon.metrics()).get('size:stored'), stored)
+
+            # large compressed blocks are decompressed in the executor
+            byts = os.urandom(200000).hex().encode()
+            size, sha256 = await axon.put(byts)
+            self.len(1, list(axon.blobslab.scanByPref(sha256, db=axon.blobcodecdb)))
+
+            with mock.patch('synapse.lib.coro.executor', wraps=s_coro.executor) as executor:
+                self.eq(byts, b''.join([b async for b in axon.get(sha256)]))
+                self.eq(1, executor.call_count)
+
+                executor.reset_mock()
+                with mock.patch('synapse.axon.BLOB_DECODE_EXECUTOR_SIZE', len(byts)):
+                    self.eq(byts[10:20], b''.join([b async for b in axon.get(sha256, 10, size=10)]))
+                    self.eq(0, executor.call_count)
+
+        async with self.getTestAxon(conf={'blob:codec': 'lzma', 'blob:cdc': True}) as axon:
+
+            base = os.urandom(s_axon.CDC_MAX_SIZE) + b'A' * 3 * s_axon.CDC_MAX_SIZE
+            size, sha00 = await axon.put(base)
+            size, sha01 = await axon.put(b'newprefix' + base)
+
+            self.eq(base, b''.join([b async for b in axon.get(sha00)]))
+            self.eq(base[1:1000000], b''.join([b async for b in axon.get(sha00, 1, size=999999)]))
+
+            info = await axon.metrics()
+            self.eq(info.get('size:bytes'), len(base) * 2 + 9)
+            self.lt(info.get('size:stored'), s_axon.CDC_MAX_SIZE * 2)
+            self.gt(len(list(axon.blobslab.scanByFull(db=axon.chunkcodecdb))), 0)
+
+            self.true(await axon.del_(sha00))
+            self.true(await axon.del_(sha01))
+            self.eq(0, (await axon.metrics()).get('size:stored'))
+            self.len(0, list(axon.blobslab.scanByFull(db=axon.chunkcodecdb)))
+
     async def test_axon_proxy(self):
         async with self.getTestAxon() as axon:
             async with axon.getLocalProxy() as prox:
@@ -1165,7 +1233,90 @@ bar baz",vv
             self.eq(b'dfqwer', b''.join(bytslist))
 
             metrics = await axon.metrics()
-            self.eq(metrics, {'size:bytes': 12, 'file:count': 1})
+            self.eq(metrics, {'size:bytes': 12, 'file:count': 1, 'size:stored': 12})
+
+            bytslist = [b async for b in axon.get(sha256, 4, size=6)]
+            self.eq(b'qwerzx', b''.join(bytslist))
+
+    async def test_axon_blob_cdc(self):
+
+        async with self.getTestAxon(conf={'blob:cdc': True}) as axon:
+
+            # a seeded byte source keeps the chunk boundaries deterministic
+            base = random.Random(9001).randbytes(3 * s_axon.CDC_MAX_SIZE)
+            byts00 = base
+            byts01 = b'newprefix' + base[:2000000] + b'newbytes' + base[2000000:]
+
+            size, sha00 = await axon.put(byts00)
+            chunks00 = list(axon.blobslab.scanByPref(sha00, db=axon.blobchunks))
+            self.gt(len(chunks00), 2)
+            self.len(0, list(axon.blobslab.scanByFull(db=axon.blobs)))
+
+            for _, chunksha in chunks00:
+                self.le(len(axon.blobslab.get(chunksha, db=axon.chunks)), s_axon.CDC_MAX_SIZE)
+
+            size, sha01 = await axon.put(byts01)
+            chunks01 = list(axon.blobslab.scanByPref(sha01, db=axon.blobchunks))
+
+            # only the chunks surrounding the changes are stored again
+            chunkshas = set([c[1] for c in chunks00 + chunks01])
+            self.len(len(chunkshas), list(axon.blobslab.scanByFull(db=axon.chunks)))
+            self.le(len(chunkshas), len(chunks00) + 2)
+
+            self.eq(byts00, b''.join([b async for b in axon.get(sha00)]))
+            self.eq(byts01, b''.join([b async for b in axon.get(sha01)]))
+
+            # reads which start at, within, and across chunk boundaries
+            offslist = [0, 1, 2000000, len(byts01) - 1]
+            for offs in axon.blobslab.scanByPref(sha01, db=axon.offsets):
+                boff = int.from_bytes(offs[0][32:], 'big')
+                offslist.extend((boff - 1, boff, boff + 1))
+
+            for offs in offslist:
+                if offs >= len(byts01):
+                    continue
+                for size in (1, 10, 300000):
+                    byts = b''.join([b async for b in axon.get(sha01, offs, size=size)])
+                    self.eq(byts01[offs:offs + size], byts)
+
+            # files are identical regardless of how they were uploaded
+            async with await axon.upload() as fd:
+                for offs in range(0, len(byts01), 100000):
+                    await fd.write(byts01[offs:offs + 100000])
+                self.eq((len(byts01), sha01), await fd.save())
+
+            self.true(await axon.del_(sha00))
+            self.eq(byts01, b''.join([b async for b in axon.get(sha01)]))
+            self.len(len(set([c[1] for c in chunks01])), list(axon.blobslab.scanByFull(db=axon.chunks)))
+
+            self.true(await axon.del_(sha01))
+            self.len(0, list(axon.blobslab.scanByFull(db=axon.chunks)))
+            self.len(0, list(axon.blobslab.scanByFull(db=axon.chunkrefs)))
+            self.len(0, list(axon.blobslab.scanByFull(db=axon.blobchunks)))
+            self.len(0, list(axon.blobslab.scanByFull(db=axon.offsets)))
+
+            # shared chunks within a single file are stored once
+            size, sha02 = await axon.put(base[:2000000] * 4)
+            self.eq(base[:2000000] * 4, b''.join([b async for b in axon.get(sha02)]))
+            self.lt(len(list(axon.blobslab.scanByFull(db=axon.chunks))),
+                    len(list(axon.blobslab.scanByPref(sha02, db=axon.blobchunks))))
+
+            self.true(await axon.del_(sha02))
+            self.len(0, list(axon.blobslab.scanByFull(db=axon.chunks)))
+
+        # files saved without cdc remain readable when it is enabled
+        with self.getTestDir() as dirn:
+
+            async with self.getTestAxon(dirn=dirn) as axon:
+                size, sha00 = await axon.put(b'asdfqwer')
+
+            async with self.getTestAxon(dirn=dirn, conf={'blob:cdc': True}) as axon:
+                self.eq(b'asdfqwer', b''.join([b async for b in axon.get(sha00)]))
+                self.eq(b'fqw', b''.join([b async for b in axon.get(sha00, 3, size=3)]))
+                size, sha01 = await axon.put(b'hehehaha')
+                self.true(axon.blobslab.prefexists(sha01, db=axon.blobchunks))
+                self.true(await axon.del_(sha00))
+                self.len(0, list(axon.blobslab.scanByFull(db=axon.blobs)))
 
     async def test_axon_mirror(self):
 
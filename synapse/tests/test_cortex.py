@@ -15,6 +15,7 @@ import synapse.cortex as s_cortex
 import synapse.telepath as s_telepath
 
 import synapse.lib.base as s_base
+import synapse.lib.cache as s_cache
 import synapse.lib.cell as s_cell
 import synapse.lib.coro as s_coro
 import synapse.lib.node as s_node
@@ -22,6 +23,7 @@ import synapse.lib.time as s_time
 import synapse.lib.layer as s_layer
 import synapse.lib.storm as s_storm
 import synapse.lib.output as s_output
+import synapse.lib.parser as s_parser
 import synapse.lib.msgpack as s_msgpack
 import synapse.lib.version as s_version
 import synapse.lib.modelrev as s_modelrev
@@ -1617,6 +1619,189 @@ class CortexTest(s_t_utils.SynTest):
             self.len(1, await core.nodes('test:str~="zip"'))
             self.len(1, await core.nodes('.favcolor~="^r"'))
 
+    async def test_cortex_lift_merge_window(self):
+
+        async with self.getTestCore() as core:
+
+            await core.nodes('for $x in $lib.range(10) {[ test:int=$x :loc=us ]}')
+
+            view = await core.callStorm('return($lib.view.get().fork().iden)')
+            opts = {'view': view}
+
+            await core.nodes('for $x in $lib.range(10) {[ test:int=$($x + 5) +#foo ]}', opts=opts)
+            await core.nodes('test:int=3 [ :loc=ca ]', opts=opts)
+
+            layr = core.getView(view).layers[0]
+
+            with patch('synapse.cortex.MERGE_SODE_WINDOW', 3):
+                with patch.object(layr, 'getStorNodesBatch', wraps=layr.getStorNodesBatch) as batch:
+
+                    nodes = await core.nodes('test:int', opts=opts)
+                    self.eq(list(range(15)), [n.ndef[1] for n in nodes])
+                    self.eq([0, 1, 2, 3, 4], [n.ndef[1] for n in nodes if n.tags.get('foo') is None])
+                    self.gt(batch.call_count, 1)
+
+                    nodes = await core.nodes('test:int:loc=us', opts=opts)
+                    self.eq([0, 1, 2, 4, 5, 6, 7, 8, 9], sorted([n.ndef[1] for n in nodes]))
+
+                    nodes = await core.nodes('reverse(test:int:loc)', opts=opts)
+                    self.len(10, nodes)
+                    self.eq(3, nodes[-1].ndef[1])
+
+    async def test_cortex_lift_merge_edit(self):
+
+        async with self.getTestCore() as core:
+
+            await core.nodes('for $x in $lib.range(20) {[ test:int=$x :loc=us ]}')
+
+            view = await core.callStorm('return($lib.view.get().fork().iden)')
+            opts = {'view': view}
+
+            # nodes edited in the write layer before they are reached by the lift are filtered
+            nodes = await core.nodes('test:int:loc=us { test:int=15 [ :loc=ca ] }', opts=opts)
+            self.len(19, nodes)
+            self.notin(15, [n.ndef[1] for n in nodes])
+
+            self.len(0, await core.nodes('test:int:loc=us', opts=opts))
+            self.len(20, await core.nodes('test:int:loc=ca', opts=opts))
+
+    async def test_cortex_lift_merge_lazy(self):
+
+        async with self.getTestCore() as core:
+
+            await core.nodes('for $x in $lib.range(10) {[ test:int=$x :loc=us +#bar ]}')
+
+            view = await core.callStorm('return($lib.view.get().fork().iden)')
+            opts = {'view': view}
+
+            await core.nodes('for $x in $lib.range(10) {[ test:int=$($x + 5) +#foo ]}', opts=opts)
+            await core.nodes('test:int=3 [ :loc=ca ]', opts=opts)
+
+            self.eq(15, await core.count('test:int | uniq', opts=opts))
+            self.eq(10, await core.count('test:int#bar | uniq', opts=opts))
+            self.eq(9, await core.count('test:int:loc=us | uniq', opts=opts))
+            self.eq(5, await core.count('test:int#foo +#bar', opts=opts))
+            self.eq(1, await core.count('test:int#bar +:loc=ca', opts=opts))
+
+            fork = core.getView(view)
+            layr = fork.layers[0]
+
+            async with await fork.snap(user=core.auth.rootuser) as snap:
+                snap.lazynodes = True
+
+                # the storage nodes from the fork layer are only retrieved when accessed
+                with patch.object(layr, 'getStorNodesBatch', wraps=layr.getStorNodesBatch) as batch:
+                    nodes = await alist(snap.nodesByTag('bar', form='test:int'))
+                    self.len(10, nodes)
+                    batch.assert_not_called()
+
+                self.true(all(isinstance(n, s_node.LazyNode) for n in nodes))
+
+                node = [n for n in nodes if n.ndef == ('test:int', 5)][0]
+                self.eq('us', node.get('loc'))
+                self.nn(node.get('#bar'))
+                self.nn(node.get('#foo'))
+                self.eq(fork.layers[1].iden, node.bylayer['ndef'])
+                self.eq(fork.layers[1].iden, node.bylayer['props']['loc'])
+                self.eq(layr.iden, node.bylayer['tags']['foo'])
+
+                await node.set('loc', 'uk')
+                await node.addTag('baz')
+                self.eq('uk', node.get('loc'))
+
+                nodes = await alist(snap.nodesByProp('test:int'))
+                self.eq(list(range(15)), [n.ndef[1] for n in nodes])
+                self.eq('ca', nodes[3].get('loc'))
+
+            async with await fork.snap(user=core.auth.rootuser) as snap:
+                snap.lazynodes = True
+
+                # storage nodes without the node value are joined immediately
+                nodes = await alist(snap.nodesByTag('foo', form='test:int'))
+                self.len(10, nodes)
+                self.eq([10, 11, 12, 13, 14], sorted(n.ndef[1] for n in nodes if isinstance(n, s_node.LazyNode)))
+
+            nodes = await core.nodes('test:int=5', opts=opts)
+            self.eq('uk', nodes[0].get('loc'))
+            self.nn(nodes[0].get('#baz'))
+            self.nn(nodes[0].get('#bar'))
+
+    async def test_cortex_storm_query_cache(self):
+
+        pkgdef = {
+            'name': 'foocache',
+            'version': '0.0.1',
+            'modules': [{'name': 'foocache', 'storm': 'function foo() { return((10)) }'}],
+            'commands': [{'name': 'foocache.cmd', 'storm': '$lib.print(foocmd)'}],
+        }
+
+        with self.getTestDir() as dirn:
+
+            async with self.getTestCore(dirn=dirn) as core:
+
+                await core.addStormPkg(pkgdef)
+                await core.nodes('cron.add --daily 13:37 {$lib.print(foocron)}')
+                await core.nodes('trigger.add node:add --form test:str --query {[ +#footrig ]}')
+
+                lkey = core._getStormQueryKey('$lib.print(foocron)', 'storm')
+                self.nn(core.queryslab.get(lkey, db=core.queryasts))
+
+                self.eq(s_parser.astvers, core.querymeta.get('astvers'))
+
+            parsed = []
+            async def parse(args):
+                parsed.append(args[0])
+                return await s_parser._forkedParseQuery(args)
+
+            with patch.object(s_parser, 'querycache', s_cache.FixedCache(parse, size=100)):
+
+                async with self.getTestCore(dirn=dirn) as core:
+
+                    core.querycache.clear()
+                    await core._warmStormQueryCache()
+
+                    for text in ('$lib.print(foocron)', '[ +#footrig ]', '$lib.print(foocmd)',
+                                 'function foo() { return((10)) }'):
+                        self.nn(core.querycache.cache.get((text, 'storm')))
+                        self.notin(text, parsed)
+
+                    self.eq(10, await core.callStorm('return($lib.import(foocache).foo())'))
+                    self.stormIsInPrint('foocmd', await core.stormlist('foocache.cmd'))
+                    self.len(1, await core.nodes('[ test:str=foo ] +#footrig'))
+
+                    # bad queries are logged and skipped during warmup
+                    core.agenda.appts[list(core.agenda.appts)[0]].query = '| |'
+                    with self.getAsyncLoggerStream('synapse.cortex', 'during cache warmup') as stream:
+                        await core._warmStormQueryCache()
+                        self.true(await stream.wait(timeout=6))
+
+                    # a grammar or AST change invalidates the persisted queries
+                    core.querymeta.set('astvers', 'newp')
+
+                parsed.clear()
+                s_parser.querycache.clear()
+
+                conf = {'storm:query:cache:size': 2}
+                async with self.getTestCore(dirn=dirn, conf=conf) as core:
+
+                    self.eq(s_parser.astvers, core.querymeta.get('astvers'))
+                    self.none(core.queryslab.get(lkey, db=core.queryasts))
+
+                    core.querycache.clear()
+                    self.eq(10, await core.callStorm('return($lib.import(foocache).foo())'))
+                    self.isin('function foo() { return((10)) }', parsed)
+                    self.le(core.queryslab.stat(db=core.queryasts)['entries'], 2)
+
+                parsed.clear()
+                s_parser.querycache.clear()
+
+                conf = {'storm:query:cache:size': 0}
+                async with self.getTestCore(dirn=dirn, conf=conf) as core:
+                    await core.nodes('$lib.print(nocache)')
+                    lkey = core._getStormQueryKey('$lib.print(nocache)', 'storm')
+                    self.none(core.queryslab.get(lkey, db=core.queryasts))
+                    self.isin('$lib.print(nocache)', parsed)
+
     async def test_cortex_lift_reverse(self):
 
         async with self.getTestCore() as core:
@@ -8466,6 +8651,16 @@ class CortexBasicTest(s_t_utils.SynTest):
                     self.eq(msgs[1].get('hash'), qhash)
                     self.eq(msgs[1].get('pool:from'), f'00.core.{ahanet}')
 
+                    info = await core00.getCellInfo()
+                    self.eq('roundrobin', info['stormpool']['policy'])
+                    self.eq(0, info['stormpool']['local'])
+                    self.len(1, info['stormpool']['members'])
+                    self.eq(f'01.core.{ahanet}', info['stormpool']['members'][0]['name'])
+                    self.eq(4, info['stormpool']['members'][0]['count'])
+                    self.eq(0, info['stormpool']['members'][0]['inflight'])
+                    self.nn(info['stormpool']['members'][0]['ewma'])
+                    self.nn(info['stormpool']['members'][0]['lag'])
+
                     with patch('synapse.cortex.CoreApi.getNexsIndx', _hang):
 
                         with self.getLoggerStream('synapse') as stream:
@@ -8505,8 +8700,8 @@ class CortexBasicTest(s_t_utils.SynTest):
                     self.notin('Timeout waiting for query mirror', data)
 
                     orig = s_telepath.ClientV2.proxy
-                    async def finidproxy(self, timeout=None):
-                        prox = await orig(self, timeout=timeout)
+                    async def finidproxy(self, timeout=None, exclude=()):
+                        prox = await orig(self, timeout=timeout, exclude=exclude)
                         await prox.fini()
                         return prox
 
@@ -8519,10 +8714,44 @@ class CortexBasicTest(s_t_utils.SynTest):
                     data = stream.read()
                     self.isin('Proxy for pool mirror [01.core.synapse] was shutdown. Skipping.', data)
 
-                    msgs = await core00.stormlist('cortex.storm.pool.set --connection-timeout 1 --sync-timeout 1 aha://pool00...')
-                    self.stormHasNoWarnErr(msgs)
-                    self.stormIsInPrint('Storm pool configuration set.', msgs)
-                    await core00.stormpool.waitready(timeout=12)
+                    self.gt(core00.getStormPoolStats()['local'], 0)
+
+                    msgs = await core00.stormlist('cortex.storm.pool.set --balance newp aha://pool00...')
+                    self.stormIsInErr('Invalid choice for argument --balance', msgs)
+
+                    q = 'cortex.storm.pool.set --connection-timeout 1 --sync-timeout 1 --balance least aha://pool00...'
+
+                    with patch('synapse.cortex.STORM_POOL_LAG_PERIOD', 0.1):
+
+                        msgs = await core00.stormlist(q)
+                        self.stormHasNoWarnErr(msgs)
+                        self.stormIsInPrint('Storm pool configuration set.', msgs)
+                        await core00.stormpool.waitready(timeout=12)
+                        self.eq('least', core00.stormpool.policy)
+
+                        # the nexus lag of every pool member is polled without running queries
+                        for _ in range(100):
+                            members = core00.getStormPoolStats()['members']
+                            if members and members[0]['lag'] is not None:
+                                break
+                            await asyncio.sleep(0.1)
+
+                        self.len(1, members)
+                        self.eq(0, members[0]['count'])
+                        self.nn(members[0]['lag'])
+
+                    msgs = await core00.stormlist('cortex.storm.pool.get')
+                    self.stormIsInPrint('Balancing Policy: least', msgs)
+
+                    async with core00.getLocalProxy() as proxy:
+                        stats = await proxy.getStormPoolStats()
+                        self.eq('least', stats['policy'])
+                        self.eq(f'01.core.{ahanet}', stats['members'][0]['name'])
+
+                    await core00.auth.addUser('lowuser')
+                    async with core00.getLocalProxy(user='lowuser') as proxy:
+                        with self.raises(s_exc.AuthDeny):
+                            await proxy.getStormPoolStats()
 
                     core01.nexsroot.nexslog.indx = 0
 
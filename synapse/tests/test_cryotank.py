@@ -1,10 +1,14 @@
 import os
 import asyncio
 
+import unittest.mock as mock
+
 import synapse.exc as s_exc
+import synapse.common as s_common
 import synapse.cryotank as s_cryotank
 
 import synapse.lib.const as s_const
+import synapse.lib.msgpack as s_msgpack
 import synapse.lib.slaboffs as s_slaboffs
 
 import synapse.tests.utils as s_t_utils
@@ -129,6 +133,179 @@ class CryoTest(s_t_utils.SynTest):
                 _, conf = cryo.names.get('conftest')
                 self.eq(conf, {'map_size': s_const.mebibyte * 64})
 
+    async def test_cryo_segments(self):
+
+        with self.getTestDir() as dirn:
+
+            async with self.getTestCryo(dirn) as cryo:
+
+                tank = await cryo.init('segs', conf={'rotate:size': 1, 'map_size': s_const.mebibyte * 64})
+                self.eq(tank.slab.mapsize, s_const.mebibyte * 64)
+
+                self.eq(2, await tank.puts(cryodata))
+                await asyncio.sleep(0.01)
+
+                tick = s_common.now()
+                self.eq(0, tank.getOffsByTime(0))
+                self.eq(2, tank.getOffsByTime(tick))
+
+                self.eq(2, await tank.puts(cryodata))
+                self.eq(2, await tank.puts(cryodata))
+
+                info = await tank.info()
+                self.eq(6, info['indx'])
+                self.eq(0, info['first'])
+                self.eq(4, info['segments'])
+                self.eq(6, info['stat']['entries'])
+
+                self.eq(list(range(6)), [indx for (indx, item) in await alist(tank.slice(0))])
+                self.eq(list(range(2, 6)), [indx for (indx, item) in await alist(tank.slice(0, tick=tick))])
+                self.eq([4, 5], [indx for (indx, item) in await alist(tank.slice(4, tick=tick))])
+                self.eq([2, 3], [indx for (indx, item) in await alist(tank.slice(0, size=2, tick=tick))])
+                self.eq([], await alist(tank.slice(0, tick=s_common.now() + 1000)))
+                self.eq([1, 2, 3], [indx for (indx, byts) in await alist(tank.rows(1, size=3))])
+
+                self.eq((5, cryodata[1]), tank.last())
+
+                # whole segments are removed once their items are older than the retention period
+                await asyncio.sleep(0.2)
+                tank.retainage = 100
+
+                self.eq(2, await tank.puts(cryodata))
+
+                info = await tank.info()
+                self.eq(8, info['indx'])
+                self.eq(6, info['first'])
+                self.eq(2, info['segments'])
+                self.eq(2, info['stat']['entries'])
+
+                self.eq([6, 7], [indx for (indx, item) in await alist(tank.slice(0))])
+                self.eq([6, 7], [indx for (indx, byts) in await alist(tank.rows(0))])
+                self.eq(6, tank.getOffsByTime(0))
+                self.len(1, list(tank.slab.scanByFull(db=tank.times)))
+
+                # age based rotation
+                tank = await cryo.init('ages', conf={'rotate:age': 5})
+
+                self.eq(2, await tank.puts(cryodata))
+                self.eq(1, (await tank.info())['segments'])
+
+                await asyncio.sleep(0.01)
+                self.eq(2, await tank.puts(cryodata))
+                self.eq(2, (await tank.info())['segments'])
+
+                # segments are rotated and culled between puts
+                with mock.patch.object(s_cryotank.CryoTank, 'cullperiod', 0.01):
+
+                    tank = await cryo.init('cull', conf={'rotate:age': 50, 'retain:age': 100})
+                    self.eq(2, await tank.puts(cryodata))
+
+                    async def waitsegs():
+                        while (await tank.info())['segments'] != 2:
+                            await asyncio.sleep(0.01)
+
+                    await asyncio.wait_for(waitsegs(), timeout=10)
+
+                    self.eq(2, await tank.puts(cryodata))
+
+                    async def waitcull():
+                        while (await tank.info())['first'] != 2:
+                            await asyncio.sleep(0.01)
+
+                    await asyncio.wait_for(waitcull(), timeout=10)
+
+                    self.eq([2, 3], [indx for (indx, item) in await alist(tank.slice(0))])
+                    self.eq((3, cryodata[1]), tank.last())
+
+            async with self.getTestCryo(dirn) as cryo:
+
+                tank = cryo.tanks.get('segs')
+                self.eq(8, tank._items.index())
+                self.eq((7, cryodata[1]), tank.last())
+                self.eq([6, 7], [indx for (indx, item) in await alist(tank.slice(0))])
+
+                self.eq(2, await tank.puts(cryodata))
+                self.eq([6, 7, 8, 9], [indx for (indx, item) in await alist(tank.slice(0))])
+                self.eq(8, tank.getOffsByTime(tank.lasttick))
+
+    async def test_cryo_codec(self):
+
+        with self.getTestDir() as dirn:
+
+            async with self.getTestCryo(dirn) as cryo:
+
+                with self.raises(s_exc.BadConfValu):
+                    await cryo.init('newp', conf={'codec': 'newp'})
+
+                items = [{'key': i, 'data': 'hehe' * 20} for i in range(2500)]
+
+                zipd = await cryo.init('zipd', conf={'codec': 'zlib'})
+                self.none(zipd.last())
+                self.eq([], await alist(zipd.blocks(0)))
+
+                self.eq(2500, await zipd.puts(items))
+
+                # incompressible blocks are stored as is
+                self.eq(1, await zipd.puts([os.urandom(64)]))
+
+                info = await zipd.info()
+                self.eq(2501, info['indx'])
+                self.eq(2501, info['stat']['entries'])
+
+                metrics = await alist(zipd.metrics(0))
+                self.eq([1000, 1000, 500, 1], [m[1]['count'] for m in metrics])
+                self.lt(metrics[0][1]['size'], 20000)
+
+                self.eq(2500, zipd.last()[0])
+
+                self.eq(items, [item for (indx, item) in await alist(zipd.slice(0, size=2500))])
+                self.eq(list(range(999, 1002)), [indx for (indx, item) in await alist(zipd.slice(999, size=3))])
+                self.eq(items[1500], (await alist(zipd.slice(1500, size=1)))[0][1])
+
+                rows = await alist(zipd.rows(998, size=4))
+                self.eq([(998, s_msgpack.en(items[998])), (999, s_msgpack.en(items[999])),
+                         (1000, s_msgpack.en(items[1000])), (1001, s_msgpack.en(items[1001]))], rows)
+
+                blocks = await alist(zipd.blocks(0))
+                self.eq([(0, 1000, 'zlib'), (1000, 1000, 'zlib'), (2000, 500, 'zlib'), (2500, 1, None)],
+                        [b[:3] for b in blocks])
+
+                rows = [s_msgpack.un(r) for b in blocks for r in s_cryotank.decodeBlock(b[2], b[3])]
+                self.eq(items, rows[:2500])
+
+                # partial blocks are decoded and returned uncompressed
+                blocks = await alist(zipd.blocks(1500, size=600))
+                self.eq([(1500, 500, None), (2000, 100, None)], [b[:3] for b in blocks])
+                self.eq(items[1500:2100], [s_msgpack.un(r) for b in blocks for r in s_cryotank.decodeBlock(b[2], b[3])])
+
+                self.eq([(0, 1000, 'zlib')], [b[:3] for b in await alist(zipd.blocks(0, size=1000))])
+
+                # tanks without a codec return uncompressed blocks
+                tank = await cryo.init('raw')
+                await tank.puts(items)
+
+                blocks = await alist(tank.blocks(10, size=1500))
+                self.eq([(10, 1000, None), (1010, 500, None)], [b[:3] for b in blocks])
+                self.eq(items[10:1510], [s_msgpack.un(r) for b in blocks for r in s_cryotank.decodeBlock(b[2], b[3])])
+
+                async with cryo.getLocalProxy() as prox:
+                    blocks = await alist(prox.blocks('zipd', 1000, size=1000))
+                    self.eq([(1000, 1000, 'zlib')], [b[:3] for b in blocks])
+
+                async with cryo.getLocalProxy(share='cryotank/zipd') as prox:
+                    blocks = await alist(prox.blocks(2000))
+                    self.eq([(2000, 500, 'zlib'), (2500, 1, None)], [b[:3] for b in blocks])
+
+                with self.raises(s_exc.FeatureNotSupported):
+                    s_cryotank.decodeBlock('newp', b'')
+
+            async with self.getTestCryo(dirn) as cryo:
+                zipd = cryo.tanks.get('zipd')
+                self.eq(items[-5:], [item for (indx, item) in await alist(zipd.slice(2495, size=5))])
+
+                # the last item of a compressed block is decoded when the tank is opened
+                self.eq((2499, items[-1]), cryo.tanks.get('raw').last())
+
     async def test_cryo_perms(self):
 
         async with self.getTestCryo() as cryo:
@@ -269,6 +446,8 @@ class CryoTest(s_t_utils.SynTest):
                     self.false(os.path.exists(os.path.join(tank00.dirn, 'cell.guid')))
                     self.false(os.path.exists(os.path.join(tank00.dirn, 'slabs', 'cell.lmdb')))
                     self.eq(0, s_slaboffs.SlabOffs(tank00.slab, 'offsets').get(seqniden))
+                    self.false(tank00.slab.dbexists('items'))
+                    self.eq(0, tank00.getOffsByTime(0))
 
                     tank01 = await cryo.init('tank01')
                     self.true(tank01iden == cryo.names.get('tank01')[0] == tank01.iden())
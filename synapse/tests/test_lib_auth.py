@@ -967,3 +967,75 @@ class AuthTest(s_test.SynTest):
             self.false(user.allowed(('hehe', 'something', 'else'), deepdeny=True))
             self.false(user.allowed(('hehe', 'something', 'else', 'very'), deepdeny=True))
             self.false(user.allowed(('hehe', 'something', 'else', 'very', 'specific'), deepdeny=True))
+
+    async def test_auth_rule_trie(self):
+
+        rules = (
+            (False, ('foo', 'bar', 'baz')),
+            (True, ('foo', 'bar')),
+            (False, ('foo',)),
+            (True, ('foo', 'bar', 'baz', 'faz')),
+            (True, ('hehe', 'haha')),
+            (False, ('hehe', 'haha')),
+            (True, ()),
+        )
+
+        def linear(perm):
+            for indx, (allow, path) in enumerate(rules):
+                if perm[:len(path)] == path:
+                    return (indx, allow, path)
+
+        def deepdeny(perm):
+            return any(not allow and path[:len(perm)] == perm and len(path) > len(perm) for allow, path in rules)
+
+        trie = s_auth.compileRules(rules)
+
+        perms = (
+            (), ('foo',), ('foo', 'bar'), ('foo', 'bar', 'baz'), ('foo', 'bar', 'baz', 'faz'),
+            ('foo', 'bar', 'baz', 'faz', 'more'), ('foo', 'newp'), ('hehe',), ('hehe', 'haha'),
+            ('hehe', 'haha', 'hoho'), ('newp',),
+        )
+        for perm in perms:
+            self.eq(linear(perm), s_auth.matchRuleTrie(trie, perm), msg=perm)
+            self.eq(deepdeny(perm), s_auth.hasDeepDenyTrie(trie, perm), msg=perm)
+
+        self.none(s_auth.matchRuleTrie(s_auth.compileRules(()), ('foo',)))
+
+        async with self.getTestCore() as core:
+
+            fork00 = await core.callStorm('return( $lib.view.get().fork().iden )')
+            fork01 = await core.callStorm('return( $lib.view.get().fork().iden )')
+
+            visi = await core.auth.addUser('visi')
+            ninjas = await core.auth.addRole('ninjas')
+            await visi.grant(ninjas.iden)
+
+            await ninjas.addRule((True, ('foo', 'bar')), gateiden=fork00)
+            await ninjas.addRule((True, ('foo', 'baz')), gateiden=fork01)
+
+            self.true(visi.allowed(('foo', 'bar'), gateiden=fork00))
+            self.false(visi.allowed(('foo', 'baz'), gateiden=fork00))
+            self.true(visi.allowed(('foo', 'baz'), gateiden=fork01))
+
+            trie00 = ninjas.ruletries[fork00][1]
+            trie01 = ninjas.ruletries[fork01][1]
+
+            # only the trie for the modified rules is recompiled
+            await ninjas.addRule((False, ('foo', 'bar', 'faz')), indx=0, gateiden=fork00)
+
+            self.true(visi.allowed(('foo', 'bar'), gateiden=fork00))
+            self.false(visi.allowed(('foo', 'bar'), gateiden=fork00, deepdeny=True))
+            self.false(visi.allowed(('foo', 'bar', 'faz'), gateiden=fork00))
+            self.true(visi.allowed(('foo', 'baz'), gateiden=fork01))
+
+            self.false(ninjas.ruletries[fork00][1] is trie00)
+            self.true(ninjas.ruletries[fork01][1] is trie01)
+
+            reason = visi.getAllowedReason(('foo', 'bar', 'faz'), gateiden=fork00)
+            self.false(reason.value)
+            self.eq(('foo', 'bar', 'faz'), reason.rule)
+            self.eq(ninjas.iden, reason.roleiden)
+
+            await core.delView(fork00)
+            self.none(ninjas.ruletries.get(fork00))
+            self.false(visi.allowed(('foo', 'bar'), gateiden=fork00))
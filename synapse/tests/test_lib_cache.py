@@ -281,3 +281,49 @@ class CacheTest(s_t_utils.SynTest):
         lru = s_cache.LruDict(0)
         lru['nope'] = 42
         self.none(lru.get('nope', None))
+
+    async def test_bytelrudict(self):
+        lru = s_cache.ByteLruDict(10)
+        lru['foo'] = b'asdf'
+        lru['bar'] = b'qwer'
+        self.eq(8, lru.size)
+        self.eq(b'asdf', lru.get('foo'))
+        self.none(lru.get('newp'))
+
+        # bar is the least recently used so it is evicted
+        lru['baz'] = b'zxcv'
+        self.notin('bar', lru)
+        self.eq(8, lru.size)
+
+        # replacing a value updates the size
+        lru['foo'] = b'a'
+        self.eq(5, lru.size)
+
+        # values larger than the cache are not stored
+        lru['foo'] = b'x' * 11
+        self.notin('foo', lru)
+        self.eq(4, lru.size)
+
+        self.eq(b'zxcv', lru.pop('baz'))
+        self.none(lru.pop('baz'))
+        self.eq(0, lru.size)
+
+        lru['foo'] = b'asdf'
+        del lru['foo']
+        del lru['foo']
+        self.eq(0, lru.size)
+
+        lru['foo'] = b'asdf'
+        lru.clear()
+        self.len(0, lru)
+        self.eq(0, lru.size)
+
+        stats = lru.stats()
+        self.eq(1, stats['hits'])
+        self.eq(1, stats['misses'])
+        self.eq(10, stats['maxsize'])
+        self.eq(0, stats['count'])
+
+        lru = s_cache.ByteLruDict(0)
+        lru['nope'] = b'asdf'
+        self.none(lru.get('nope'))
@@ -1,10 +1,15 @@
+import os
+from unittest import mock
+
 import lark  # type: ignore
 
 import synapse.exc as s_exc
+import synapse.common as s_common
 
 import synapse.lib.parser as s_parser
 import synapse.lib.datfile as s_datfile
 import synapse.lib.grammar as s_grammar
+import synapse.lib.msgpack as s_msgpack
 
 import synapse.tests.utils as s_t_utils
 
@@ -1434,6 +1439,73 @@ class GrammarTest(s_t_utils.SynTest):
             tree = parser.query()
             self.eq(str(tree), _ParseResults[i])
 
+    def test_parser_cache(self):
+
+        with self.getTestDir() as dirn:
+
+            with mock.patch.object(s_common, 'syndir', dirn):
+
+                path = s_common.getSynPath('parsers', f'storm-{s_parser.larkvers}.lark')
+
+                with self.setTstEnvars(SYN_PARSER_CACHE='0'):
+                    s_parser._initLarkParser()
+                    self.false(os.path.isfile(path))
+
+                s_parser._initLarkParser()
+                self.true(os.path.isfile(path))
+
+                parser = s_parser._initLarkParser()
+                for i, query in enumerate(Queries[:100]):
+                    tree = s_parser.AstConverter(query).transform(parser.parse(query, start='query'))
+                    self.eq(str(tree), _ParseResults[i])
+
+                # the cache may not be written by other users
+                self.eq(0o600, os.stat(path).st_mode & 0o777)
+
+                os.chmod(path, 0o666)
+
+                with mock.patch('lark.Lark.load') as load:
+                    with self.getLoggerStream('synapse.lib.parser', 'Ignoring the cached Storm parser') as stream:
+                        parser = s_parser._initLarkParser()
+                        self.true(stream.wait(timeout=1))
+                        load.assert_not_called()
+
+                # the cache is rebuilt and saved with safe permissions
+                self.eq(0o600, os.stat(path).st_mode & 0o777)
+                self.nn(parser.parse('inet:fqdn', start='query'))
+
+                with mock.patch('os.getuid', return_value=os.getuid() + 1):
+                    with mock.patch('lark.Lark.load') as load:
+                        s_parser._initLarkParser()
+                        load.assert_not_called()
+
+    async def test_parser_packed(self):
+
+        for i, query in enumerate(Queries):
+            byts = s_parser.parsePackedQuery(query)
+            tree = s_parser.unpackAst(query, byts)
+            self.eq(str(tree), _ParseResults[i])
+            self.eq(tree.text, query)
+            self.eq(byts, s_parser.packAst(tree))
+
+        query = '$x = (1.25 + 2) $y = ({"foo": [1, 2]}) $z = (a, b) [ inet:fqdn=vertex.link ] | spin'
+        tree = s_parser.unpackAst(query, s_parser.parsePackedQuery(query))
+        self.eq(str(tree), str(s_parser.parseQuery(query)))
+        self.eq(tree.kids[0].kids[1].getAstText(), '(1.25 + 2)')
+
+        tree = s_parser.unpackAst('vertex.link', s_parser.parsePackedQuery('vertex.link', mode='autoadd'))
+        self.true(tree.autoadd)
+
+        tree = s_parser.unpackAst('foo bar', s_parser.parsePackedQuery('foo bar', mode='search'))
+        self.eq(str(tree), 'Search: [LookList: [Const: foo, Const: bar]]')
+
+        tree = s_parser.unpackAst('$foo.$bar', s_parser.parsePackedEval('$foo.$bar'))
+        self.eq(tree.kids[1].kids[0].getAstText(), 'bar')
+
+        byts = s_msgpack.en(('Newp', (0, 1, 1, 1, 1, 1, False), {}, (), None))
+        with self.raises(s_exc.BadArg):
+            s_parser.unpackAst('newp', byts)
+
     def test_cmdrargs(self):
         q = '''add {inet:fqdn | graph 2 --filter { -#nope } } inet:f-M +1 { [ meta:note='*' :type=m1]}'''
         correct = (
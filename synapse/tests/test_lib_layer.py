@@ -2273,3 +2273,182 @@ class LayerTest(s_t_utils.SynTest):
 
             sodes = await s_t_utils.alist(layr00.getStorNodesByForm('inet:ipv4'))
             self.len(0, sodes)
+
+    async def test_layer_buidcache(self):
+
+        async with self.getTestCore() as core:
+
+            layr = core.getLayer()
+            nodes = await core.nodes('[ test:str=foo +#bar :tick=2020 ]')
+            buid = nodes[0].buid
+
+            await layr.layrslab.sync()
+
+            # clean storage nodes are cached in their packed form
+            byts = layr.buidcache.get(buid)
+            self.isinstance(byts, bytes)
+            self.eq(s_msgpack.un(byts), await layr.getStorNode(buid))
+
+            # the actual storage node is not shared with the cache
+            sode = layr._getStorNode(buid)
+            sode['tags'].clear()
+            self.nn((await layr.getStorNode(buid))['tags'].get('bar'))
+
+            layr.buidcache.clear()
+            self.len(1, await core.nodes('test:str=foo'))
+
+            stat = await layr.stat()
+            self.gt(stat['buidcache_hits'], 0)
+            self.gt(stat['buidcache_misses'], 0)
+            self.eq(stat['buidcache_count'], len(layr.buidcache))
+            self.eq(stat['buidcache_size'], layr.buidcache.size)
+            self.eq(stat['buidcache_maxsize'], s_layer.BUID_CACHE_SIZE)
+
+            await core.nodes('test:str=foo | delnode')
+            self.none(layr.buidcache.get(buid))
+            self.eq({}, await layr.getStorNode(buid))
+
+    async def test_layer_getstornodesbatch(self):
+
+        async with self.getTestCore() as core:
+
+            layr = core.getLayer()
+            nodes = await core.nodes('[ test:str=foo test:str=bar ]')
+            buids = [n.buid for n in nodes]
+
+            await layr.layrslab.sync()
+            layr.buidcache.clear()
+            sodes = await layr.getStorNodesBatch([buids[0], b'\x00' * 32, buids[1]])
+            self.len(3, sodes)
+            self.eq('foo', sodes[0]['valu'][0])
+            self.eq({}, sodes[1])
+            self.eq('bar', sodes[2]['valu'][0])
+
+            # storage nodes are returned as read-only views
+            with self.raises(TypeError):
+                sodes[0]['valu'] = ('newp', 1)
+
+            layr.setSodeDirty(buids[1], layr._getStorNode(buids[1]), 'test:str')
+            sodes = await layr.getStorNodesBatch(buids)
+            self.eq('foo', sodes[0]['valu'][0])
+            self.eq('bar', sodes[1]['valu'][0])
+
+            with self.raises(TypeError):
+                sodes[1]['props']['newp'] = (1, 1)
+
+    async def test_layer_sode_views(self):
+
+        async with self.getTestCore() as core:
+
+            layr = core.getLayer()
+            nodes = await core.nodes('[ test:str=foo :tick=2020 +#bar ]')
+            buid = nodes[0].buid
+
+            # make sure the storage node is dirty
+            await core.nodes('test:str=foo [ +#baz ]')
+            self.nn(layr.dirty.get(buid))
+
+            lifted = [sode async for _, _, sode in layr.liftByTag('bar')]
+            self.len(1, lifted)
+
+            view = lifted[0]
+            self.nn(view['tags'].get('baz'))
+
+            with self.raises(TypeError):
+                view['valu'] = ('newp', 1)
+
+            # nested dicts of dirty storage nodes are read-only copies
+            with self.raises(TypeError):
+                view['tags']['newp'] = (None, None)
+
+            with self.raises(TypeError):
+                view['props']['tick'] = (0, 0)
+
+            self.none(layr.dirty[buid]['tags'].get('newp'))
+
+            # editing the node does not change the view
+            await core.nodes('test:str=foo [ -#baz :tick=2021 ]')
+            self.nn(view['tags'].get('baz'))
+            self.eq(view['props']['tick'][0], s_time.parse('2020'))
+
+            sode = await layr.getStorNode(buid)
+            self.none(sode['tags'].get('baz'))
+            self.eq(sode['props']['tick'][0], s_time.parse('2021'))
+
+            nodes = await core.nodes('test:str#bar')
+            self.len(1, nodes)
+            self.none(nodes[0].get('#baz'))
+            self.eq(nodes[0].get('tick'), s_time.parse('2021'))
+
+            # lifting by node data includes the data in the view
+            await core.nodes('test:str=foo $node.data.set(hehe, haha)')
+            sodes = [sode async for _, _, sode in layr.liftByDataName('hehe')]
+            self.eq({'hehe': 'haha'}, sodes[0]['nodedata'])
+
+    async def test_layer_bulkload(self):
+
+        async with self.getTestCore() as core:
+
+            await core.addTagProp('score', ('int', {}), {})
+
+            await core.nodes('[ inet:ipv4=1.2.3.4 :asn=10 .seen=(2020, 2021) +#foo.bar=(2020, 2021) +#foo:score=10 ]')
+            await core.nodes('[ test:arrayprop=* :ints=(1, 2, 2, 3) :strs=(a, b) +#foo ]')
+            await core.nodes('[ test:str=foo :bar=(test:int, 10) :ndefs=((test:int, 10), (inet:ipv4, 1.2.3.4)) ]')
+            await core.nodes('[ test:arrayform=(1, 2, 3) ]')
+            await core.nodes('inet:ipv4 $node.data.set(hehe, haha) [ <(refs)+ { test:str=foo } ]')
+
+            layr = core.getLayer()
+            nodeedits = [ne async for ne in layr.iterLayerNodeEdits()]
+
+            ldef = await core.addLayer()
+            bulk = core.getLayer(ldef.get('iden'))
+            vdef = await core.addView({'layers': (ldef.get('iden'),)})
+            opts = {'view': vdef.get('iden')}
+
+            async def genr():
+                for nodeedit in nodeedits:
+                    yield nodeedit
+
+            # a small run size exercises merging multiple sorted runs
+            retn = await bulk.bulkLoad(genr(), runsize=3)
+            self.eq([], retn['errors'])
+            self.eq(retn['nodes'], await core.count('.created'))
+            self.eq(retn['sodes'], layr.getStorNodeCount())
+            self.eq(await layr.getFormCounts(), await bulk.getFormCounts())
+
+            for db in ('byform', 'byprop', 'byarray', 'bytag', 'bytagprop', 'byndef'):
+                self.eq(layr.layrslab.stat(db=db)['entries'], bulk.layrslab.stat(db=db)['entries'])
+                self.eq(retn['rows'][db], bulk.layrslab.stat(db=db)['entries'])
+
+            self.eq(sorted(nodeedits), sorted([ne async for ne in bulk.iterLayerNodeEdits()]))
+
+            queries = (
+                'inet:ipv4',
+                'inet:ipv4:asn=10',
+                '.seen',
+                '#foo',
+                '#foo.bar@=2020',
+                '#foo:score=10',
+                'inet:ipv4#foo:score>5',
+                'test:arrayprop:ints*[=2]',
+                'test:arrayprop:strs*[=b]',
+                'test:arrayform*[=2]',
+                'test:str:bar=(test:int, 10)',
+                'test:str:ndefs*[=(inet:ipv4, 1.2.3.4)]',
+                'test:int=10 <- *',
+                'inet:ipv4 <(refs)- *',
+                'yield $lib.lift.byNodeData(hehe)',
+            )
+
+            for text in queries:
+                nodes = await core.nodes(text)
+                self.gt(len(nodes), 0)
+                self.eq([n.pack() for n in nodes], [n.pack() for n in await core.nodes(text, opts=opts)])
+
+            with self.raises(s_exc.BadState):
+                await bulk.bulkLoad(genr())
+
+            ldef = await core.addLayer()
+            newp = core.getLayer(ldef.get('iden'))
+            with self.raises(s_exc.BadArg):
+                await newp.bulkLoad([(nodeedits[0][0], 'inet:ipv4', ((s_layer.EDIT_NODE_DEL, (1, 4), ()),))])
@@ -1,7 +1,9 @@
 import ssl
 import sys
+import time
 import socket
 import asyncio
+import logging
 import multiprocessing
 
 import unittest.mock as mock
@@ -11,9 +13,12 @@ import synapse.common as s_common
 
 import synapse.lib.coro as s_coro
 import synapse.lib.link as s_link
+import synapse.lib.const as s_const
+import synapse.lib.msgpack as s_msgpack
 
 import synapse.tests.utils as s_test
 
+logger = logging.getLogger(__name__)
 
 # Helpers related to spawn link coverage
 async def _spawnTarget(n, info):
@@ -204,6 +209,164 @@ class LinkTest(s_test.SynTest):
         await link1.fini()
         sock1.close()
 
+    async def test_link_send_maxwrite(self):
+
+        link0, sock0 = await s_link.linksock()
+
+        def reader(sock):
+            buf = b''
+            while True:
+                byts = sock.recv(1024)
+                if not byts:
+                    break
+                buf += byts
+            return buf
+
+        coro = s_coro.executor(reader, sock0)
+
+        # large messages are written in MAXWRITE sized slices
+        with mock.patch('synapse.lib.link.MAXWRITE', 4):
+            await link0.send(b'0123456789')
+            await link0.tx(('haha', {'x': 'hehe'}))
+
+        await link0.fini()
+
+        byts = await coro
+        sock0.close()
+
+        self.eq(b'0123456789', byts[:10])
+
+        mesgs = [m for _, m in s_msgpack.Unpk().feed(byts[10:])]
+        self.eq(mesgs, [('haha', {'x': 'hehe'})])
+
+    async def test_link_recvsize(self):
+
+        link0, sock0 = await s_link.linksock()
+
+        sizes = []
+        read = link0.reader.read
+
+        # limit each read to a few bytes to receive the data in pieces
+        async def shortread(size):
+            sizes.append(size)
+            return await read(min(size, 3))
+
+        link0.reader.read = shortread
+
+        sock0.sendall(b'0123456789abc')
+
+        byts = await link0.recvsize(10)
+        self.isinstance(byts, bytearray)
+        self.eq(b'0123456789', byts)
+
+        # each read only requests the remaining bytes
+        self.eq(sizes, [10, 7, 4, 1])
+
+        # bytes beyond the requested size remain available
+        self.eq(b'abc', await link0.recvsize(3))
+
+        sock0.close()
+        self.none(await link0.recvsize(10))
+        self.true(link0.isfini)
+
+    async def test_link_sendv(self):
+
+        link0, sock0 = await s_link.linksock()
+
+        def reader(sock):
+            buf = b''
+            while True:
+                byts = sock.recv(1024)
+                if not byts:
+                    break
+                buf += byts
+            return buf
+
+        coro = s_coro.executor(reader, sock0)
+
+        with mock.patch('synapse.lib.link.MAXWRITE', 4):
+            await link0.sendv([b'hehe', b'ha', b'hahaha', b'', b'ha'])
+            await link0.send(b'0123456789')
+            await link0.tx(('haha', {'x': 'hehe'}))
+
+        await link0.sendv([s_msgpack.en(('foo', {})), s_msgpack.en(('bar', {'y': 10}))])
+        await link0.sendv([])
+
+        await link0.fini()
+
+        byts = await coro
+        sock0.close()
+
+        size = len(b'hehehahahahaha0123456789')
+        self.eq(b'hehehahahahaha0123456789', byts[:size])
+
+        mesgs = [m for _, m in s_msgpack.Unpk().feed(byts[size:])]
+        self.eq(mesgs, [('haha', {'x': 'hehe'}), ('foo', {}), ('bar', {'y': 10})])
+
+        await self.asyncraises(s_exc.IsFini, link0.sendv([b'newp']))
+
+    async def test_link_send_perf(self):
+
+        link0, sock0 = await s_link.linksock()
+
+        # replace the transport writes to only measure the copies made by the link
+        def write(byts):
+            pass
+
+        async def drain():
+            pass
+
+        link0.writer.write = write
+        link0.writer.writelines = write
+        link0.writer.drain = drain
+
+        size = 64 * s_const.mebibyte
+        payload = b'V' * size
+
+        async def sendslices(byts):
+            # the previous implementation which copied each slice of the message
+            for offs in range(0, len(byts), s_link.MAXWRITE):
+                link0.writer.write(byts[offs:offs + s_link.MAXWRITE])
+                await link0.writer.drain()
+
+        with mock.patch('synapse.lib.link.MAXWRITE', s_const.mebibyte):
+
+            took = []
+            oldtook = []
+            for _ in range(3):
+
+                tick = time.perf_counter()
+                await link0.send(payload)
+                took.append(time.perf_counter() - tick)
+
+                tick = time.perf_counter()
+                await sendslices(payload)
+                oldtook.append(time.perf_counter() - tick)
+
+        logger.info(f'send() {size} bytes: {min(took):.4f}s (sliced writes: {min(oldtook):.4f}s)')
+        self.lt(min(took), min(oldtook))
+
+        # sending pre-encoded frames avoids joining them into one message
+        frames = [s_msgpack.en(b'V' * 4096) for _ in range(4096)]
+
+        took = []
+        oldtook = []
+        for _ in range(3):
+
+            tick = time.perf_counter()
+            await link0.sendv(frames)
+            took.append(time.perf_counter() - tick)
+
+            tick = time.perf_counter()
+            await link0.send(b''.join(frames))
+            oldtook.append(time.perf_counter() - tick)
+
+        logger.info(f'sendv() {len(frames)} frames: {min(took):.4f}s (joined send: {min(oldtook):.4f}s)')
+        self.lt(min(took), min(oldtook))
+
+        await link0.fini()
+        sock0.close()
+
     async def test_link_fromspawns(self):
 
         n = 100000
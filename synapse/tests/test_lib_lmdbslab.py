@@ -1,4 +1,5 @@
 import os
+import time
 import asyncio
 import pathlib
 import multiprocessing
@@ -395,6 +396,124 @@ class LmdbSlabTest(s_t_utils.SynTest):
             commitstats = [x[1] for x in commitstats if x[1] != 0]
             self.eq(commitstats, (100, 100, 100, 100, 100, 100, 100, 100, 100, 100))
 
+    async def test_lmdbslab_async_commit(self):
+
+        with self.getTestDir() as dirn:
+
+            path = os.path.join(dirn, 'test.lmdb')
+            async with await s_lmdbslab.Slab.anit(path, map_size=100_000, asynccommit=True) as slab:
+
+                self.nn(slab.writer)
+                foo = slab.initdb('foo')
+
+                slab.put(b'foo', b'bar', db=foo)
+                self.true(slab.forcecommit())
+
+                # the commit runs in the writer thread until the transaction is needed again
+                self.nn(slab.commitfut)
+                self.false(slab.dirty)
+                self.eq(b'bar', slab.get(b'foo', db=foo))
+                self.none(slab.commitfut)
+
+                # writes while a commit is running are kept in the replay log
+                slab.forcecommit()
+                self.false(slab.forcecommit())
+                slab.put(b'baz', b'faz', db=foo)
+                self.true(slab.dirty)
+                self.len(1, slab.xactops)
+
+                await slab.sync()
+                self.none(slab.commitfut)
+                self.len(0, slab.xactops)
+
+                # map growth during a background commit replays the transaction
+                byts = b'\x00' * 256
+                for i in range(1000):
+                    slab.put(s_common.guid(i).encode(), byts, db=foo)
+                    if i % 100 == 0:
+                        await slab.sync()
+
+                await slab.sync()
+                self.gt(slab.mapsize, 100_000)
+
+                stats = [s for s in await s_lmdbslab.Slab.getSlabStats() if s['path'] == path][0]
+                self.true(stats['asynccommit'])
+                self.eq(stats['commithist'], slab.getCommitHist())
+                self.eq(len(slab.commitstats), sum(c[1] for c in stats['commithist']))
+                self.none(stats['commithist'][-1][0])
+
+            async with await s_lmdbslab.Slab.anit(path, map_size=100_000) as slab:
+                self.none(slab.writer)
+                foo = slab.initdb('foo')
+                self.eq(1002, len(list(slab.scanByFull(db=foo))))
+                self.eq(b'faz', slab.get(b'baz', db=foo))
+
+                slab.put(b'foo', b'bar', db=foo)
+                slab.forcecommit()
+                self.none(slab.commitfut)
+
+                stats = [s for s in await s_lmdbslab.Slab.getSlabStats() if s['path'] == path][0]
+                self.false(stats['asynccommit'])
+                self.eq(len(slab.commitstats), sum(c[1] for c in stats['commithist']))
+
+    async def test_lmdbslab_async_commit_loop(self):
+
+        with self.getTestDir() as dirn:
+
+            path = os.path.join(dirn, 'test.lmdb')
+            async with await s_lmdbslab.Slab.anit(path, map_size=100_000, asynccommit=True) as slab:
+
+                foo = slab.initdb('foo')
+                mque = await slab.getMultiQueue('mque')
+                await mque.add('woot', {})
+
+                ticks = 0
+
+                async def ticker():
+                    nonlocal ticks
+                    while True:
+                        ticks += 1
+                        await asyncio.sleep(0.01)
+
+                slab.schedCoro(ticker())
+
+                commitxact = slab._commitXact
+
+                def slowcommit(xact):
+                    time.sleep(0.5)
+                    return commitxact(xact)
+
+                with patch.object(slab, '_commitXact', slowcommit):
+
+                    # the loop continues to run while async callers wait for a slow commit
+                    slab.put(b'foo', b'bar', db=foo)
+                    self.true(slab.forcecommit())
+                    self.nn(slab.commitfut)
+
+                    ticks = 0
+                    await slab.putmulti([(b'baz', b'faz')], db=foo)
+                    self.gt(ticks, 10)
+                    self.none(slab.commitfut)
+
+                    slab.forcecommit()
+                    self.nn(slab.commitfut)
+
+                    ticks = 0
+                    self.eq(0, await mque.put('woot', 'hehe'))
+                    self.gt(ticks, 10)
+                    self.none(slab.commitfut)
+
+                    ticks = 0
+                    await slab.sync()
+                    self.gt(ticks, 10)
+                    self.none(slab.commitfut)
+
+                    self.eq(b'bar', slab.get(b'foo', db=foo))
+                    self.eq(b'faz', slab.get(b'baz', db=foo))
+                    self.eq([(0, 'hehe')], [x async for x in mque.gets('woot', 0)])
+                    self.false(slab.dirty)
+                    self.len(0, slab.xactops)
+
     async def test_lmdbslab_max_replay(self):
         with self.getTestDir() as dirn:
             path = os.path.join(dirn, 'test.lmdb')
@@ -742,6 +861,18 @@ class LmdbSlabTest(s_t_utils.SynTest):
             async with await s_lmdbslab.Slab.anit(path, map_size=100000, growsize=10000) as slab:
                 self.eq(0, await slab.countByPref(b'asdf'))
 
+    async def test_lmdbslab_getmulti(self):
+
+        with self.getTestDir() as dirn:
+            path = os.path.join(dirn, 'test.lmdb')
+            async with await s_lmdbslab.Slab.anit(path, map_size=100000, growsize=10000) as slab:
+                foo = slab.initdb('foo')
+                slab.put(b'\x00\x01', b'hehe', db=foo)
+                slab.put(b'\x00\x03', b'haha', db=foo)
+
+                self.eq([], slab.getmulti([], db=foo))
+                self.eq([b'haha', None, b'hehe'], slab.getmulti([b'\x00\x03', b'\x00\x02', b'\x00\x01'], db=foo))
+
     async def test_lmdbslab_grow(self):
 
         with self.getTestDir() as dirn:
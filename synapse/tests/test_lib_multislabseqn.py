@@ -14,6 +14,39 @@ from synapse.tests.utils import alist
 
 class MultiSlabSeqn(s_t_utils.SynTest):
 
+    async def test_multislabseqn_save(self):
+
+        with self.getTestDir() as dirn:
+
+            async with await s_multislabseqn.MultiSlabSeqn.anit(dirn) as msqn:
+
+                self.eq(0, await msqn.add('foo'))
+                self.eq(1, await msqn.save(('bar', 'baz')))
+                self.eq(3, msqn.index())
+
+                msqn.setIndex(10)
+                self.eq(10, await msqn.save(('faz',)))
+                self.eq(11, msqn.index())
+                self.true(await msqn.waitForOffset(10, timeout=0.5))
+
+                await msqn.rotate()
+                self.eq(11, await msqn.save(('hehe', 'haha')))
+
+                retn = await alist(msqn.iter(0))
+                self.eq([(0, 'foo'), (1, 'bar'), (2, 'baz'), (10, 'faz'), (11, 'hehe'), (12, 'haha')], retn)
+                self.eq((12, 'haha'), await msqn.last())
+
+                info = await msqn.saveInfo(('lol',))
+                self.eq(13, info['orig'])
+                self.eq(1, info['count'])
+
+                rows = await alist(msqn.rows(2))
+                self.eq([2, 10, 11, 12, 13], [indx for (indx, byts) in rows])
+                self.eq(b'\xa3baz', rows[0][1])
+
+                self.eq(0, msqn.getRangeStart(10))
+                self.eq(11, msqn.getRangeStart(12))
+
     async def test_multislabseqn_base(self):
 
         with self.getTestDir() as dirn:
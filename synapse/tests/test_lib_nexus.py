@@ -111,6 +111,117 @@ class NexusTest(s_t_utils.SynTest):
                     stream.seek(0)
                     self.isin('while replaying log', stream.read())
 
+    async def test_nexus_group(self):
+
+        with self.getTestDir() as dirn:
+
+            conf = {'nexslog:en': True, 'nexslog:group:size': 4, 'nexslog:group:wait': 0.1}
+            async with await SampleNexus.anit(conf=conf, dirn=dirn) as nexus1:
+
+                nexsroot = nexus1.nexsroot
+                strt = await nexsroot.index()
+
+                eventdicts = [{'specialpush': 0} for x in range(6)]
+                retn = await asyncio.gather(*[nexus1.doathing2(evnt) for evnt in eventdicts])
+                self.eq(retn, ['foo'] * 6)
+
+                # events are logged and applied in the order they were issued
+                self.eq(list(range(strt, strt + 6)), [evnt.get('gotindex') for evnt in eventdicts])
+                self.eq(strt + 6, await nexsroot.index())
+
+                items = [item async for item in nexsroot.nexslog.iter(strt)]
+                self.eq(list(range(strt, strt + 6)), [item[0] for item in items])
+
+                # a failure applying one event does not effect the rest of the group
+                eventdict = {'specialpush': 0}
+                retn = await asyncio.gather(nexus1.doathing(eventdict), nexus1.doathingauto3(eventdict),
+                                            nexus1.doathingauto(eventdict, 'bar'), return_exceptions=True)
+                self.eq('foo', retn[0])
+                self.isinstance(retn[1], s_exc.SynErr)
+                self.eq('bar', retn[2])
+                self.eq(strt + 9, await nexsroot.index())
+
+                stats = nexsroot.getGroupStats()
+                self.eq(4, stats['size'])
+                self.eq(0.1, stats['wait'])
+                self.eq({2: 1, 4: 2}, stats['hist'])
+                self.eq(stats, (await nexus1.getCellInfo())['cell']['nexsgroup'])
+
+                with self.getLoggerStream('synapse.lib.nexus') as stream:
+                    await nexsroot.recover()
+
+                # recovery replays up to a group of events
+                stream.seek(0)
+                self.isin('while replaying log', stream.read())
+
+                await nexsroot.addWriteHold('test')
+                with self.raises(s_exc.IsReadOnly):
+                    await nexus1.doathing({'specialpush': 0})
+                await nexsroot.delWriteHold('test')
+
+            # recovery replays the last group even if the group size was lowered
+            conf = {'nexslog:en': True, 'nexslog:group:size': 1}
+            async with await SampleNexus.anit(conf=conf, dirn=dirn) as nexus1:
+
+                nexsroot = nexus1.nexsroot
+                self.eq(strt + 6, nexsroot.nexshot.get('nexs:group:offs'))
+                self.eq(3, nexsroot.nexshot.get('nexs:group:size'))
+
+                replayed = []
+                async def _apply(indx, mesg):
+                    replayed.append(indx)
+
+                with mock.patch.object(nexsroot, '_apply', _apply):
+                    await nexsroot.recover()
+                self.eq([strt + 6, strt + 7, strt + 8], replayed)
+
+                # events logged after the group only replay the last entry
+                await nexus1.doathing({'specialpush': 0})
+
+                replayed.clear()
+                with mock.patch.object(nexsroot, '_apply', _apply):
+                    await nexsroot.recover()
+                self.eq([strt + 9], replayed)
+
+            conf = {'nexslog:en': False, 'nexslog:group:size': 2}
+            async with await SampleNexus.anit(conf=conf, dirn=dirn) as nexus1:
+
+                nexsroot = nexus1.nexsroot
+                strt = await nexsroot.index()
+
+                eventdicts = [{'specialpush': 0} for x in range(3)]
+                await asyncio.gather(*[nexus1.doathing2(evnt) for evnt in eventdicts])
+                self.eq(list(range(strt, strt + 3)), [evnt.get('gotindex') for evnt in eventdicts])
+                self.eq(strt + 3, await nexsroot.index())
+
+    async def test_nexus_group_mirror(self):
+
+        with self.getTestDir() as dirn:
+
+            s_common.yamlsave({'nexslog:en': True}, dirn, 'cell.yaml')
+            async with await s_cell.Cell.anit(dirn=dirn) as cell00:
+
+                await cell00.runBackup(name='cell01')
+
+                path = s_common.genpath(dirn, 'backups', 'cell01')
+
+                conf = s_common.yamlload(path, 'cell.yaml')
+                conf['mirror'] = f'cell://{dirn}'
+                conf['nexslog:group:size'] = 8
+                conf['nexslog:group:wait'] = 30
+                s_common.yamlsave(conf, path, 'cell.yaml')
+
+                async with await s_cell.Cell.anit(dirn=path) as cell01:
+
+                    # events from the leader are not delayed waiting for a group to fill
+                    for i in range(3):
+                        await cell00.auth.addUser(f'user{i}')
+
+                    await asyncio.wait_for(cell01.sync(), timeout=10)
+
+                    self.nn(await cell01.auth.getUserByName('user2'))
+                    self.len(0, cell01.nexsroot.grouphist)
+
     async def test_nexus_modroot(self):
 
         async with self.getTestCell() as cell:
@@ -914,6 +914,38 @@ class ScrapeTest(s_t_utils.SynTest):
         infos = s_scrape._contextScrapeList(text)
         self.eq(infos, [{'match': 'CVE–2022–1138', 'offset': 29, 'valu': 'CVE-2022-1138', 'form': 'it:sec:cve'}])
 
+    async def test_scrape_async_chunks(self):
+
+        self.eq([(0, 'foo\n'), (4, 'bar\n'), (8, 'baz')], s_scrape._chunkText('foo\nbar\nbaz', 2))
+        self.eq([(0, 'foo\nbar\n'), (8, 'baz')], s_scrape._chunkText('foo\nbar\nbaz', 4))
+        self.eq([(0, 'foo bar baz')], s_scrape._chunkText('foo bar baz', 2))
+        self.eq([(0, 'foo\n'), (4, '\n')], s_scrape._chunkText('foo\n\n', 1))
+
+        text = '\n'.join([data0, data1, data2, data3, btc_addresses, linux_paths, windows_paths, unc_paths, cpedata])
+
+        infos = s_scrape._contextScrapeList(text)
+        ndefs = [(info.get('form'), info.get('valu')) for info in infos]
+        fqdns = [ndef for ndef in ndefs if ndef[0] == 'inet:fqdn']
+
+        with mock.patch('synapse.lib.scrape.scrape_chunk_size', 1000):
+            self.eq(infos, await s_t_utils.alist(s_scrape.contextScrapeAsync(text)))
+            self.eq(ndefs, await s_t_utils.alist(s_scrape.scrapeAsync(text)))
+            self.eq(fqdns, await s_t_utils.alist(s_scrape.scrapeAsync(text, ptype='inet:fqdn')))
+            self.eq(ndefs[:1], await s_t_utils.alist(s_scrape.scrapeAsync(text, first=True)))
+
+        # the CVE rule consumes the newline at the end of a chunk so the following line
+        # may not use it as a prefix, and matches at chunk boundaries must be the same
+        text = 'x ...cve–2021-12345\nCVE-2020-1234.\nCVE-2020-4321\n\\\\foo\\bar\n"\\\\srv\\share"\nCWE-1'
+
+        infos = s_scrape._contextScrapeList(text)
+        self.eq([info.get('valu') for info in infos], [
+            'smb://foo/bar', 'smb://srv/share', 'cve-2021-12345', 'CVE-2020-4321', 'CWE-1',
+        ])
+
+        for size in range(1, len(text)):
+            with mock.patch('synapse.lib.scrape.scrape_chunk_size', size):
+                self.eq(infos, await s_t_utils.alist(s_scrape.contextScrapeAsync(text)))
+
     def test_scrape_sequential(self):
         md5 = ('a' * 32, 'b' * 32,)
         sha1 = ('c' * 40, 'd' * 40,)
@@ -1237,3 +1269,27 @@ class ScrapeTest(s_t_utils.SynTest):
         self.isin(('inet:url', 'https://woot.com'), nodes)
         self.isin(('inet:fqdn', 'vertex.link'), nodes)
         self.isin(('inet:fqdn', 'woot.com'), nodes)
+
+    def test_scrape_prefilter(self):
+
+        blobs = [
+            data0, data1, data2, data3, btc_addresses, eth_addresses, bch_addresses,
+            xrp_addresses, substrate_addresses, cardano_addresses, linux_paths, windows_paths, unc_paths, cpedata,
+        ]
+        text = '\n'.join(blobs)
+
+        for refang in (True, False):
+            valus = list(s_scrape._contextScrape(text, refang=refang))
+            self.gt(len(valus), 100)
+            self.eq(valus, list(s_scrape._contextScrape(text, refang=refang, prefilter=False)))
+
+        text = 'foo bar\tbaz\nwoot.com CVE-2020-1234 "1.2.3.4:80",1.2.3.5 /bin/sh -c \\\\host\\share\nvisi@vertex.link'
+        self.eq(list(s_scrape._contextScrape(text)), list(s_scrape._contextScrape(text, prefilter=False)))
+
+        spans = s_scrape._getTriggerSpans(text)
+        self.eq(spans['dot'], [(12, 20), (35, 55), (80, 96)])
+        self.eq(spans['at'], [(80, 96)])
+        self.eq(spans['cpe'], [])
+
+        self.eq([], list(s_scrape.contextScrape('')))
+        self.eq([], list(s_scrape.contextScrape('   \n ')))
@@ -132,6 +132,70 @@ class SnapTest(s_t_utils.SynTest):
                 self.eq(node2, node)
                 self.nn(node2.get('baz'))
 
+    async def test_addNodes_batch(self):
+
+        async with self.getTestCore() as core:
+
+            async with await core.snap() as snap:
+
+                nexsindx = await core.getNexsIndx()
+
+                ndefs = [(('test:int', x), {'tags': {'foo': (2020, 2021)}}) for x in range(10)]
+                ndefs.insert(5, (('test:int', 'newp'), {}))
+                ndefs.insert(7, (('test:newp', 10), {}))
+                ndefs.append((('test:int', 3), {'tags': {'foo': (2019, 2020)}, 'props': {'loc': 'us'}}))
+
+                msgs = []
+                snap.link(msgs.append)
+                nodes = await alist(snap.addNodes(ndefs))
+                snap.unlink(msgs.append)
+
+                self.len(11, nodes)
+                self.eq(list(range(10)) + [3], [n.ndef[1] for n in nodes])
+                self.eq((2019, 2021), nodes[3].get('#foo'))
+                self.eq('us', nodes[3].get('loc'))
+
+                warns = [m[1].get('mesg') for m in msgs if m[0] == 'warn']
+                self.len(2, warns)
+                self.isin('BadTypeValu test:int=newp', warns[0])
+                self.isin('No form named test:newp', warns[1])
+
+                # the repeated node flushes the batch before it is edited
+                self.eq(nexsindx + 2, await core.getNexsIndx())
+
+                snap.addnodesbatch = 3
+                nexsindx = await core.getNexsIndx()
+
+                nodes = await alist(snap.addNodes([(('test:int', x), {}) for x in range(20, 30)]))
+                self.len(10, nodes)
+                self.eq(nexsindx + 4, await core.getNexsIndx())
+
+                # a failure saving the batch falls back to saving each nodedef
+                applyNodeEdits = snap.applyNodeEdits
+
+                async def badApplyNodeEdits(edits, nodecache=None, meta=None):
+                    for buid, form, _ in edits:
+                        if buid == s_common.buid(('test:int', 32)):
+                            raise s_exc.SynErr(mesg='newp')
+                    return await applyNodeEdits(edits, nodecache=nodecache, meta=meta)
+
+                snap.strict = False
+                snap.applyNodeEdits = badApplyNodeEdits
+
+                msgs = []
+                snap.link(msgs.append)
+                nodes = await alist(snap.addNodes([(('test:int', x), {}) for x in range(30, 35)]))
+                snap.unlink(msgs.append)
+
+                self.eq((30, 31, 33, 34), [n.ndef[1] for n in nodes])
+                warns = [m[1].get('mesg') for m in msgs if m[0] == 'warn']
+                self.len(1, warns)
+                self.isin("('test:int', 32)", warns[0])
+
+                snap.strict = True
+                with self.raises(s_exc.SynErr):
+                    await alist(snap.addNodes([(('test:int', x), {}) for x in range(30, 35)]))
+
     async def test_addNodesAuto(self):
         '''
         Secondary props that are forms when set make nodes
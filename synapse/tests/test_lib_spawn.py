@@ -0,0 +1,118 @@
+import unittest.mock as mock
+
+import synapse.exc as s_exc
+
+import synapse.lib.lmdbslab as s_lmdbslab
+
+import synapse.tests.utils as s_test
+
+class SpawnTest(s_test.SynTest):
+
+    async def test_spawn_storm(self):
+
+        conf = {'storm:spawn:procs': 1}
+
+        async with self.getTestCore(conf=conf) as core:
+
+            visi = await core.auth.addUser('visi')
+
+            await core.nodes('[ inet:ipv4=1.2.3.4 inet:ipv4=5.6.7.8 :asn=20 +#foo ]')
+
+            opts = {'readonly': True}
+
+            msgs = await core.stormlist('inet:ipv4 +#foo -> inet:asn', opts=opts)
+            self.len(2, [m for m in msgs if m[0] == 'node'])
+            self.eq('init', msgs[0][0])
+            self.eq('fini', msgs[-1][0])
+
+            self.len(1, core.spawnpool.procs)
+            proc = list(core.spawnpool.procs)[0]
+            self.true(proc.proc.is_alive())
+
+            self.eq(2, await core.count('inet:ipv4', opts=opts))
+
+            # changes made since the last query are visible to the spawned process
+            await core.nodes('[ inet:ipv4=9.9.9.9 ]')
+            self.eq(3, await core.count('inet:ipv4', opts=opts))
+
+            # the idle process is reused
+            self.len(1, core.spawnpool.procs)
+            self.true(proc in core.spawnpool.procs)
+
+            # queries which are not readonly run locally
+            self.len(1, await core.nodes('[ inet:ipv4=10.0.0.1 ]'))
+            self.eq(4, await core.count('inet:ipv4', opts={'readonly': True, 'spawn': False}))
+
+            msgs = await core.stormlist('[ inet:ipv4=10.0.0.2 ]', opts=opts)
+            self.stormIsInErr('Storm runtime is in readonly mode', msgs)
+            self.eq(4, await core.count('inet:ipv4'))
+
+            with self.raises(s_exc.BadSyntax):
+                await core.count('inet:ipv4 |||', opts=opts)
+
+            # permissions are enforced in the spawned process
+            opts = {'readonly': True, 'user': visi.iden}
+            msgs = await core.stormlist('inet:ipv4', opts=opts)
+            self.len(4, [m for m in msgs if m[0] == 'node'])
+
+            msgs = await core.stormlist('$lib.print($lib.user.name())', opts=opts)
+            self.stormIsInPrint('visi', msgs)
+
+            await core.nodes('$lib.globals.set(foo, bar)')
+
+            msgs = await core.stormlist('$lib.print($lib.globals.get(foo))', opts=opts)
+            self.stormIsInErr('must have permission globals.get.foo', msgs)
+
+            await visi.addRule((True, ('globals', 'get', 'foo')))
+            msgs = await core.stormlist('$lib.print($lib.globals.get(foo))', opts=opts)
+            self.stormIsInPrint('bar', msgs)
+
+            # model and command changes retire the idle processes
+            await core.addForm('_foo:bar', 'str', {}, {})
+            self.len(0, core.spawnpool.idle)
+
+            await core.nodes('[ _foo:bar=hehe ]')
+            msgs = await core.stormlist('_foo:bar', opts={'readonly': True})
+            self.len(1, [m for m in msgs if m[0] == 'node'])
+            self.false(proc in core.spawnpool.procs)
+
+            await core.setStormCmd({'name': 'foo.bar', 'storm': '$lib.print(hehe)'})
+            self.len(0, core.spawnpool.idle)
+
+            msgs = await core.stormlist('foo.bar', opts={'readonly': True})
+            self.stormIsInPrint('hehe', msgs)
+
+    async def test_spawn_sync(self):
+
+        conf = {'storm:spawn:procs': 1}
+
+        async with self.getTestCore(conf=conf) as core:
+
+            await core.nodes('[ inet:ipv4=1.2.3.4 ]')
+
+            opts = {'readonly': True}
+            self.eq(1, await core.count('inet:ipv4', opts=opts))
+
+            syncs = []
+            slabsync = s_lmdbslab.Slab.sync
+
+            async def sync(self):
+                syncs.append(self.path)
+                return await slabsync(self)
+
+            with mock.patch.object(s_lmdbslab.Slab, 'sync', sync):
+
+                # slabs without pending writes are not synced for each query
+                await core.slab.sync()
+                for layr in core.view.layers:
+                    await layr.layrslab.sync()
+                    await layr.dataslab.sync()
+
+                syncs.clear()
+                self.eq(1, await core.count('inet:ipv4', opts=opts))
+                self.eq(1, await core.count('inet:ipv4', opts=opts))
+                self.len(0, syncs)
+
+                # pending writes are synced before the query
+                await core.nodes('[ inet:ipv4=5.6.7.8 ]')
+                self.eq(2, await core.count('inet:ipv4', opts=opts))
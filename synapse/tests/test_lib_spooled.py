@@ -1,4 +1,7 @@
 import os
+import tempfile
+
+import unittest.mock as mock
 
 import synapse.tests.utils as s_test
 
@@ -128,3 +131,57 @@ class SpooledTest(s_test.SynTest):
 
         async with await s_spooled.Dict.anit(size=1000) as sd1:
             await runtest(sd1)
+
+    async def test_spooled_counter(self):
+
+        async def runtest(x):
+            await x.inc('foo')
+            await x.inc('bar', 3)
+            await x.inc('foo')
+            await x.inc('baz', -1)
+            await x.inc(10)
+            self.eq(x.get('foo'), 2)
+            self.eq(x.get('bar'), 3)
+            self.eq(x.get('baz'), -1)
+            self.eq(x.get('newp'), 0)
+            self.eq(x.get('newp', None), None)
+            self.len(4, x)
+
+            await x.inc('bar')
+            await x.inc('hehe', 5)
+            self.eq(x.get('bar'), 4)
+            self.eq(x.get('hehe'), 5)
+            self.len(5, x)
+            self.eq(list(x.items()), [('foo', 2), ('bar', 4), ('baz', -1), (10, 1), ('hehe', 5)])
+
+        async with await s_spooled.Counter.anit(size=2) as sc0:
+            await runtest(sc0)
+            self.true(sc0.fallback)
+
+        async with await s_spooled.Counter.anit(size=1000) as sc1:
+            await runtest(sc1)
+            self.false(sc1.fallback)
+
+    async def test_spooled_sorted(self):
+
+        items = [(i * 7919) % 101 for i in range(101)]
+
+        with self.getTestDir() as dirn:
+
+            self.eq(sorted(items), [x async for x in s_spooled.sortedItems(items, size=10, dirn=dirn)])
+            self.eq(sorted(items, reverse=True), [x async for x in s_spooled.sortedItems(items, reverse=True, size=10, dirn=dirn)])
+            self.eq(sorted(items), [x async for x in s_spooled.sortedItems(items, dirn=dirn)])
+
+            # runs are spooled to temporary files in the tmp directory
+            with mock.patch('tempfile.TemporaryFile', wraps=tempfile.TemporaryFile) as tfile:
+                genr = s_spooled.sortedItems(items, size=10, dirn=dirn)
+                self.eq(0, await genr.__anext__())
+                self.eq(10, tfile.call_count)
+                self.eq(os.path.join(dirn, 'tmp'), tfile.call_args.kwargs['dir'])
+                await genr.aclose()
+
+            pairs = [(str(x), x % 3) for x in items]
+            key = lambda x: (x[1], x[0])
+            self.eq(sorted(pairs, key=key), [x async for x in s_spooled.sortedItems(pairs, key=key, size=7)])
+
+            self.eq([], [x async for x in s_spooled.sortedItems((), size=7)])
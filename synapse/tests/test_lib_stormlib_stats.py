@@ -1,6 +1,9 @@
+from unittest import mock
+
 import synapse.exc as s_exc
 import synapse.tests.utils as s_test
 
+import synapse.lib.spooled as s_spooled
 import synapse.lib.stormlib.stats as s_stormlib_stats
 
 chartnorm = '''
@@ -277,8 +280,64 @@ class StatsTest(s_test.SynTest):
             vals = await core.callStorm(q)
             self.eq(vals, [('foo', 2), ('bar', 1)])
 
-            tally = s_stormlib_stats.StatTally()
-            await tally.inc('foo')
+            async with await s_spooled.Counter.anit() as counters:
+
+                tally = s_stormlib_stats.StatTally(counters)
+                await tally.inc('foo')
+
+                async for (name, valu) in tally:
+                    self.eq((name, valu), ('foo', 1))
+
+    async def test_stormlib_stats_spooled(self):
+
+        orig = s_spooled.Spooled.__anit__
+
+        async def __anit__(self, dirn=None, size=s_spooled.MAX_SPOOL_SIZE, cell=None):
+            await orig(self, dirn=dirn, size=2, cell=cell)
+
+        sortedItems = s_spooled.sortedItems
+
+        def sortedSpooled(items, key=None, reverse=False, dirn=None, size=s_spooled.MAX_SPOOL_SIZE):
+            return sortedItems(items, key=key, reverse=reverse, dirn=dirn, size=2)
+
+        async with self.getTestCore() as core:
+
+            q = '''
+            $i = (0)
+            for $x in $lib.range(5) {
+                for $y in $lib.range(($x + 1)) {
+                    [ inet:ipv4=$i :asn=(($x * 10) % 17) ]
+                    $i = ($i + 1)
+                }
+            }
+            '''
+            await core.nodes(q)
+
+            with mock.patch('synapse.lib.spooled.Spooled.__anit__', __anit__), \
+                 mock.patch('synapse.lib.spooled.sortedItems', sortedSpooled):
+
+                msgs = await core.stormlist('inet:ipv4 | stats.countby :asn')
+                self.stormIsInPrint(chartnorm, msgs)
+
+                msgs = await core.stormlist('inet:ipv4 | stats.countby :asn --by-name')
+                self.stormIsInPrint(chartnorm_byname, msgs)
+
+                msgs = await core.stormlist('inet:ipv4 | stats.countby :asn --size 3 --reverse')
+                self.stormIsInPrint(chartsizerev, msgs)
+
+                msgs = await core.stormlist('inet:ipv4 | stats.countby :asn --size 3 --by-name')
+                self.stormIsInPrint(chartsize_byname, msgs)
+
+                q = '''
+                    $tally = $lib.stats.tally()
+                    for $i in $lib.range(10) { $tally.inc(($i % 3), $i) }
+                    $tally.inc(foo)
+                    $lib.print('tally.len()={v} 1={o}', v=$lib.len($tally), o=$tally.get(1))
+                    return(($tally, $tally.sorted()))
+                '''
+                msgs = await core.stormlist(q)
+                self.stormIsInPrint('tally.len()=4 1=12', msgs)
 
-            async for (name, valu) in tally:
-                self.eq((name, valu), ('foo', 1))
+                (tally, vals) = await core.callStorm(q)
+                self.eq(tally, {'0': 18, '1': 12, '2': 15, 'foo': 1})
+                self.eq(vals, [('foo', 1), ('1', 12), ('2', 15), ('0', 18)])
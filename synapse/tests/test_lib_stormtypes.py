@@ -17,6 +17,7 @@ import synapse.common as s_common
 
 import synapse.lib.json as s_json
 import synapse.lib.time as s_time
+import synapse.lib.layer as s_layer
 import synapse.lib.storm as s_storm
 import synapse.lib.hashset as s_hashset
 import synapse.lib.httpapi as s_httpapi
@@ -5825,6 +5826,73 @@ class StormTypesTest(s_test.SynTest):
 
             self.eq([], await alist(core.getLayer().iterPropIndxBuids('newp', 'newp', 'newp')))
 
+    async def test_stormtypes_prop_value_counts(self):
+
+        async with self.getTestCore() as core:
+
+            longa = 'a' * 512 + 'a'
+            longb = 'a' * 512 + 'b'
+
+            await core.nodes('[ media:news=(a,) :title=foo .seen=2020 ]')
+            await core.nodes('[ media:news=(b,) :title=foo .seen=2020 ]')
+            await core.nodes('[ media:news=(c,) :title=bar .seen=2021 ]')
+            await core.nodes('[ media:news=(d,) :title=$longa ]', opts={'vars': {'longa': longa}})
+
+            forkview = await core.callStorm('return($lib.view.get().fork().iden)')
+            forkopts = {'view': forkview, 'vars': {'longa': longa, 'longb': longb}}
+
+            # update, shadow, and duplicate values in the fork
+            await core.nodes('[ media:news=(a,) :title=bar ]', opts=forkopts)
+            await core.nodes('[ media:news=(c,) :title=bar .seen=2022 ]', opts=forkopts)
+            await core.nodes('[ media:news=(d,) :title=$longb ]', opts=forkopts)
+            await core.nodes('[ media:news=(e,) :title=$longa ]', opts=forkopts)
+            await core.nodes('[ media:news=(f,) :title=baz ]', opts=forkopts)
+
+            viewq = '''
+            $vals = ([])
+            for $item in $lib.view.get().getPropValueCounts($prop) {
+                $vals.append($item)
+            }
+            return($vals)
+            '''
+
+            async def checkCounts(prop, expect, view=None):
+                opts = {'view': view, 'vars': {'prop': prop}}
+                counts = await core.callStorm(viewq, opts=opts)
+                self.sorteq(expect, counts)
+                self.eq(sum(c for (v, c) in counts), await core.count(prop, opts=opts))
+
+            await checkCounts('media:news:title', (('foo', 2), ('bar', 1), (longa, 1)))
+            await checkCounts('media:news:title', (('foo', 1), ('bar', 2), ('baz', 1), (longa, 1), (longb, 1)),
+                              view=forkview)
+
+            await checkCounts('media:news', [(s_common.guid((n,)), 1) for n in 'abcdef'], view=forkview)
+
+            ival = core.model.type('ival')
+            merged = (ival.norm('2021')[0][0], ival.norm('2022')[0][1])
+            await checkCounts('.seen', ((ival.norm('2020')[0], 2), (merged, 1)), view=forkview)
+
+            await checkCounts('ps:contact:name', ())
+
+            with self.raises(s_exc.NoSuchProp):
+                await core.callStorm(viewq, opts={'vars': {'prop': 'newp:newp'}})
+
+            layr = core.getLayer()
+            counts = await alist(layr.iterPropValuCounts('media:news', 'title', s_layer.STOR_TYPE_UTF8))
+            self.sorteq([(valu, count) for (indx, valu, count) in counts], (('bar', 1), ('foo', 2), (longa, 1)))
+
+            self.eq([], await alist(layr.iterPropValuCounts('newp', 'newp', s_layer.STOR_TYPE_UTF8)))
+
+            msgs = await core.stormlist('stats.countby --prop media:news:title', opts={'view': forkview})
+            self.stormIsInPrint('bar | 2 | ##################################################', msgs)
+            self.stormIsInPrint('baz | 1 | #########################', msgs)
+
+            msgs = await core.stormlist('media:news | stats.countby :title --prop media:news:title')
+            self.stormIsInErr('The --prop option may not be used with a value to tally.', msgs)
+
+            msgs = await core.stormlist('stats.countby --prop newp:newp')
+            self.stormIsInErr('No property named newp:newp', msgs)
+
     async def test_lib_stormtypes_cmdopts(self):
         pdef = {
             'name': 'foo',
@@ -6233,6 +6301,7 @@ words\tword\twrd'''
             self.eq({
                 'file:count': 9,
                 'size:bytes': 646,
+                'size:stored': 646,
             }, await core.callStorm('return($lib.axon.metrics())'))
 
             bin_buf = b'\xbb/$\xc0A\xf1\xbf\xbc\x00_\x82v4\xf6\xbd\x1b'
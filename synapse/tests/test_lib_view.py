@@ -1,10 +1,15 @@
 import asyncio
 import collections
 
+from unittest import mock
+
 import synapse.exc as s_exc
 import synapse.common as s_common
 
 import synapse.lib.time as s_time
+import synapse.lib.view as s_view
+import synapse.lib.layer as s_layer
+import synapse.lib.msgpack as s_msgpack
 
 import synapse.tests.utils as s_t_utils
 from synapse.tests.utils import alist
@@ -937,3 +942,239 @@ class ViewTest(s_t_utils.SynTest):
 
             opts['vars']['iden'] = view02.iden
             self.eq([], await core.callStorm(q, opts=opts))
+
+    async def test_view_count_indx(self):
+
+        async with self.getTestCore() as core:
+
+            view00 = core.getView()
+            view01 = core.getView((await view00.fork())['iden'])
+
+            await core.nodes('[ inet:fqdn=woot.com inet:fqdn=vertex.link +#foo.bar ]')
+            await core.nodes('[ inet:ipv4=1.2.3.4 :asn=10 +#foo .seen=2020 ]')
+            await core.nodes('[ inet:ipv4=5.6.7.8 ]')
+
+            opts = {'view': view01.iden}
+            await core.nodes('[ inet:ipv4=9.9.9.9 :asn=20 +#foo ]', opts=opts)
+            await core.nodes('inet:ipv4=1.2.3.4 [ :asn=30 +#foo.baz ]', opts=opts)
+            await core.nodes('inet:fqdn=woot.com [ -#foo ]', opts=opts)
+
+            # a node deleted from the parent which still has edits in the fork
+            await core.nodes('[ inet:ipv4=3.3.3.3 ]')
+            await core.nodes('inet:ipv4=3.3.3.3 [ :asn=40 +#foo ]', opts=opts)
+            await core.nodes('inet:ipv4=3.3.3.3 | delnode')
+
+            queries = (
+                'inet:ipv4',
+                'inet:ipv4:asn',
+                '.seen',
+                'inet:ipv4.seen',
+                '#foo',
+                '#foo.bar',
+                'inet:ipv4#foo',
+                'inet:fqdn#foo',
+                'inet:ipv4 +#foo',
+                'inet:ipv4 +:asn',
+                'inet:ipv4 +.seen',
+                'inet:fqdn:zone',
+                'syn:form',
+                'test:newp#foo',
+            )
+
+            evals = collections.defaultdict(int)
+
+            for view in (view00, view01):
+
+                async def eval(text, opts=None):
+                    evals[text] += 1
+                    async for node in view.__class__.eval(view, text, opts=opts):
+                        yield node
+
+                for text in queries:
+
+                    if text.startswith('test:newp'):
+                        with self.raises(s_exc.NoSuchForm):
+                            await view.count(text)
+                        continue
+
+                    nodes = await view.nodes(text)
+
+                    view.eval = eval
+                    self.eq(len(nodes), await view.count(text), msg=text)
+                    del view.eval
+
+                    self.eq(len(nodes), await core.count(text, opts={'view': view.iden}), msg=text)
+
+            # only the runtime form lift is executed
+            self.eq(['syn:form'], list(evals.keys()))
+
+            # queries which may not be counted from the indexes are executed
+            self.eq(1, await view01.count('inet:ipv4 +:asn=20'))
+            self.eq(2, await view01.count('inet:ipv4:asn', opts={'limit': 2}))
+            self.eq(4, await view01.count('inet:ipv4', opts={'idens': [s_common.ehex(s_common.buid(('inet:fqdn', 'woot.com')))]}))
+
+    async def test_view_count_lazy(self):
+
+        async with self.getTestCore() as core:
+
+            await core.nodes('for $x in $lib.range(10) {[ test:int=$x :loc=us +#bar ]}')
+
+            fork = await core.callStorm('return($lib.view.get().fork().iden)')
+            opts = {'view': fork}
+
+            await core.nodes('for $x in $lib.range(5) {[ test:int=$($x + 10) :loc=ca +#foo ]}', opts=opts)
+            await core.nodes('test:int=3 [ +#foo ]', opts=opts)
+
+            view = core.getView(fork)
+
+            lazyadd = mock.patch.object(s_layer.LazySodes, 'add', autospec=True, side_effect=s_layer.LazySodes.add)
+            lazyget = mock.patch.object(s_layer.LazySodes, 'get', autospec=True, side_effect=s_layer.LazySodes.get)
+
+            with lazyadd as lazyadd, lazyget as lazyget:
+
+                # only counted nodes do not retrieve the deferred storage nodes
+                self.eq(6, await view.count('test:int#foo | uniq'))
+                self.eq(5, lazyadd.call_count)
+
+                self.eq(6, await view.count('#foo | count --yield'))
+
+                msgs = await core.stormlist('test:int#foo | uniq | count', opts=opts)
+                self.stormIsInPrint('Counted 6 nodes.', msgs)
+
+                self.eq(15, lazyadd.call_count)
+                lazyget.assert_not_called()
+
+                # nodes which are filtered or yielded are not lazy
+                lazyadd.reset_mock()
+
+                self.eq(5, await view.count('test:int#foo +:loc=ca'))
+                self.eq(1, await view.count('test:int#foo | uniq | +#bar'))
+
+                nodes = await core.nodes('test:int#foo | uniq', opts=opts)
+                self.len(6, nodes)
+                self.eq(['ca'] * 5 + ['us'], sorted(n.get('loc') for n in nodes))
+
+                msgs = await core.stormlist('test:int#foo | count --yield', opts=opts)
+                self.len(1, [m for m in msgs if m[0] == 'node' and 'bar' in m[1][1]['tags']])
+
+                lazyadd.assert_not_called()
+                lazyget.assert_not_called()
+
+            # the deferred storage nodes for a lift window are retrieved in one batch
+            async with await view.snap(user=core.auth.rootuser) as snap:
+                snap.lazynodes = True
+
+                nodes = await alist(snap.nodesByTag('foo', form='test:int'))
+                self.len(6, nodes)
+
+                with mock.patch.object(s_layer.Layer, '_viewStorNodes', autospec=True,
+                                       side_effect=s_layer.Layer._viewStorNodes) as viewsodes:
+
+                    self.eq(['ca'] * 5 + ['us'], sorted(n.get('loc') for n in nodes))
+                    self.len(1, [n for n in nodes if n.get('#bar') is not None])
+                    self.eq(1, viewsodes.call_count)
+
+    async def test_view_merge_bulk(self):
+
+        async with self.getTestCore() as core:
+
+            visi = await core.auth.addUser('visi')
+            await visi.addRule((True, ('view', 'read')))
+
+            ninjas = await core.auth.addRole('ninjas')
+            await visi.grant(ninjas.iden)
+
+            opts = {'vars': {'role': ninjas.iden}}
+            await core.callStorm('return($lib.view.get().set(quorum, ({"count": 1, "roles": [$role]})))', opts=opts)
+
+            async def mergeFork(fork, checkpoint=None):
+
+                await core.callStorm('return($lib.view.get().setMergeRequest())', opts={'view': fork.iden})
+
+                if checkpoint is not None:
+                    core.slab.put(fork.bidn + b'merge:offs', s_msgpack.en(checkpoint), db='view:meta')
+
+                await core.callStorm('return($lib.view.get().setMergeVote())', opts={'user': visi.iden, 'view': fork.iden})
+                self.true(await fork.waitfini(timeout=12))
+                self.none(core.getView(fork.iden))
+
+            forkdef = await core.getView().fork()
+            fork = core.getView(forkdef['iden'])
+
+            q = 'for $x in $lib.range(25) {[ test:int=$x :loc=us +#foo <(refs)+ { [ test:str=$x ] } ] $node.data.set(woot, $x) }'
+            await core.nodes(q, opts={'view': fork.iden})
+
+            layr = core.getView().layers[0]
+
+            with mock.patch.object(s_view, 'MERGE_CHUNK_SIZE', 4):
+                with mock.patch.object(s_view, 'MERGE_CHECKPOINT_SIZE', 10):
+                    with mock.patch.object(layr, 'saveNodeEdits', wraps=layr.saveNodeEdits) as save:
+                        await mergeFork(fork)
+                        self.eq(13, save.call_count)
+                        self.true(all(len(c.args[0]) <= 4 for c in save.call_args_list))
+
+            nodes = await core.nodes('test:int#foo +:loc=us')
+            self.len(25, nodes)
+            self.eq(list(range(25)), sorted([await n.getData('woot') for n in nodes]))
+            self.eq(25, await core.count('test:int <(refs)- test:str'))
+
+            # resume a merge from a checkpoint
+            forkdef = await core.getView().fork()
+            fork = core.getView(forkdef['iden'])
+
+            await core.nodes('for $x in $lib.range(10) {[ test:int=($x + 100) ]}', opts={'view': fork.iden})
+
+            buids = sorted([n.buid for n in await core.nodes('test:int>=100', opts={'view': fork.iden})])
+            await mergeFork(fork, checkpoint=(buids[5], 5))
+
+            nodes = await core.nodes('test:int>=100')
+            self.sorteq(buids[5:], [n.buid for n in nodes])
+
+            # merging through the snap fires triggers in the parent view
+            await core.nodes('$lib.trigger.add(({"cond": "node:add", "form": "test:int", "storm": "[ +#trig ]"}))')
+
+            forkdef = await core.getView().fork()
+            fork = core.getView(forkdef['iden'])
+
+            await core.nodes('[ test:int=200 ]', opts={'view': fork.iden})
+            await mergeFork(fork)
+
+            self.len(1, await core.nodes('test:int=200 +#trig'))
+
+    async def test_view_merge_bulk_trigger(self):
+
+        async with self.getTestCore() as core:
+
+            visi = await core.auth.addUser('visi')
+            await visi.addRule((True, ('view', 'read')))
+
+            ninjas = await core.auth.addRole('ninjas')
+            await visi.grant(ninjas.iden)
+
+            opts = {'vars': {'role': ninjas.iden}}
+            await core.callStorm('return($lib.view.get().set(quorum, ({"count": 1, "roles": [$role]})))', opts=opts)
+
+            forkdef = await core.getView().fork()
+            fork = core.getView(forkdef['iden'])
+
+            await core.nodes('for $x in $lib.range(10) {[ test:int=$x ]}', opts={'view': fork.iden})
+
+            layr = core.getView().layers[0]
+            saveNodeEdits = layr.saveNodeEdits
+
+            # a trigger added to the parent view during the merge fires for the remaining chunks
+            async def addTrigger(edits, meta):
+                retn = await saveNodeEdits(edits, meta)
+                if not core.getView().triggers.triggers:
+                    await core.nodes('$lib.trigger.add(({"cond": "node:add", "form": "test:int", "storm": "[ +#trig ]"}))')
+                return retn
+
+            with mock.patch.object(s_view, 'MERGE_CHUNK_SIZE', 4):
+                with mock.patch.object(layr, 'saveNodeEdits', addTrigger):
+
+                    await core.callStorm('return($lib.view.get().setMergeRequest())', opts={'view': fork.iden})
+                    await core.callStorm('return($lib.view.get().setMergeVote())', opts={'user': visi.iden, 'view': fork.iden})
+                    self.true(await fork.waitfini(timeout=12))
+
+            self.len(10, await core.nodes('test:int'))
+            self.len(6, await core.nodes('test:int +#trig'))
@@ -20,6 +20,7 @@ import synapse.lib.coro as s_coro
 import synapse.lib.link as s_link
 import synapse.lib.const as s_const
 import synapse.lib.share as s_share
+import synapse.lib.msgpack as s_msgpack
 import synapse.lib.certdir as s_certdir
 import synapse.lib.version as s_version
 
@@ -130,6 +131,31 @@ class Foo:
     def boom(self):
         return Boom()
 
+    def countgenr(self, n):
+        yield from range(n)
+
+    async def acountgenr(self, n):
+        for i in range(n):
+            yield i
+
+    def readgenr(self, n):
+        for i in range(n):
+            self.readcount += 1
+            yield i
+
+    async def areadgenr(self, n):
+        for i in range(n):
+            self.readcount += 1
+            yield i
+
+    async def tailgenr(self):
+        self.tailevnt.clear()
+        yield 'init'
+        await self.tailevnt.wait()
+        self.tailevnt.clear()
+        yield 'fini'
+        await self.tailevnt.wait()
+
 
 class TeleApi:
 
@@ -282,6 +308,101 @@ class TeleTest(s_t_utils.SynTest):
         self.true(prox.isfini)
         await self.asyncraises(s_exc.IsFini, prox.bar((10, 20)))
 
+    async def test_telepath_genr_yields(self):
+
+        foo = Foo()
+        foo.tailevnt = asyncio.Event()
+
+        batches = []
+
+        genryields = s_daemon._genrYields
+        async def _genrYields(genr, window):
+            async for byts in genryields(genr, window):
+                batches.append(byts)
+                yield byts
+
+        async with self.getTestDmon() as dmon:
+
+            dmon.share('foo', foo)
+
+            async with await s_telepath.openurl('tcp://127.0.0.1/foo', port=dmon.addr[1]) as prox:
+
+                self.true(prox._hasTeleFeat('t2:yields'))
+
+                # batches of encoded items are sent without joining them
+                items = [s_msgpack.en(10), s_msgpack.en('x' * 300)]
+                mesg = s_msgpack.un(b''.join(s_daemon._t2yields(items)))
+                self.eq(mesg, ('t2:yields', {'byts': b''.join(items)}))
+
+                with mock.patch('synapse.daemon.T2_YIELDS_COUNT', 10):
+                    with mock.patch('synapse.daemon._genrYields', _genrYields):
+
+                        self.eq(list(range(105)), await prox.acountgenr(105).list())
+                        self.len(11, batches)
+
+                        self.eq(list(range(105)), await s_t_utils.alist(await prox.countgenr(105)))
+
+                        batches.clear()
+                        self.eq([], await prox.acountgenr(0).list())
+                        self.len(0, batches)
+
+                        # items yielded before an exception are still delivered
+                        items = []
+                        with self.raises(s_exc.SynErr):
+                            async for item in prox.agenrboom():
+                                items.append(item)
+                        self.eq(items, [10, 20])
+
+                        items = []
+                        with self.raises(s_exc.SynErr):
+                            async for item in await prox.genrboom():
+                                items.append(item)
+                        self.eq(items, [10, 20])
+
+                        # a waiting generator does not hold back available items
+                        with mock.patch('synapse.daemon.T2_YIELDS_WAIT', 30):
+                            genr = prox.tailgenr().__aiter__()
+                            self.eq('init', await asyncio.wait_for(genr.__anext__(), timeout=5))
+                            foo.tailevnt.set()
+                            self.eq('fini', await asyncio.wait_for(genr.__anext__(), timeout=5))
+                            foo.tailevnt.set()
+                            await self.asyncraises(StopAsyncIteration, genr.__anext__())
+
+                # items are not read further ahead of the consumer than the client window
+                with mock.patch('synapse.telepath.T2_YIELDS_WINDOW', 10):
+
+                    foo.readcount = 0
+                    genr = prox.areadgenr(100).__aiter__()
+                    self.eq(0, await genr.__anext__())
+                    await asyncio.sleep(0.1)
+                    self.eq(10, foo.readcount)
+                    self.eq(list(range(1, 100)), [x async for x in genr])
+
+                    foo.readcount = 0
+                    genr = (await prox.readgenr(100)).__aiter__()
+                    self.eq(0, await genr.__anext__())
+                    await asyncio.sleep(0.1)
+                    self.eq(10, foo.readcount)
+                    self.eq(list(range(1, 100)), [x async for x in genr])
+
+                # peers without the feature use one t2:yield per item
+                prox._features.pop('t2:yields')
+
+                batches.clear()
+                with mock.patch('synapse.daemon._genrYields', _genrYields):
+                    self.eq(list(range(105)), await prox.acountgenr(105).list())
+                    self.len(0, batches)
+
+            async with await s_telepath.openurl('tcp://127.0.0.1/foo', port=dmon.addr[1]) as prox:
+
+                # early termination of a batched generator
+                genr = prox.acountgenr(100000)
+                async for item in genr:
+                    if item == 2:
+                        break
+
+                self.eq((10, 20, 30), await (await prox.genr()).list())
+
     async def test_telepath_sync_genr(self):
 
         foo = Foo()
@@ -925,6 +1046,83 @@ class TeleTest(s_t_utils.SynTest):
         await dmon0.fini()
         await dmon1.fini()
 
+    async def test_telepath_pool_policy(self):
+
+        class Foo:
+            async def dostuff(self, x):
+                return x + 10
+
+        async with await s_daemon.Daemon.anit() as dmon0, await s_daemon.Daemon.anit() as dmon1:
+
+            addr0 = await dmon0.listen('tcp://127.0.0.1:0/')
+            addr1 = await dmon1.listen('tcp://127.0.0.1:0/')
+
+            dmon0.share('foo', Foo())
+            dmon1.share('foo', Foo())
+
+            url0 = f'tcp://127.0.0.1:{addr0[1]}/foo'
+            url1 = f'tcp://127.0.0.1:{addr1[1]}/foo'
+
+            async with await s_telepath.open(url0) as targ:
+
+                await targ.waitready(timeout=12)
+                prox0 = await targ.proxy(timeout=12)
+
+                prox1 = await s_telepath.openurl(url1)
+                await targ._onPoolLink(prox1, s_telepath.chopurl(url1))
+                self.eq(2, targ.size())
+
+                with self.raises(s_exc.BadArg):
+                    targ.setPoolPolicy('newp')
+
+                targ.setPoolPolicy('least')
+
+                with targ.track(prox0):
+                    self.true(await targ.proxy(timeout=12) is prox1)
+                    self.true(await targ.proxy(timeout=12) is prox1)
+                    self.true(await targ.proxy(timeout=12, exclude={prox1}) is prox0)
+
+                    with targ.track(prox1):
+                        with targ.track(prox1):
+                            self.true(await targ.proxy(timeout=12) is prox0)
+
+                stats = targ.getPoolStats()
+                self.eq('least', stats['policy'])
+                self.len(2, stats['members'])
+                self.eq(3, sum(m['count'] for m in stats['members']))
+
+                self.eq(0, targ.poolstats[prox0]['inflight'])
+                self.eq(1, targ.poolstats[prox0]['count'])
+                self.eq(2, targ.poolstats[prox1]['count'])
+                self.nn(targ.poolstats[prox0]['ewma'])
+
+                # ties are broken by the total number of calls
+                self.true(await targ.proxy(timeout=12) is prox0)
+
+                targ.setPoolPolicy('ewma')
+                targ.poolstats[prox0]['ewma'] = 100.0
+                targ.poolstats[prox1]['ewma'] = 10.0
+                self.true(await targ.proxy(timeout=12) is prox1)
+
+                targ.poolstats[prox1]['inflight'] = 20
+                self.true(await targ.proxy(timeout=12) is prox0)
+                targ.poolstats[prox1]['inflight'] = 0
+
+                targ.setPoolPolicy('lag')
+                targ.setPoolLag(prox0, 100)
+                targ.setPoolLag(prox1, 10)
+                self.true(await targ.proxy(timeout=12) is prox1)
+
+                targ.setPoolLag(prox1, 1000)
+                self.true(await targ.proxy(timeout=12) is prox0)
+
+                await prox1.fini()
+                self.none(targ.poolstats.get(prox1))
+                self.true(await targ.proxy(timeout=12) is prox0)
+
+                targ.setPoolPolicy('roundrobin')
+                self.eq(110, await (await targ.proxy(timeout=12)).dostuff(100))
+
     async def test_telepath_poolsize(self):
 
         # While test_telepath_sync_genr_break also touches the link pool,
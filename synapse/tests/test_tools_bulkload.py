@@ -0,0 +1,46 @@
+import os
+
+import synapse.common as s_common
+
+import synapse.lib.msgpack as s_msgpack
+import synapse.tools.bulkload as s_tools_bulkload
+
+import synapse.tests.utils as s_t_utils
+
+class BulkLoadToolTest(s_t_utils.SynTest):
+
+    async def test_tool_bulkload(self):
+
+        with self.getTestDir() as dirn:
+
+            path = os.path.join(dirn, 'nodeedits.mpk')
+            coredirn = s_common.gendir(dirn, 'core')
+
+            async with self.getTestCore() as core:
+                await core.nodes('[ inet:ipv4=1.2.3.4 :asn=10 +#foo ] [ inet:ipv4=5.6.7.8 ]')
+                with s_common.genfile(path) as fd:
+                    async for nodeedit in core.getLayer().iterLayerNodeEdits():
+                        fd.write(s_msgpack.en(nodeedit))
+
+            async with self.getTestCore(dirn=coredirn) as core:
+                layriden = (await core.addLayer()).get('iden')
+                viewiden = (await core.addView({'layers': (layriden,)})).get('iden')
+
+            outp = self.getTestOutp()
+            self.eq(0, await s_tools_bulkload.main(('--layer', layriden, coredirn, path), outp=outp))
+            outp.expect('Loaded 5 nodes')
+            outp.expect('Layer verification complete.')
+
+            async with self.getTestCore(dirn=coredirn) as core:
+                opts = {'view': viewiden}
+                self.len(2, await core.nodes('inet:ipv4', opts=opts))
+                self.len(1, await core.nodes('inet:ipv4:asn=10 +#foo', opts=opts))
+                self.len(1, await core.nodes('inet:asn=10', opts=opts))
+
+            outp = self.getTestOutp()
+            self.eq(1, await s_tools_bulkload.main((coredirn, path), outp=outp))
+            outp.expect('ERROR BadState: Bulk loading requires an empty layer')
+
+            outp = self.getTestOutp()
+            self.eq(1, await s_tools_bulkload.main(('--layer', 'newp', coredirn, path), outp=outp))
+            outp.expect('ERROR: No layer found with iden: newp')
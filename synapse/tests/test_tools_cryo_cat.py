@@ -5,6 +5,8 @@ import msgpack
 import unittest.mock as mock
 
 import synapse.exc as s_exc
+import synapse.cryotank as s_cryotank
+import synapse.telepath as s_telepath
 
 import synapse.lib.msgpack as s_msgpack
 import synapse.tests.utils as s_t_utils
@@ -105,3 +107,57 @@ class CryoCatTest(s_t_utils.SynTest):
             stdout.buffer.seek(0)
             outdata = list(msgpack.Unpacker(stdout.buffer, raw=False, use_list=False))
             self.eq(items, outdata)
+
+        async with self.getTestCryo() as cryo:
+
+            cryourl = cryo.getLocalUrl(share='cryotank/zipd')
+
+            items = [{'key': i} for i in range(2500)]
+
+            tank = await cryo.init('zipd', conf={'codec': 'zlib'})
+            await tank.puts(items)
+
+            argv = ['--offset', '999', '--size', '1002', '--jsonl', cryourl]
+            retn, outp = await self.execToolMain(s_cryocat.main, argv)
+            self.eq(0, retn)
+            self.true(outp.expect('{"key":999}\n{"key":1000}\n'))
+            self.true(outp.expect('{"key":2000}\n'))
+            self.false(outp.expect('{"key":2001}', throw=False))
+            self.false(outp.expect('{"key":998}', throw=False))
+
+            # remotes which do not expose blocks() are read using slice()
+            hasTeleMeth = s_telepath.Proxy._hasTeleMeth
+            def nohasblocks(self, name):
+                if name == 'blocks':
+                    return False
+                return hasTeleMeth(self, name)
+
+            with mock.patch.object(s_telepath.Proxy, '_hasTeleMeth', nohasblocks):
+
+                with mock.patch.object(s_cryotank.TankApi, 'blocks', side_effect=s_exc.SynErr()) as blocks:
+
+                    retn, outp = await self.execToolMain(s_cryocat.main, argv)
+                    self.eq(0, retn)
+                    self.true(outp.expect('{"key":999}\n{"key":1000}\n'))
+                    self.true(outp.expect('{"key":2000}\n'))
+                    self.false(outp.expect('{"key":2001}', throw=False))
+                    self.false(outp.expect('{"key":998}', throw=False))
+
+                    argv = ['--offset', '999', '--size', '2', cryourl]
+                    retn, outp = await self.execToolMain(s_cryocat.main, argv)
+                    self.eq(0, retn)
+                    self.true(outp.expect("(999, {'key': 999})\n(1000, {'key': 1000})"))
+
+                    stdout = mock.Mock()
+                    stdout.buffer = io.BytesIO()
+
+                    with mock.patch('sys.stdout', stdout):
+                        argv = ['--msgpack', '--offset', '999', '--size', '1002', cryourl]
+                        retn, _ = await self.execToolMain(s_cryocat.main, argv)
+                        self.eq(0, retn)
+
+                    stdout.buffer.seek(0)
+                    outdata = list(msgpack.Unpacker(stdout.buffer, raw=False, use_list=False))
+                    self.eq(items[999:2001], outdata)
+
+                    blocks.assert_not_called()
@@ -0,0 +1,79 @@
+import sys
+import asyncio
+import logging
+import argparse
+
+import synapse.exc as s_exc
+import synapse.cortex as s_cortex
+
+import synapse.lib.layer as s_layer
+import synapse.lib.output as s_output
+import synapse.lib.msgpack as s_msgpack
+
+logger = logging.getLogger(__name__)
+
+desc = '''
+Command line tool to bulk load node edits into an empty layer of a Cortex.
+
+The Cortex must not be running. Each file must contain msgpack encoded
+(buid, form, edits) tuples such as those yielded by iterLayerNodeEdits().
+
+The use pattern should be::
+
+    python -m synapse.tools.bulkload --layer <iden> /path/to/cortex nodeedits.mpk
+
+The tool will set the process exit code to 0 on success.
+'''
+
+def iterNodeEdits(paths):
+    for path in paths:
+        yield from s_msgpack.iterfile(path)
+
+async def main(argv, outp=s_output.stdout):
+
+    pars = argparse.ArgumentParser('synapse.tools.bulkload',
+                        description=desc,
+                        formatter_class=argparse.RawDescriptionHelpFormatter)
+
+    pars.add_argument('--layer', default=None,
+                      help='The iden of the layer to load (defaults to the layer of the default view).')
+    pars.add_argument('--runsize', type=int, default=s_layer.BULK_RUN_SIZE,
+                      help='The number of index rows per database to sort in memory before spooling to disk.')
+    pars.add_argument('dirn', help='The Cortex directory.')
+    pars.add_argument('files', nargs='+', help='Files of msgpack encoded node edits.')
+
+    opts = pars.parse_args(argv)
+
+    try:
+        async with await s_cortex.Cortex.anit(opts.dirn) as core:
+
+            layr = core.getLayer(opts.layer)
+            if layr is None:
+                outp.printf(f'ERROR: No layer found with iden: {opts.layer}')
+                return 1
+
+            outp.printf(f'Loading node edits into layer {layr.iden}...')
+
+            retn = await layr.bulkLoad(iterNodeEdits(opts.files), runsize=opts.runsize)
+
+            outp.printf(f'Loaded {retn["nodes"]} nodes ({retn["sodes"]} storage nodes).')
+            for db, count in retn['rows'].items():
+                outp.printf(f'    {db}: {count} rows')
+
+            errors = retn['errors']
+            if errors:
+                outp.printf(f'ERROR: Layer verification found {len(errors)} errors.')
+                for name, info in errors:
+                    outp.printf(f'    {name}: {info}')
+                return 1
+
+            outp.printf('Layer verification complete.')
+            return 0
+
+    except s_exc.SynErr as e:
+        mesg = e.errinfo.get('mesg')
+        outp.printf(f'ERROR {e.__class__.__name__}: {mesg}')
+        return 1
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(asyncio.run(main(sys.argv[1:])))
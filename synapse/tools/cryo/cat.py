@@ -4,6 +4,7 @@ import asyncio
 import argparse
 import logging
 
+import synapse.cryotank as s_cryotank
 import synapse.telepath as s_telepath
 
 import synapse.lib.json as s_json
@@ -54,16 +55,36 @@ async def main(argv, outp=s_output.stdout):
                 await tank.puts(items)
                 return 0
 
-            async for item in tank.slice(opts.offset, opts.size):
+            if not tank._hasTeleMeth('blocks'):
 
-                if opts.jsonl:
-                    outp.printf(s_json.dumps(item[1], sort_keys=True).decode())
+                async for indx, item in tank.slice(opts.offset, opts.size):
 
-                elif opts.msgpack:
-                    sys.stdout.buffer.write(s_msgpack.en(item[1]))
+                    if opts.jsonl:
+                        outp.printf(s_json.dumps(item, sort_keys=True).decode())
 
-                else:
-                    outp.printf(pprint.pformat(item))
+                    elif opts.msgpack:
+                        sys.stdout.buffer.write(s_msgpack.en(item))
+
+                    else:
+                        outp.printf(pprint.pformat((indx, item)))
+
+                return 0
+
+            async for offs, count, codec, byts in tank.blocks(opts.offset, size=opts.size):
+
+                for indx, rowbyts in enumerate(s_cryotank.decodeBlock(codec, byts), start=offs):
+
+                    if opts.msgpack:
+                        sys.stdout.buffer.write(rowbyts)
+                        continue
+
+                    item = s_msgpack.un(rowbyts)
+
+                    if opts.jsonl:
+                        outp.printf(s_json.dumps(item, sort_keys=True).decode())
+
+                    else:
+                        outp.printf(pprint.pformat((indx, item)))
     return 0
 
 if __name__ == '__main__':  # pragma: no cover